@@ -0,0 +1,89 @@
+"""Замер памяти, занимаемой объектами Book.
+
+Сравнивает прежнее представление книги (обычный объект с __dict__ и строковым
+статусом) с текущим классом Book, в том числе в режиме компактных ID.
+
+Запуск: python -m benchmarks.book_memory [количество книг]
+"""
+import sys
+import tracemalloc
+import uuid
+from typing import Callable, Iterator
+
+from library_manager.book import Book
+
+
+class DictBook:
+    def __init__(self, title: str, author: str, year: int, status: str, id: str) -> None:
+        """Книга в прежнем представлении: атрибуты хранятся в __dict__.
+
+        :param title: Название книги.
+        :param author: Автор книги.
+        :param year: Год издания книги.
+        :param status: Статус книги.
+        :param id: Уникальный идентификатор книги.
+        """
+        self.id = id
+        self.title = title
+        self.author = author
+        self.year = year
+        self.status = status
+
+
+def iter_records(count: int) -> Iterator[tuple]:
+    """Генерирует исходные данные так, как они приходят из JSON.
+
+    Каждая строка создаётся заново, как при разборе файла, поэтому одинаковые
+    имена авторов и статусы не разделяют память, пока их не интернирует Book.
+
+    :param count: Количество записей.
+    :return: Генератор кортежей (название, автор, год, статус, id).
+    """
+    statuses = ["в наличии", "выдана"]
+    for i in range(count):
+        yield (
+            f"Книга {i}",
+            "".join(["Лев ", "Толстой"]),
+            1800 + i % 230,
+            "".join(statuses[i % 2]),
+            str(uuid.uuid4()),
+        )
+
+
+def measure(factory: Callable[..., object], count: int) -> int:
+    """Возвращает объём памяти, который остаётся занят созданными книгами.
+
+    :param factory: Конструктор объекта книги.
+    :param count: Количество книг.
+    :return: Количество байт.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(*record) for record in iter_records(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def main() -> None:
+    """Печатает расход памяти на одну книгу для каждого представления."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    results = {"dict": measure(DictBook, count), "slots": measure(Book, count)}
+    Book.compact_ids = True
+    try:
+        results["slots + compact ids"] = measure(Book, count)
+    finally:
+        Book.compact_ids = False
+
+    baseline = results["dict"] / count
+    for name, total in results.items():
+        per_book = total / count
+        print(
+            f"{name:>20}: {per_book:7.1f} байт на книгу "
+            f"(экономия {baseline - per_book:6.1f} байт)"
+        )
+
+
+if __name__ == "__main__":
+    main()
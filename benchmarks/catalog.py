@@ -0,0 +1,78 @@
+"""Генератор синтетического каталога книг для бенчмарков."""
+import random
+import uuid
+from typing import Iterator, List
+
+from library_manager.book import STATUSES, Book
+from library_manager.storage import save_books
+
+FIRST_NAMES = [
+    "Александр", "Лев", "Фёдор", "Антон", "Николай", "Иван", "Михаил", "Анна",
+    "Марина", "Борис", "Сергей", "Владимир", "Евгений", "Ольга", "Татьяна",
+    "Максим", "Константин", "Дмитрий", "Алексей", "Людмила",
+]
+LAST_NAMES = [
+    "Пушкин", "Толстой", "Достоевский", "Чехов", "Гоголь", "Тургенев",
+    "Булгаков", "Ахматова", "Цветаева", "Пастернак", "Есенин", "Маяковский",
+    "Замятин", "Горький", "Паустовский", "Шолохов", "Бунин", "Куприн",
+    "Лермонтов", "Улицкая", "Набоков", "Гончаров", "Лесков", "Платонов",
+]
+TITLE_WORDS = [
+    "война", "мир", "преступление", "наказание", "идиот", "бесы", "отцы", "дети",
+    "мёртвые", "души", "мастер", "маргарита", "тихий", "дон", "белая", "гвардия",
+    "дворянское", "гнездо", "обломов", "вишнёвый", "сад", "чайка", "герой",
+    "нашего", "времени", "капитанская", "дочка", "евгений", "онегин", "доктор",
+    "живаго", "собачье", "сердце", "золотой", "телёнок", "двенадцать", "стульев",
+    "тёмные", "аллеи", "поединок", "котлован", "очарованный", "странник",
+]
+
+
+def random_year(rng: random.Random) -> int:
+    """Возвращает год издания, смещённый к современности.
+
+    :param rng: Генератор случайных чисел.
+    :return: Год в диапазоне от 1800 до 2030.
+    """
+    return min(2030, 1800 + int(230 * rng.betavariate(5, 1.5)))
+
+
+def random_title(rng: random.Random) -> str:
+    """Составляет название книги из двух-четырёх слов.
+
+    :param rng: Генератор случайных чисел.
+    :return: Название книги.
+    """
+    words = rng.sample(TITLE_WORDS, rng.randint(2, 4))
+    return " ".join(words).capitalize()
+
+
+def generate_books(count: int, seed: int = 0) -> Iterator[Book]:
+    """Генерирует воспроизводимый каталог с уникальными парами (название, автор).
+
+    :param count: Количество книг.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Итератор книг.
+    """
+    rng = random.Random(seed)
+    authors = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+    for number in range(count):
+        yield Book(
+            f"{random_title(rng)} {number}",
+            rng.choice(authors),
+            random_year(rng),
+            STATUSES[rng.random() < 0.3],
+            id=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        )
+
+
+def write_catalog(path: str, count: int, seed: int = 0) -> List[Book]:
+    """Генерирует каталог и сохраняет его в JSON-файл.
+
+    :param path: Путь к файлу.
+    :param count: Количество книг.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Список сгенерированных книг.
+    """
+    books = list(generate_books(count, seed))
+    save_books(books, path)
+    return books
@@ -0,0 +1,216 @@
+"""Нагрузочный тест HTTP-сервера библиотеки.
+
+Запускает сервер на свободном порту с синтетическим каталогом (или обращается к
+уже запущенному по --url) и в нескольких потоках выполняет смесь запросов:
+поиск, чтение книги по ID и смену статуса. Выводит количество запросов в
+секунду и перцентили задержки.
+
+Запуск:
+    python -m benchmarks.load_test --books 100000 --clients 8 --duration 10
+    python -m benchmarks.load_test --url http://127.0.0.1:8080 --clients 8
+"""
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from benchmarks.catalog import write_catalog
+from benchmarks.run import make_queries, summarize
+from library_manager.manager import MIN_QUERY_LENGTH, LibraryManager
+from library_manager.server import MAX_PAGE_SIZE, LibraryHTTPServer
+
+# Доли запросов в смеси: остальное — поиск.
+GET_SHARE = 0.3
+STATUS_SHARE = 0.05
+
+
+def run_client(
+    host: str,
+    port: int,
+    queries: List[str],
+    ids: List[str],
+    deadline: float,
+    seed: int,
+    latencies: List[float],
+    errors: List[int],
+) -> None:
+    """Выполняет запросы по одному соединению до истечения времени.
+
+    :param host: Адрес сервера.
+    :param port: Порт сервера.
+    :param queries: Поисковые запросы.
+    :param ids: ID книг для чтения и смены статуса.
+    :param deadline: Момент окончания теста по time.perf_counter().
+    :param seed: Начальное значение генератора случайных чисел.
+    :param latencies: Список, в который добавляется время каждого запроса.
+    :param errors: Список, в который добавляются коды неуспешных ответов.
+    :return: None
+    """
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            choice = rng.random()
+            body = None
+            if choice < STATUS_SHARE:
+                method = "PUT"
+                path = f"/books/{rng.choice(ids)}/status"
+                status = rng.choice(["выдана", "в наличии"])
+                body = json.dumps({"status": status}).encode("utf-8")
+            elif choice < STATUS_SHARE + GET_SHARE:
+                method, path = "GET", f"/books/{rng.choice(ids)}"
+            else:
+                method, path = "GET", f"/books?q={quote(rng.choice(queries))}&limit=20"
+            started = time.perf_counter()
+            connection.request(method, path, body=body)
+            response = connection.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - started)
+            if response.status >= 400:
+                errors.append(response.status)
+    finally:
+        connection.close()
+
+
+def load_test(
+    host: str,
+    port: int,
+    ids: List[str],
+    queries: List[str],
+    clients: int,
+    duration: float,
+) -> Dict[str, Any]:
+    """Нагружает сервер из нескольких потоков и сводит результаты.
+
+    :param host: Адрес сервера.
+    :param port: Порт сервера.
+    :param ids: ID книг каталога.
+    :param queries: Поисковые запросы.
+    :param clients: Количество одновременных клиентов.
+    :param duration: Длительность теста в секундах.
+    :return: Сводка: запросы в секунду, перцентили задержки и число ошибок.
+    """
+    per_client: List[List[float]] = [[] for _ in range(clients)]
+    errors: List[int] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    threads = [
+        threading.Thread(
+            target=run_client,
+            args=(host, port, queries, ids, deadline, seed, per_client[seed], errors),
+        )
+        for seed in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    latencies = [latency for client in per_client for latency in client]
+    result = summarize(latencies) if latencies else {"count": 0}
+    result["requests_per_sec"] = len(latencies) / elapsed
+    result["errors"] = len(errors)
+    return result
+
+
+def fetch_sample(host: str, port: int, count: int) -> List[Dict[str, Any]]:
+    """Получает с запущенного сервера книги для построения запросов.
+
+    Книги запрашиваются страницами по `MAX_PAGE_SIZE`.
+
+    :param host: Адрес сервера.
+    :param port: Порт сервера.
+    :param count: Сколько книг запросить.
+    :return: Список книг в виде словарей.
+    """
+    books: List[Dict[str, Any]] = []
+    connection = http.client.HTTPConnection(host, port)
+    try:
+        while len(books) < count:
+            limit = min(MAX_PAGE_SIZE, count - len(books))
+            connection.request("GET", f"/books?limit={limit}&offset={len(books)}")
+            page = json.loads(connection.getresponse().read())["books"]
+            books.extend(page)
+            if len(page) < limit:
+                break
+    finally:
+        connection.close()
+    return books
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Запуск нагрузочного теста из командной строки.
+
+    :param argv: Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Нагрузочный тест HTTP-сервера.")
+    parser.add_argument(
+        "--url", help="Адрес запущенного сервера; без него сервер запускается здесь"
+    )
+    parser.add_argument("--books", type=int, default=10_000, help="Размер каталога")
+    parser.add_argument("--clients", type=int, default=8, help="Одновременных клиентов")
+    parser.add_argument("--duration", type=float, default=5.0, help="Секунд нагрузки")
+    parser.add_argument("--workers", type=int, default=16, help="Потоков сервера")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    server: Optional[LibraryHTTPServer] = None
+    with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(
+        io.StringIO()
+    ):
+        if args.url:
+            address: Tuple[str, int] = (
+                urlsplit(args.url).hostname or "127.0.0.1",
+                urlsplit(args.url).port or 80,
+            )
+            books: List[Any] = [
+                argparse.Namespace(**book)
+                for book in fetch_sample(*address, args.books)
+            ]
+        else:
+            storage_file = os.path.join(directory, "books.json")
+            books = write_catalog(storage_file, args.books, args.seed)
+            manager = LibraryManager(storage_file)
+            server = LibraryHTTPServer(manager, ("127.0.0.1", 0), args.workers)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            address = ("127.0.0.1", server.server_port)
+        try:
+            result = load_test(
+                *address,
+                [book.id for book in books],
+                [
+                    query
+                    for query in make_queries(books, 200, rng)
+                    if len(query) >= MIN_QUERY_LENGTH
+                ],
+                args.clients,
+                args.duration,
+            )
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+                manager.close()
+
+    print(
+        f"Запросов: {result['count']}, {result['requests_per_sec']:.1f} запр/с, "
+        f"ошибок: {result['errors']}"
+    )
+    if result["count"]:
+        print(
+            f"Задержка: p50 {result['p50_ms']:.2f} мс, p90 {result['p90_ms']:.2f} мс, "
+            f"p99 {result['p99_ms']:.2f} мс"
+        )
+
+
+if __name__ == "__main__":
+    main()
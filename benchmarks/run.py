@@ -0,0 +1,316 @@
+"""Бенчмарк LibraryManager и хранилища на каталогах разного размера.
+
+Для каждого размера каталога генерирует синтетические данные, замеряет загрузку
+и сохранение, поиск и изменяющие операции и сохраняет результаты в JSON, чтобы
+их можно было сравнить между коммитами.
+
+Запуск:
+    python -m benchmarks.run --sizes 1000,100000 --output bench.json
+    python -m benchmarks.run --sizes 1000 --compare bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.catalog import generate_books, write_catalog
+from library_manager.manager import LibraryManager
+from library_manager.parallel import PARALLEL_MIN_BOOKS, ParallelSearch
+from library_manager.storage import load_books, save_books
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+STORAGE_EXTENSIONS = {
+    "json": ".json",
+    "journal": ".json",
+    "sqlite": ".db",
+    "snapshot": ".snap",
+    "sharded": "",
+}
+STORAGE_PREFIXES = {"sharded": "shards://"}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Возвращает перцентиль по методу ближайшего ранга.
+
+    :param values: Отсортированный список значений.
+    :param fraction: Доля от 0 до 1.
+    :return: Значение перцентиля.
+    """
+    index = min(len(values) - 1, max(0, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Сводит замеры одной операции в перцентили и пропускную способность.
+
+    :param latencies: Время выполнения каждого вызова в секундах.
+    :return: Словарь с количеством вызовов, перцентилями (мс) и операциями в секунду.
+    """
+    ordered = sorted(latencies)
+    total = sum(ordered)
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p90_ms": percentile(ordered, 0.90) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "ops_per_sec": len(ordered) / total if total else 0.0,
+    }
+
+
+def time_calls(calls: List[Callable[[], Any]]) -> Dict[str, float]:
+    """Последовательно выполняет вызовы и замеряет время каждого.
+
+    Сообщения, которые печатает LibraryManager, подавляются.
+
+    :param calls: Список функций без аргументов.
+    :return: Сводка замеров.
+    """
+    latencies = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for call in calls:
+            started = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - started)
+    return summarize(latencies)
+
+
+def peak_memory(call: Callable[[], Any]) -> int:
+    """Возвращает пиковый объём памяти, выделенной во время вызова.
+
+    :param call: Функция без аргументов.
+    :return: Количество байт.
+    """
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            call()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def make_queries(books: List[Any], count: int, rng: random.Random) -> List[str]:
+    """Готовит набор поисковых запросов: фрагменты авторов, названий и годы.
+
+    :param books: Книги каталога.
+    :param count: Количество запросов.
+    :param rng: Генератор случайных чисел.
+    :return: Список запросов.
+    """
+    queries = []
+    for number in range(count):
+        book = rng.choice(books)
+        kind = number % 3
+        if kind == 0:
+            queries.append(book.author.split()[-1][:5])
+        elif kind == 1:
+            queries.append(book.title.split()[0].lower())
+        else:
+            queries.append(str(book.year)[:3])
+    return queries
+
+
+def bench_size(
+    size: int, ops: int, queries: int, mode: str, directory: str, seed: int
+) -> Dict[str, Any]:
+    """Выполняет все замеры для каталога одного размера.
+
+    :param size: Количество книг в каталоге.
+    :param ops: Количество вызовов каждой изменяющей операции.
+    :param queries: Количество поисковых запросов.
+    :param mode: Режим хранения: json, journal, sqlite, snapshot или sharded.
+    :param directory: Каталог для временных файлов.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Результаты замеров.
+    """
+    rng = random.Random(seed)
+    json_file = os.path.join(directory, f"books-{size}.json")
+    books = write_catalog(json_file, size, seed)
+    result: Dict[str, Any] = {"size": size, "mode": mode}
+
+    result["load_books"] = time_calls([lambda: load_books(json_file)] * 3)
+    result["load_books"]["peak_memory_bytes"] = peak_memory(
+        lambda: load_books(json_file)
+    )
+    result["save_books"] = time_calls([lambda: save_books(books, json_file)] * 3)
+    result["save_books"]["peak_memory_bytes"] = peak_memory(
+        lambda: save_books(books, json_file)
+    )
+
+    storage_file = STORAGE_PREFIXES.get(mode, "") + os.path.join(
+        directory, f"manager-{size}{STORAGE_EXTENSIONS[mode]}"
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = LibraryManager(storage_file, journal=mode == "journal")
+        manager.books = books
+        manager.compact()
+
+    def open_manager() -> None:
+        LibraryManager(storage_file, journal=mode == "journal").close()
+
+    result["open_manager"] = time_calls([open_manager] * 3)
+    lazy = LibraryManager(storage_file, journal=mode == "journal", lazy=True)
+    result["lazy_get_book"] = time_calls(
+        [lambda book=book: lazy.get_book(book.id) for book in rng.sample(books, ops)]
+    )
+    lazy.close()
+
+    # Поиск замеряется без кэша результатов: запросы в наборе повторяются.
+    query_cache, manager.query_cache = manager.query_cache, None
+    search_queries = make_queries(books, queries, rng)
+    result["find_books"] = time_calls(
+        [lambda query=query: manager.find_books(query) for query in search_queries]
+    )
+    if size >= PARALLEL_MIN_BOOKS:
+        with ParallelSearch() as search:
+            search.build(manager.books)
+            result["find_books_parallel"] = time_calls(
+                [lambda query=query: search.find(query) for query in search_queries]
+            )
+    # Запросы с опечаткой: из каждого выпадает одна буква.
+    typos = [
+        query[: len(query) // 2] + query[len(query) // 2 + 1:]
+        for query in make_queries(books, queries, rng)
+    ]
+    result["find_books_fuzzy"] = time_calls(
+        [lambda query=query: manager.find_books_fuzzy(query) for query in typos]
+    )
+    manager.query_cache = query_cache
+    for query in search_queries:
+        manager.find_books(query)
+    result["find_books_cached"] = time_calls(
+        [lambda query=query: manager.find_books(query) for query in search_queries]
+    )
+    authors = [rng.choice(books).author for _ in range(queries)]
+    result["find_by_author"] = time_calls(
+        [lambda author=author: manager.find_by_author(author) for author in authors]
+    )
+    years = [rng.randint(1800, 2020) for _ in range(queries)]
+    result["find_by_year_range"] = time_calls(
+        [lambda year=year: manager.find_by_year_range(year, year + 10) for year in years]
+    )
+    new_books = list(generate_books(ops, seed + 1))
+    result["add_book"] = time_calls(
+        [
+            lambda book=book: manager.add_book(book.title, book.author, book.year)
+            for book in new_books
+        ]
+    )
+    targets = rng.sample(books, min(ops * 2, len(books)))
+    result["update_book_status"] = time_calls(
+        [
+            lambda book=book: manager.update_book_status(
+                book.id, "выдана" if book.status == "в наличии" else "в наличии"
+            )
+            for book in targets[:ops]
+        ]
+    )
+    result["remove_book"] = time_calls(
+        [lambda book=book: manager.remove_book(book.id) for book in targets[ops:]]
+    )
+    manager.close()
+    return result
+
+
+def git_revision() -> Optional[str]:
+    """Возвращает хеш текущего коммита, если он доступен.
+
+    :return: Хеш коммита или None.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    """Печатает таблицу результатов, при наличии — с отношением к базовому замеру.
+
+    :param results: Результаты текущего запуска.
+    :param baseline: Результаты базового запуска или None.
+    """
+    previous = {}
+    if baseline:
+        previous = {run["size"]: run for run in baseline["runs"]}
+    for run in results["runs"]:
+        print(f"\nКаталог: {run['size']} книг, хранилище: {run['mode']}")
+        for operation, stats in run.items():
+            if not isinstance(stats, dict):
+                continue
+            line = (
+                f"  {operation:<20} p50 {stats['p50_ms']:10.3f} мс  "
+                f"p99 {stats['p99_ms']:10.3f} мс  {stats['ops_per_sec']:12.1f} оп/с"
+            )
+            if "peak_memory_bytes" in stats:
+                line += f"  пик {stats['peak_memory_bytes'] / 2 ** 20:8.1f} МБ"
+            old = previous.get(run["size"], {}).get(operation)
+            if old and old["p50_ms"]:
+                line += f"  x{stats['p50_ms'] / old['p50_ms']:.2f} к базе"
+            print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Запускает бенчмарк из командной строки.
+
+    :param argv: Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарк LibraryManager.")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Размеры каталога через запятую",
+    )
+    parser.add_argument("--ops", type=int, default=20, help="Вызовов каждой операции")
+    parser.add_argument("--queries", type=int, default=200, help="Поисковых запросов")
+    parser.add_argument(
+        "--mode", choices=sorted(STORAGE_EXTENSIONS), default="json", help="Хранилище"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Файл для сохранения результатов в JSON")
+    parser.add_argument("--compare", help="Файл с результатами для сравнения")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Any] = {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "runs": [],
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(value) for value in args.sizes.split(",")):
+            results["runs"].append(
+                bench_size(size, args.ops, args.queries, args.mode, directory, args.seed)
+            )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=4)
+        print(f"\nРезультаты сохранены в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
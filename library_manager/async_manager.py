@@ -0,0 +1,241 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from library_manager.book import Book
+from library_manager.manager import ImportResult, LibraryManager
+
+T = TypeVar("T")
+
+DURABILITY_MODES = ("always", "periodic")
+
+
+class AsyncLibraryManager:
+    def __init__(
+        self,
+        storage_file: str = "data/books.json",
+        flush_interval: float = 1.0,
+        durability: str = "periodic",
+        **options: Any,
+    ) -> None:
+        """Асинхронная обёртка над LibraryManager с отложенной записью на диск.
+
+        Все операции выполняются над одним LibraryManager в отдельном потоке,
+        поэтому их семантика совпадает с синхронной версией, а цикл событий не
+        блокируется на вводе-выводе. Изменения накапливаются в очереди и
+        записываются одним сохранением: при durability='always' — после каждой
+        операции, при durability='periodic' — раз в `flush_interval` секунд и при
+        закрытии.
+
+        Пример::
+
+            async with AsyncLibraryManager("data/books.json") as manager:
+                book = await manager.add_book("Мы", "Евгений Замятин", 1920)
+
+        :param storage_file: Путь к файлу или адрес хранилища.
+        :param flush_interval: Период записи изменений в секундах.
+        :param durability: 'always' или 'periodic'.
+        :param options: Дополнительные параметры LibraryManager.
+        :raises ValueError: Если режим durability неизвестен.
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                "Режим durability может быть только 'always' или 'periodic'."
+            )
+        self.storage_file = storage_file
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self._options = options
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="library-manager"
+        )
+        self._manager: Optional[LibraryManager] = None
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+
+    async def __aenter__(self) -> "AsyncLibraryManager":
+        """Открывает менеджер при входе в блок `async with`.
+
+        :return: Открытый менеджер.
+        """
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Записывает изменения и закрывает менеджер при выходе из блока."""
+        await self.close()
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Выполняет функцию в потоке менеджера.
+
+        :param func: Функция.
+        :param args: Аргументы функции.
+        :return: Результат функции.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _mutate(self, func: Callable[..., T], *args: Any) -> T:
+        """Выполняет изменяющую операцию с учётом режима durability.
+
+        :param func: Метод LibraryManager.
+        :param args: Аргументы метода.
+        :return: Результат метода.
+        """
+
+        def call() -> T:
+            result = func(*args)
+            if self.durability == "always":
+                self.manager.flush()
+            return result
+
+        return await self._run(call)
+
+    @property
+    def manager(self) -> LibraryManager:
+        """Синхронный менеджер, с которым работает обёртка.
+
+        :return: Объект LibraryManager.
+        :raises RuntimeError: Если менеджер ещё не открыт.
+        """
+        if self._manager is None:
+            raise RuntimeError("Менеджер не открыт: вызовите open().")
+        return self._manager
+
+    async def open(self) -> None:
+        """Загружает каталог и запускает периодическую запись изменений.
+
+        :return: None
+        """
+        self._manager = await self._run(
+            lambda: LibraryManager(self.storage_file, write_behind=True, **self._options)
+        )
+        if self.durability == "periodic":
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        """Раз в `flush_interval` секунд записывает накопленные изменения.
+
+        Ошибка записи не останавливает цикл: изменения остаются в очереди и
+        будут записаны при следующей попытке.
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Ошибка при сохранении данных: {e}")
+
+    async def flush(self) -> None:
+        """Немедленно записывает накопленные изменения.
+
+        :return: None
+        """
+        await self._run(self.manager.flush)
+
+    async def close(self) -> None:
+        """Закрывает менеджер.
+
+        Останавливает периодическую запись, записывает изменения и закрывает
+        хранилище.
+
+        :return: None
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._manager is not None:
+            await self._run(self._manager.close)
+            self._manager = None
+        self._executor.shutdown(wait=True)
+
+    async def get_book(self, book_id: str) -> Optional[Book]:
+        """Асинхронный аналог `LibraryManager.get_book`.
+
+        :param book_id: Идентификатор книги.
+        :return: Книга или None.
+        """
+        return await self._run(self.manager.get_book, book_id)
+
+    async def find_books(
+        self, query: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Book]:
+        """Асинхронный аналог `LibraryManager.find_books`.
+
+        :param query: Строка для поиска.
+        :param limit: Максимальное количество книг; None — без ограничения.
+        :param offset: Сколько найденных книг пропустить с начала.
+        :return: Список найденных книг.
+        """
+        return await self._run(self.manager.find_books, query, limit, offset)
+
+    async def find_books_fuzzy(self, query: str, limit: int = 10) -> List[Book]:
+        """Асинхронный аналог `LibraryManager.find_books_fuzzy`.
+
+        :param query: Строка для поиска.
+        :param limit: Максимальное количество книг.
+        :return: Список книг по убыванию сходства.
+        """
+        return await self._run(self.manager.find_books_fuzzy, query, limit)
+
+    async def find_by_author(self, author: str) -> List[Book]:
+        """Асинхронный аналог `LibraryManager.find_by_author`.
+
+        :param author: Имя автора.
+        :return: Список книг автора.
+        """
+        return await self._run(self.manager.find_by_author, author)
+
+    async def count_books(self, query: Optional[str] = None) -> int:
+        """Асинхронный аналог `LibraryManager.count_books`.
+
+        :param query: Строка для поиска; None — все книги каталога.
+        :return: Количество книг.
+        """
+        return await self._run(self.manager.count_books, query)
+
+    async def add_book(self, title: str, author: str, year: int) -> Optional[Book]:
+        """Асинхронный аналог `LibraryManager.add_book`.
+
+        :param title: Название книги.
+        :param author: Автор книги.
+        :param year: Год издания книги.
+        :return: Добавленная книга или None, если такая книга уже есть.
+        """
+        return await self._mutate(self.manager.add_book, title, author, year)
+
+    async def add_books(self, records: Iterable[Any]) -> ImportResult:
+        """Асинхронный аналог `LibraryManager.add_books`.
+
+        :param records: Записи с полями title, author и year.
+        :return: Отчёт об импорте.
+        """
+        return await self._mutate(self.manager.add_books, records)
+
+    async def remove_book(self, book_id: str) -> bool:
+        """Асинхронный аналог `LibraryManager.remove_book`.
+
+        :param book_id: Идентификатор книги.
+        :return: True, если книга была удалена.
+        """
+        return await self._mutate(self.manager.remove_book, book_id)
+
+    async def update_book_status(self, book_id: str, new_status: str) -> bool:
+        """Асинхронный аналог `LibraryManager.update_book_status`.
+
+        :param book_id: Идентификатор книги.
+        :param new_status: Новый статус книги.
+        :return: True, если книга найдена и статус установлен.
+        """
+        return await self._mutate(self.manager.update_book_status, book_id, new_status)
+
+    async def update_statuses(self, statuses: Dict[str, str]) -> int:
+        """Асинхронный аналог `LibraryManager.update_statuses`.
+
+        :param statuses: Словарь {ID книги: новый статус}.
+        :return: Количество книг, статус которых изменился.
+        """
+        return await self._mutate(self.manager.update_statuses, statuses)
@@ -0,0 +1,162 @@
+"""Пакетный режим: выполнение потока команд без диалога с пользователем.
+
+Команды читаются построчно из файла или стандартного ввода. Строка — это либо
+JSON-объект с полем op, либо подкоманда с аргументами через пробел (аргументы с
+пробелами заключаются в кавычки). Пустые строки и строки, начинающиеся с #,
+пропускаются:
+
+    add "Война и мир" "Лев Толстой" 1869
+    find толстой
+    set-status 0b6e... выдана
+    {"op": "remove", "id": "0b6e..."}
+    {"op": "find", "query": "толстой", "limit": 10}
+
+Все команды выполняются в одном блоке `batch()`, поэтому изменения записываются
+в хранилище один раз в конце. На каждую команду в вывод пишется одна строка
+JSON с полями line, op, ok и результатом (book, books) или текстом ошибки.
+
+Запуск: python main.py --batch commands.txt (или --batch - для stdin)
+"""
+import contextlib
+import json
+import shlex
+import sys
+from typing import IO, Any, Dict, Iterable, Optional, Tuple
+
+from library_manager.book import STATUSES
+from library_manager.manager import LibraryManager, parse_book_record
+
+# Аргументы подкоманд в порядке их записи в строке.
+COMMAND_ARGUMENTS = {
+    "add": ("title", "author", "year"),
+    "remove": ("id",),
+    "get": ("id",),
+    "find": ("query",),
+    "set-status": ("id", "status"),
+}
+
+
+def parse_command(line: str) -> Optional[Dict[str, Any]]:
+    """Разбирает строку потока команд.
+
+    :param line: Строка: JSON-объект или подкоманда с аргументами.
+    :return: Команда в виде словаря с полем op или None для пустой строки и
+    комментария.
+    :raises ValueError: Если строку не удалось разобрать.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        command = json.loads(line)
+        if not isinstance(command, dict):
+            raise ValueError("Команда в формате JSON должна быть объектом.")
+        return command
+    words = shlex.split(line)
+    operation, arguments = words[0], words[1:]
+    names = COMMAND_ARGUMENTS.get(operation)
+    if names is None:
+        raise ValueError(f"Неизвестная команда: {operation}.")
+    if len(arguments) != len(names):
+        raise ValueError(f"Команда {operation} ожидает аргументы: {', '.join(names)}.")
+    return dict(zip(names, arguments), op=operation)
+
+
+def execute_command(manager: LibraryManager, command: Dict[str, Any]) -> Dict[str, Any]:
+    """Выполняет одну команду.
+
+    :param manager: Менеджер библиотеки.
+    :param command: Команда с полем op и аргументами.
+    :return: Результат команды: книга (book) или список книг (books).
+    :raises ValueError: Если аргументы команды некорректны.
+    :raises TypeError: Если у аргумента в JSON неподходящий тип.
+    :raises KeyError: Если книга с указанным ID не найдена.
+    """
+    operation = command.get("op")
+    if operation == "add":
+        title, author, year = parse_book_record(command)
+        book = manager.add_book(title, author, year)
+        if book is None:
+            raise ValueError(f"Книга '{title}' авторства '{author}' уже есть.")
+        return {"book": book.to_dict()}
+    if operation == "find":
+        limit = command.get("limit")
+        books = manager.find_books(
+            str(command.get("query", "")),
+            None if limit is None else int(limit),
+            int(command.get("offset", 0)),
+        )
+        return {"books": [book.to_dict() for book in books]}
+    if operation not in COMMAND_ARGUMENTS:
+        raise ValueError(f"Неизвестная команда: {operation}.")
+
+    book_id = str(command.get("id", ""))
+    book = manager.get_book(book_id)
+    if book is None:
+        raise KeyError(f"Книга с ID {book_id} не найдена.")
+    if operation == "remove":
+        manager.remove_book(book_id)
+    elif operation == "set-status":
+        status = command.get("status")
+        if status not in STATUSES:
+            raise ValueError(f"Статус должен быть одним из: {', '.join(STATUSES)}.")
+        manager.update_book_status(book_id, status)
+    return {"book": book.to_dict()}
+
+
+def run_batch(
+    manager: LibraryManager, lines: Iterable[str], output: IO[str]
+) -> Tuple[int, int]:
+    """Выполняет поток команд с однократным сохранением изменений.
+
+    Ошибка в команде не прерывает выполнение остальных: она попадает в
+    результат этой команды. Сообщения менеджера выводятся в stderr, чтобы
+    в `output` были только результаты в формате JSON.
+
+    :param manager: Менеджер библиотеки.
+    :param lines: Строки потока команд.
+    :param output: Поток для результатов, по одной строке JSON на команду.
+    :return: Кортеж (выполнено команд, из них с ошибкой).
+    """
+    executed = failed = 0
+    with contextlib.redirect_stdout(sys.stderr), manager.batch():
+        for number, line in enumerate(lines, start=1):
+            result: Dict[str, Any] = {"line": number}
+            try:
+                command = parse_command(line)
+                if command is None:
+                    continue
+                result["op"] = command.get("op")
+                result["ok"] = True
+                result.update(execute_command(manager, command))
+            except (ValueError, TypeError, KeyError) as e:
+                result["ok"] = False
+                result["error"] = str(e.args[0]) if e.args else str(e)
+                failed += 1
+            executed += 1
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+    return executed, failed
+
+
+def run_batch_file(storage_file: str, path: str) -> int:
+    """Выполняет команды из файла или, если путь равен '-', из stdin.
+
+    Результаты выводятся в stdout, все остальные сообщения — в stderr.
+
+    :param storage_file: Путь к файлу или адрес хранилища.
+    :param path: Путь к файлу команд или '-'.
+    :return: Количество команд с ошибкой.
+    """
+    output = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        manager = LibraryManager(storage_file)
+        try:
+            if path == "-":
+                executed, failed = run_batch(manager, sys.stdin, output)
+            else:
+                with open(path, encoding="utf-8") as file:
+                    executed, failed = run_batch(manager, file, output)
+        finally:
+            manager.close()
+        print(f"Выполнено команд: {executed}, с ошибкой: {failed}.")
+    return failed
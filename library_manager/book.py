@@ -1,14 +1,39 @@
+import sys
 import uuid
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+STATUS_AVAILABLE = "в наличии"
+STATUS_ISSUED = "выдана"
+# Допустимые статусы; в объекте книги хранится индекс статуса в этом кортеже.
+STATUSES = (STATUS_AVAILABLE, STATUS_ISSUED)
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+def normalize_title_author(title: str, author: str) -> Tuple[str, str]:
+    """Приводит название и автора к ключу для проверки дубликатов.
+
+    Лишние пробелы схлопываются, регистр не учитывается.
+
+    :param title: Название книги.
+    :param author: Автор книги.
+    :return: Кортеж (название, автор) в нормализованном виде.
+    """
+    return " ".join(title.split()).casefold(), " ".join(author.split()).casefold()
 
 
 class Book:
+    __slots__ = ("_id", "_title", "title_key", "_author", "author_key", "year", "_status")
+
+    # Если True, идентификаторы в каноническом формате UUID хранятся как
+    # 16 байт вместо строки из 36 символов.
+    compact_ids = False
+
     def __init__(
         self,
         title: str,
         author: str,
         year: int,
-        status: str = "в наличии",
+        status: str = STATUS_AVAILABLE,
         id: Optional[str] = None,
     ) -> None:
         """Инициализирует новый объект книги.
@@ -20,6 +45,7 @@ class Book:
         Возможные значения: 'в наличии', 'выдана'.
         :param id: Уникальный идентификатор книги.
         Если не передан, генерируется автоматически.
+        :raises ValueError: Если статус не является 'в наличии' или 'выдана'.
         """
         self.id = id or str(uuid.uuid4())
         self.title = title
@@ -27,6 +53,104 @@ class Book:
         self.year = year
         self.status = status
 
+    @property
+    def id(self) -> str:
+        """Уникальный идентификатор книги.
+
+        :return: Строковое представление идентификатора.
+        """
+        if isinstance(self._id, bytes):
+            return str(uuid.UUID(bytes=self._id))
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        """Сохраняет идентификатор, при включённом `compact_ids` — в виде 16 байт.
+
+        Идентификаторы, которые не совпадают со своим каноническим видом UUID,
+        всегда хранятся строкой, чтобы не потерять их при сохранении.
+
+        :param value: Идентификатор книги.
+        """
+        if Book.compact_ids:
+            try:
+                parsed = uuid.UUID(value)
+            except ValueError:
+                parsed = None
+            if parsed is not None and str(parsed) == value:
+                self._id = parsed.bytes
+                return
+        self._id = value
+
+    @property
+    def title(self) -> str:
+        """Название книги.
+
+        :return: Название.
+        """
+        return self._title
+
+    @title.setter
+    def title(self, value: str) -> None:
+        """Сохраняет название и ключ поиска по нему — название в нижнем регистре.
+
+        :param value: Название книги.
+        """
+        self._title = value
+        self.title_key = value.lower()
+
+    @property
+    def author(self) -> str:
+        """Автор книги.
+
+        :return: Имя автора.
+        """
+        return self._author
+
+    @author.setter
+    def author(self, value: str) -> None:
+        """Сохраняет имя автора и ключ поиска по нему (имя в нижнем регистре).
+
+        Одинаковые имена и их ключи разделяют одну строку в памяти.
+
+        :param value: Имя автора.
+        """
+        self._author = sys.intern(value)
+        self.author_key = sys.intern(value.lower())
+
+    @property
+    def status(self) -> str:
+        """Статус книги.
+
+        :return: 'в наличии' или 'выдана'.
+        """
+        return STATUSES[self._status]
+
+    @status.setter
+    def status(self, value: str) -> None:
+        """Сохраняет статус в виде его номера в `STATUSES`.
+
+        :param value: Статус книги.
+        :raises ValueError: Если статус не является 'в наличии' или 'выдана'.
+        """
+        code = _STATUS_CODES.get(value)
+        if code is None:
+            raise ValueError("Статус может быть только 'в наличии' или 'выдана'.")
+        self._status = code
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает данные книги в виде словаря для сохранения в JSON.
+
+        :return: Словарь с ключами id, title, author, year и status.
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "author": self.author,
+            "year": self.year,
+            "status": self.status,
+        }
+
     def __str__(self) -> str:
         """Возвращает строковое представление книги.
 
@@ -49,6 +173,4 @@ class Book:
         :param new_status: Новый статус книги ('в наличии' или 'выдана').
         :raises ValueError: Если новый статус не является 'в наличии' или 'выдана'.
         """
-        if new_status not in ["в наличии", "выдана"]:
-            raise ValueError("Статус может быть только 'в наличии' или 'выдана'.")
         self.status = new_status
@@ -0,0 +1,119 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Ограничения кэша запросов по умолчанию: количество результатов и их
+# суммарный размер в байтах.
+QUERY_CACHE_ENTRIES = 256
+QUERY_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def estimate_size(key: Hashable, value: List[Any]) -> int:
+    """Оценивает память, которую занимает запись кэша.
+
+    Книги в результатах принадлежат каталогу, поэтому учитываются только
+    ключ и сам список ссылок на них.
+
+    :param key: Ключ записи.
+    :param value: Список результатов.
+    :return: Размер в байтах.
+    """
+    size = sys.getsizeof(value)
+    parts = key if isinstance(key, tuple) else (key,)
+    return size + sum(sys.getsizeof(part) for part in parts)
+
+
+class QueryCache:
+    def __init__(
+        self, max_entries: int = QUERY_CACHE_ENTRIES, max_bytes: int = QUERY_CACHE_BYTES
+    ) -> None:
+        """LRU-кэш результатов поиска с инвалидацией по поколению каталога.
+
+        Каждое изменение каталога увеличивает номер поколения и очищает кэш.
+        Результат, вычисленный до изменения, в кэш не попадает: `put` принимает
+        номер поколения, при котором начался поиск. Кэш потокобезопасен.
+
+        :param max_entries: Максимальное количество записей.
+        :param max_bytes: Максимальный суммарный размер записей в байтах;
+        результат больше этого размера не кэшируется.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[List[Any], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Количество записей в кэше.
+
+        :return: Количество записей.
+        """
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[List[Any]]:
+        """Возвращает результат из кэша и отмечает его как недавно использованный.
+
+        :param key: Ключ запроса.
+        :return: Копия списка результатов или None, если записи нет.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0])
+
+    def put(self, key: Hashable, value: List[Any], generation: int) -> None:
+        """Сохраняет результат, вытесняя давно не использованные записи.
+
+        :param key: Ключ запроса.
+        :param value: Список результатов.
+        :param generation: Номер поколения, при котором вычислен результат.
+        :return: None
+        """
+        size = estimate_size(key, value)
+        with self._lock:
+            if generation != self.generation or size > self.max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (list(value), size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Отмечает изменение каталога: начинает новое поколение и очищает кэш.
+
+        :return: None
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика кэша.
+
+        :return: Словарь с ключами hits, misses, evictions, entries, bytes и
+        generation.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "generation": self.generation,
+            }
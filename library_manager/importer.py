@@ -0,0 +1,84 @@
+import argparse
+import csv
+import json
+import os
+from typing import Any, Iterator, List, Optional
+
+from library_manager.manager import ImportResult, LibraryManager
+
+
+def read_records(path: str) -> Iterator[Any]:
+    """Последовательно читает записи книг из файла CSV или JSONL.
+
+    Формат определяется по расширению: .csv — таблица с заголовком title, author,
+    year (в том числе сохранённая Excel в UTF-8 с BOM); .jsonl — по одному
+    JSON-объекту на строку. Строки JSONL, которые не удалось разобрать,
+    отдаются как есть, чтобы попасть в отчёт об отклонённых записях.
+
+    :param path: Путь к файлу импорта.
+    :return: Итератор записей.
+    :raises ValueError: Если расширение файла не поддерживается.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, encoding="utf-8-sig", newline="") as file:
+            yield from csv.DictReader(file)
+    elif extension == ".jsonl":
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    yield line.rstrip("\n")
+    else:
+        raise ValueError("Поддерживаются только файлы .csv и .jsonl.")
+
+
+def import_file(manager: LibraryManager, path: str) -> ImportResult:
+    """Импортирует книги из файла в библиотеку за один проход.
+
+    :param manager: Менеджер библиотеки.
+    :param path: Путь к файлу CSV или JSONL.
+    :return: Отчёт об импорте.
+    """
+    return manager.add_books(read_records(path))
+
+
+def print_report(result: ImportResult) -> None:
+    """Выводит отчёт об импорте.
+
+    :param result: Отчёт об импорте.
+    """
+    for number, reason in result.rejected:
+        print(f"Запись {number} отклонена: {reason}")
+    print(
+        f"Добавлено книг: {result.added}, отклонено записей: {len(result.rejected)}, "
+        f"скорость: {result.records_per_second:.0f} записей/с."
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Импорт каталога из командной строки.
+
+    Запуск: python -m library_manager.importer books.csv [--storage data/books.json]
+
+    :param argv: Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Массовый импорт книг.")
+    parser.add_argument("path", help="Файл .csv или .jsonl с полями title, author, year")
+    parser.add_argument(
+        "--storage", default="data/books.json", help="Файл или адрес хранилища"
+    )
+    args = parser.parse_args(argv)
+
+    manager = LibraryManager(args.storage)
+    try:
+        print_report(import_file(manager, args.path))
+    finally:
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,44 @@
+import itertools
+import json
 import re
-from typing import List, Optional
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
-from library_manager.book import Book
-from library_manager.storage import load_books, save_books
+from library_manager.book import (
+    STATUS_AVAILABLE,
+    STATUS_ISSUED,
+    Book,
+    normalize_title_author,
+)
+from library_manager.cache import QueryCache
+from library_manager.metrics import timed
+from library_manager.search_index import AuthorIndex, FuzzyIndex, NgramIndex, YearIndex
+from library_manager.stats import TOP_AUTHORS, CatalogStats
+from library_manager.storage import Change, open_storage
+
+if TYPE_CHECKING:
+    from library_manager.parallel import ParallelSearch
+
+MIN_YEAR = 1800
+MAX_YEAR = 2030
+# Минимальная длина поискового запроса.
+MIN_QUERY_LENGTH = 2
+# Минимальная доля триграмм запроса, которая должна найтись в книге при
+# нечётком поиске.
+FUZZY_MIN_SCORE = 0.5
 
 
 def get_search_query() -> str:
@@ -18,8 +54,11 @@ def get_search_query() -> str:
         query = input(
             "Название, автор или год для поиска содержит (минимум 2 символа): "
         ).strip()
-        if len(query) < 2:
-            print("Ошибка: Запрос должен содержать хотя бы 2 символа. Повторите!")
+        if len(query) < MIN_QUERY_LENGTH:
+            print(
+                f"Ошибка: Запрос должен содержать хотя бы {MIN_QUERY_LENGTH} символа. "
+                "Повторите!"
+            )
         elif re.match(r"^[\W\s]+$", query):
             print(
                 "Ошибка: Запрос не может состоять только из пробелов или "
@@ -30,6 +69,15 @@ def get_search_query() -> str:
             return query
 
 
+def is_valid_year(year: int) -> bool:
+    """Проверяет, что год издания находится в диапазоне от 1800 до 2030.
+
+    :param year: Год издания.
+    :return: True, если год допустим.
+    """
+    return MIN_YEAR <= year <= MAX_YEAR
+
+
 def validate_year() -> Optional[int]:
     """Проверка года: он должен быть целым числом от 1800 до 2030.
 
@@ -43,7 +91,7 @@ def validate_year() -> Optional[int]:
         year = input("Введите год издания: ")
         try:
             year = int(year)
-            if 1800 <= year <= 2030:
+            if is_valid_year(year):
                 return year
             else:
                 print("Ошибка: Год должен быть в диапазоне от 1800 до 2030.")
@@ -65,104 +113,968 @@ def get_status_input() -> str:
             "Введите новый статус (1 - 'в наличии', 2 - 'выдана'): "
         ).strip()
         if status_input == "1":
-            return "в наличии"
+            return STATUS_AVAILABLE
         elif status_input == "2":
-            return "выдана"
+            return STATUS_ISSUED
         else:
             print("Ошибка: Введите '1' для 'в наличии' или '2' для 'выдана'.")
 
 
+def parse_year_range(query: str) -> Optional[Tuple[int, int]]:
+    """Распознаёт в поисковом запросе диапазон лет вида '1860-1880'.
+
+    :param query: Строка поиска.
+    :return: Кортеж (первый год, последний год) или None, если запрос не
+    является диапазоном.
+    """
+    match = re.fullmatch(r"\s*(\d{1,4})\s*[-–]\s*(\d{1,4})\s*", query)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def parse_book_record(record: Any) -> Tuple[str, str, int]:
+    """Проверяет запись для массового импорта и извлекает из неё данные книги.
+
+    Запись должна быть словарём с ключами title, author и year. Год проверяется
+    по тем же правилам, что и при ручном вводе: логические значения и дробные
+    числа (кроме записанных с нулевой дробной частью, например 1999.0) не
+    принимаются.
+
+    :param record: Запись из файла импорта.
+    :return: Кортеж (название, автор, год).
+    :raises ValueError: Если запись некорректна.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Запись должна содержать поля title, author и year.")
+    title = str(record.get("title") or "").strip()
+    author = str(record.get("author") or "").strip()
+    if not title or not author:
+        raise ValueError("Не указано название или автор.")
+    value = record.get("year")
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError("Год должен быть целым числом.")
+    try:
+        year = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("Год должен быть целым числом.") from None
+    if not is_valid_year(year):
+        raise ValueError(f"Год должен быть в диапазоне от {MIN_YEAR} до {MAX_YEAR}.")
+    return title, author, year
+
+
+@dataclass
+class ImportResult:
+    """Итог массового добавления книг."""
+
+    added: int = 0
+    rejected: List[Tuple[int, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        """Скорость обработки записей.
+
+        :return: Количество обработанных записей в секунду.
+        """
+        total = self.added + len(self.rejected)
+        return total / self.elapsed if self.elapsed else 0.0
+
+
+def _paginate(books: Iterator[Book], limit: Optional[int], offset: int) -> Iterator[Book]:
+    """Отбирает из итератора страницу книг.
+
+    :param books: Итератор книг.
+    :param limit: Максимальное количество книг; None — без ограничения.
+    :param offset: Сколько книг пропустить с начала.
+    :return: Итератор книг страницы.
+    :raises ValueError: Если limit или offset отрицательны.
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("Параметры limit и offset не могут быть отрицательными.")
+    return itertools.islice(books, offset, None if limit is None else offset + limit)
+
+
 class LibraryManager:
-    def __init__(self, storage_file: str = "data/books.json") -> None:
+    def __init__(
+        self,
+        storage_file: str = "data/books.json",
+        journal: bool = False,
+        search_index: bool = False,
+        lazy: bool = False,
+        write_behind: bool = False,
+        query_cache: bool = True,
+        parallel_search: bool = False,
+    ) -> None:
         """Инициализация менеджера библиотеки.
 
-        Загружает книги из указанного файла.
+        Загружает книги из указанного файла. Тип хранилища выбирается по адресу
+        или расширению: `sqlite:///путь` и файлы .db, .sqlite, .sqlite3 хранятся
+        в SQLite, остальные — в JSON.
 
-        :param storage_file: Путь к файлу для загрузки и сохранения данных.
+        :param storage_file: Путь к файлу или адрес хранилища для загрузки и
+        сохранения данных.
+        :param journal: Если True, изменения дописываются в журнал рядом с файлом
+        данных вместо полной перезаписи файла при каждом изменении (для JSON).
+        :param search_index: Если True, поиск использует триграммный индекс по
+        названию и автору вместо перебора всех книг.
+        :param lazy: Если True, книги читаются из файла потоково по мере
+        надобности: поиск по ID доступен до окончания загрузки, а операции над
+        всем каталогом сначала дочитывают файл.
+        :param write_behind: Если True, изменения не записываются сразу, а
+        накапливаются до вызова `flush()`.
+        :param query_cache: Если True, результаты поиска кэшируются до
+        следующего изменения каталога.
+        :param parallel_search: Если True, поиск в больших каталогах выполняется
+        параллельно в нескольких процессах, которые держат части каталога в
+        памяти.
         """
         self.storage_file = storage_file
-        self.books: List[Book] = load_books(self.storage_file)
+        self.storage = open_storage(storage_file, journal=journal)
+        self._books: Dict[str, Book] = {}
+        self._title_author_index: Dict[Tuple[str, str], str] = {}
+        self._search_index: Optional[NgramIndex] = (
+            NgramIndex() if search_index else None
+        )
+        self._year_index = YearIndex()
+        self._author_index = AuthorIndex()
+        self._stats = CatalogStats()
+        # Индекс нечёткого поиска строится при первом запросе.
+        self._fuzzy_index: Optional[FuzzyIndex] = None
+        self.query_cache: Optional[QueryCache] = QueryCache() if query_cache else None
+        self._parallel: Optional["ParallelSearch"] = None
+        if parallel_search:
+            # multiprocessing нужен только параллельному поиску.
+            from library_manager import parallel
+
+            self._parallel = parallel.ParallelSearch()
+        # Растёт при каждом добавлении и удалении книги; по нему параллельный
+        # поиск определяет, что каталог в процессах устарел.
+        self._catalog_version = 0
+        self._batch_depth = 0
+        self._batch_changes: List[Change] = []
+        self._batch_statuses: Dict[str, Tuple[Book, str]] = {}
+        self.write_behind = write_behind
+        self._unflushed: List[Change] = []
+        self._pending: Optional[Iterator[Book]] = None
+        # Книги, прочитанные по ID из хранилища с произвольным доступом до того,
+        # как до них дошла ленивая загрузка; None отмечает удалённую книгу.
+        self._fetched: Dict[str, Optional[Book]] = {}
+        if lazy:
+            self.books = []
+            self._pending = self.storage.iter_books()
+        else:
+            self.books = self.storage.load()
+
+    def _index_book(self, book: Book) -> None:
+        """Добавляет книгу в каталог и во все индексы.
+
+        :param book: Книга.
+        """
+        in_sync = self._parallel_in_sync()
+        self._catalog_version += 1
+        self._books[book.id] = book
+        self._title_author_index[normalize_title_author(book.title, book.author)] = (
+            book.id
+        )
+        self._year_index.add(book)
+        self._author_index.add(book)
+        self._stats.add(book)
+        if self._search_index is not None:
+            self._search_index.add(book)
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.add(book)
+        if in_sync:
+            self._parallel.add(book, self._catalog_version)
+
+    def _unindex_book(self, book: Book) -> None:
+        """Удаляет книгу из каталога и из всех индексов.
+
+        :param book: Книга.
+        """
+        in_sync = self._parallel_in_sync()
+        self._catalog_version += 1
+        if book.id in self._fetched:
+            # Книга ещё не загружена и в индексах её нет: достаточно не загрузить
+            # её, когда до неё дойдёт ленивая загрузка.
+            self._fetched[book.id] = None
+            return
+        self._books.pop(book.id, None)
+        self._title_author_index.pop(
+            normalize_title_author(book.title, book.author), None
+        )
+        self._year_index.remove(book)
+        self._author_index.remove(book)
+        self._stats.remove(book)
+        if self._search_index is not None:
+            self._search_index.remove(book)
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.remove(book)
+        if in_sync:
+            self._parallel.remove(book, self._catalog_version)
+        if self._pending is not None:
+            # Хранилище может ещё не знать об удалении (отложенная запись), а
+            # поиск по хранилищу не должен снова найти эту книгу.
+            self._fetched[book.id] = None
+
+    def _parallel_in_sync(self) -> bool:
+        """Проверяет, что рабочие процессы держат текущую версию каталога.
+
+        Тогда изменение каталога передаётся им сразу, без повторной раздачи.
+
+        :return: True, если параллельный поиск построен по текущему каталогу.
+        """
+        return (
+            self._parallel is not None
+            and self._parallel.version == self._catalog_version
+        )
+
+    def _catalog_changed(self) -> None:
+        """Отмечает изменение каталога: результаты поиска в кэше устаревают.
+
+        :return: None
+        """
+        if self.query_cache is not None:
+            self.query_cache.invalidate()
+
+    def _cached(self, key: Hashable, search: Callable[[], List[Book]]) -> List[Book]:
+        """Возвращает результат поиска из кэша или выполняет поиск.
+
+        :param key: Ключ запроса в кэше.
+        :param search: Функция, выполняющая поиск.
+        :return: Список найденных книг.
+        """
+        if self.query_cache is None:
+            return search()
+        found = self.query_cache.get(key)
+        if found is None:
+            generation = self.query_cache.generation
+            found = search()
+            self.query_cache.put(key, found, generation)
+        return found
+
+    def _load_next(self) -> Optional[Book]:
+        """Читает из файла следующую книгу при ленивой загрузке.
+
+        Если книга уже была прочитана по ID, в каталог попадает тот же объект,
+        а удалённые за это время книги пропускаются.
+
+        :return: Загруженная книга или None, если файл дочитан.
+        """
+        while self._pending is not None:
+            try:
+                book = next(self._pending)
+            except StopIteration:
+                self._pending = None
+                break
+            except json.JSONDecodeError:
+                print("Ошибка при чтении данных из файла. Возможно, файл поврежден.")
+                self._pending = None
+                break
+            if book.id in self._fetched:
+                fetched = self._fetched.pop(book.id)
+                if fetched is None:
+                    continue
+                book = fetched
+            self._index_book(book)
+            return book
+        self._fetched = {}
+        return None
+
+    def _ensure_loaded(self) -> None:
+        """Дочитывает файл до конца, если загрузка ещё не завершена.
+
+        :return: None
+        """
+        while self._load_next() is not None:
+            pass
+
+    @property
+    def is_loaded(self) -> bool:
+        """Признак того, что каталог полностью загружен из файла.
+
+        :return: True, если все книги загружены.
+        """
+        return self._pending is None
+
+    @property
+    def books(self) -> List[Book]:
+        """Список книг библиотеки в порядке добавления.
+
+        Книги хранятся в словаре по ID, поэтому возвращается новый список:
+        изменять каталог нужно через методы менеджера или присваиванием.
+
+        :return: Список объектов Book.
+        """
+        self._ensure_loaded()
+        return list(self._books.values())
+
+    @books.setter
+    def books(self, books: List[Book]) -> None:
+        """Заменяет каталог целиком и перестраивает индексы.
+
+        :param books: Новый список книг.
+        """
+        self._catalog_changed()
+        if self._parallel is not None:
+            # Новый каталог раздаётся процессам целиком при следующем поиске.
+            self._parallel.version = None
+        self._pending = None
+        self._fetched = {}
+        self._books = {}
+        self._title_author_index = {}
+        self._year_index = YearIndex()
+        self._author_index = AuthorIndex()
+        self._stats = CatalogStats()
+        self._fuzzy_index = None
+        if self._search_index is not None:
+            self._search_index = NgramIndex()
+        for book in books:
+            self._index_book(book)
+
+    def get_book(self, book_id: str) -> Optional[Book]:
+        """Поиск книги по ID за O(1).
+
+        При ленивой загрузке хранилище с произвольным доступом (SQLite, двоичный
+        снимок) читает только искомую книгу, остальные файлы дочитываются до неё.
+
+        :param book_id: Идентификатор книги.
+        :return: Найденная книга или None, если книги с таким ID нет.
+        """
+        book = self._books.get(book_id)
+        if book is None and self._pending is not None and self.storage.random_access:
+            book = self._fetched.get(book_id)
+            if book is None and book_id not in self._fetched:
+                book = self.storage.get_book(book_id)
+                if book is not None:
+                    self._fetched[book_id] = book
+            return book
+        while book is None and self._pending is not None:
+            loaded = self._load_next()
+            if loaded is not None and loaded.id == book_id:
+                book = loaded
+        return book
+
+    def has_book(self, title: str, author: str) -> bool:
+        """Проверка наличия книги с таким названием и автором за O(1).
+
+        Сравнение не учитывает регистр и лишние пробелы. Пока каталог
+        загружается лениво из хранилища с индексами (SQLite), книгу ищет само
+        хранилище, не дочитывая каталог.
+
+        :param title: Название книги.
+        :param author: Автор книги.
+        :return: True, если такая книга уже есть в библиотеке.
+        """
+        key = normalize_title_author(title, author)
+        if self._pending is not None and self.storage.indexed:
+            if key in self._title_author_index:
+                return True
+            stored = self.storage.find_by_title_author(title, author)
+            return stored is not None and self._resolve_stored(stored) is not None
+        self._ensure_loaded()
+        return key in self._title_author_index
+
+    def _persist(self, operation: str, book: Book) -> None:
+        """Сохраняет изменение каталога в хранилище.
+
+        Хранилища, которые умеют записывать отдельные изменения (журнал, SQLite),
+        получают только это изменение. Иначе весь список книг перезаписывается.
+
+        :param operation: Операция: 'add', 'update' или 'remove'.
+        :param book: Книга, которой касается изменение.
+        """
+        self._write([(operation, book)])
+
+    def _write(self, changes: List[Change]) -> None:
+        """Записывает набор изменений в хранилище за один раз.
+
+        Внутри `batch()` изменения только накапливаются и записываются при выходе
+        из блока, а в режиме отложенной записи — при вызове `flush()`.
+
+        :param changes: Список пар (операция, книга).
+        :return: None
+        """
+        if self._batch_depth:
+            self._batch_changes.extend(changes)
+        elif self.write_behind:
+            self._unflushed.extend(changes)
+        else:
+            self._write_now(changes)
+
+    def flush(self) -> None:
+        """Записывает накопленные в режиме отложенной записи изменения.
+
+        Все изменения записываются за один раз. Если запись не удалась, изменения
+        остаются в очереди до следующего вызова.
+
+        :return: None
+        """
+        changes, self._unflushed = self._unflushed, []
+        if not changes:
+            return
+        try:
+            self._write_now(changes)
+        except Exception:
+            self._unflushed = changes + self._unflushed
+            raise
+
+    @property
+    def has_unflushed_changes(self) -> bool:
+        """Признак наличия изменений, ещё не записанных в хранилище.
+
+        :return: True, если есть незаписанные изменения.
+        """
+        return bool(self._unflushed)
+
+    def _write_now(self, changes: List[Change]) -> None:
+        """Немедленно записывает изменения в хранилище.
+
+        :param changes: Список пар (операция, книга).
+        :return: None
+        """
+        with self.storage.lock():
+            if self.storage.is_stale():
+                changes = self._merge(changes)
+                if not changes:
+                    return
+            if self.storage.incremental:
+                self.storage.apply(changes)
+            else:
+                self.storage.save_all(self.books)
+
+    def _merge(self, changes: List[Change]) -> List[Change]:
+        """Применяет собственные изменения поверх каталога из другого процесса.
+
+        Каталог перечитывается из хранилища, после чего изменения применяются
+        по записям: добавление пропускается, если такая книга уже появилась;
+        удаление и смена статуса — если книги больше нет.
 
-    def add_book(self, title: str, author: str, year: int) -> None:
+        :param changes: Собственные изменения, ещё не записанные в хранилище.
+        :return: Изменения, которые остались применимыми.
+        """
+        print("Каталог изменён другим процессом. Изменения объединены.")
+        self.books = self.storage.load()
+        merged: List[Change] = []
+        for operation, book in changes:
+            if operation == "add":
+                if book.id in self._books or self.has_book(book.title, book.author):
+                    continue
+                self._index_book(book)
+                merged.append((operation, book))
+                continue
+            current = self._books.get(book.id)
+            if current is None:
+                continue
+            if operation == "remove":
+                self._unindex_book(current)
+            else:
+                self._stats.change_status(current.status, book.status)
+                current.status = book.status
+            merged.append((operation, current))
+        return merged
+
+    def reload_if_changed(self) -> bool:
+        """Перечитывает каталог, если его изменил другой процесс.
+
+        Проверка дешёвая: сравнивается номер поколения хранилища, сам каталог
+        читается только при изменении.
+
+        :return: True, если каталог был перечитан.
+        """
+        if self._batch_depth or not self.storage.is_stale():
+            return False
+        if self._unflushed:
+            # Запись отложенных изменений сама перечитает каталог и применит их.
+            self.flush()
+        else:
+            self.books = self.storage.load()
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator["LibraryManager"]:
+        """Блок изменений с однократным сохранением.
+
+        Все изменения внутри блока записываются в хранилище один раз при выходе.
+        Если внутри блока возникло исключение, каталог в памяти возвращается в
+        состояние до начала блока, а в хранилище ничего не записывается.
+        Вложенные блоки входят в состав внешнего.
+
+        Пример::
+
+            with manager.batch():
+                manager.update_book_status(first_id, "выдана")
+                manager.remove_book(second_id)
+
+        :return: Менеджер библиотеки.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        self._ensure_loaded()
+        snapshot = list(self._books.values())
+        self._batch_depth = 1
+        try:
+            yield self
+        except BaseException:
+            for book, status in self._batch_statuses.values():
+                book.status = status
+            self.books = snapshot
+            raise
+        else:
+            changes = self._batch_changes
+            self._batch_changes = []
+            self._batch_depth = 0
+            if changes:
+                self._write(changes)
+        finally:
+            self._batch_depth = 0
+            self._batch_changes = []
+            self._batch_statuses = {}
+
+    def compact(self) -> None:
+        """Перезаписывает хранилище текущим каталогом.
+
+        Для JSON-хранилища с журналом это сворачивает журнал в снимок.
+
+        :return: None
+        """
+        self.storage.save_all(self.books)
+
+    def close(self) -> None:
+        """Записывает отложенные изменения и закрывает хранилище.
+
+        Незавершённая ленивая загрузка прекращается, а открытые ею файлы и курсоры
+        закрываются.
+
+        :return: None
+        """
+        self.flush()
+        if self._pending is not None:
+            close_pending = getattr(self._pending, "close", None)
+            if close_pending is not None:
+                close_pending()
+            self._pending = None
+            self._fetched = {}
+        self.storage.close()
+        if self._parallel is not None:
+            self._parallel.close()
+
+    @timed("add_book")
+    def add_book(self, title: str, author: str, year: int) -> Optional[Book]:
         """Добавление новой книги в библиотеку.
 
-        Функция проверяет наличие книги с таким же названием и автором в библиотеке.
-        Если такая книга уже есть, она не добавляется.
+        Функция проверяет наличие книги с таким же названием и автором в библиотеке
+        (без учёта регистра и лишних пробелов). Если такая книга уже есть, она
+        не добавляется.
 
         :param title: Название книги.
         :param author: Автор книги.
         :param year: Год издания книги.
+        :return: Добавленная книга или None, если такая книга уже есть.
         """
-        if any(book.title == title and book.author == author for book in self.books):
+        # Новая книга добавляется в конец каталога, поэтому он дочитывается до
+        # проверки дубликата.
+        self._ensure_loaded()
+        if self.has_book(title, author):
             print(
                 f"Ошибка: Книга '{title}' авторства '{author}' уже есть в библиотеке."
             )
-            return
+            return None
 
         new_book = Book(title, author, year)
-        self.books.append(new_book)
-        save_books(self.books, self.storage_file)
+        self._index_book(new_book)
+        self._catalog_changed()
+        self._persist("add", new_book)
         print(f"Книга '{title}' добавлена в библиотеку.")
+        return new_book
+
+    @timed("add_books")
+    def add_books(self, records: Iterable[Any]) -> ImportResult:
+        """Массовое добавление книг с однократным сохранением.
+
+        Каждая запись — словарь с ключами title, author и year. Записи с
+        некорректными данными и дубликаты (в том числе внутри самого набора)
+        пропускаются и попадают в отчёт; остальные книги сохраняются одной
+        записью в хранилище после обработки всего набора. Набор обрабатывается
+        как блок `batch()`: при исключении каталог не меняется.
+
+        :param records: Итерируемый набор записей.
+        :return: Отчёт с количеством добавленных книг, отклонёнными записями
+        (номер записи с единицы и причина) и временем обработки.
+        """
+        started = time.perf_counter()
+        result = ImportResult()
+        self._ensure_loaded()
+        with self.batch():
+            for number, record in enumerate(records, start=1):
+                try:
+                    title, author, year = parse_book_record(record)
+                except ValueError as e:
+                    result.rejected.append((number, str(e)))
+                    continue
+                if self.has_book(title, author):
+                    result.rejected.append(
+                        (number, f"Книга '{title}' авторства '{author}' уже есть.")
+                    )
+                    continue
+                new_book = Book(title, author, year)
+                self._index_book(new_book)
+                self._catalog_changed()
+                self._persist("add", new_book)
+                result.added += 1
+        result.elapsed = time.perf_counter() - started
+        return result
 
-    def remove_book(self, book_id: str) -> None:
+    @timed("remove_book")
+    def remove_book(self, book_id: str) -> bool:
         """Удаление книги по ID.
 
         Функция удаляет книгу по указанному ID, если она найдена.
 
         :param book_id: Идентификатор книги.
+        :return: True, если книга была удалена.
         """
-        book_to_remove = next((book for book in self.books if book.id == book_id), None)
+        book_to_remove = self.get_book(book_id)
         if book_to_remove:
-            self.books.remove(book_to_remove)
-            save_books(self.books, self.storage_file)
+            self._unindex_book(book_to_remove)
+            self._catalog_changed()
+            self._persist("remove", book_to_remove)
             print(f"Книга с ID {book_id} была удалена.")
+            return True
+        print(f"Книга с ID {book_id} не найдена.")
+        return False
+
+    def iter_books(self, limit: Optional[int] = None, offset: int = 0) -> Iterator[Book]:
+        """Перебирает книги каталога в порядке добавления.
+
+        Книги отдаются по одной, без построения списка. При ленивой загрузке
+        файл дочитывается по мере перебора, поэтому первая страница доступна
+        сразу. Изменять каталог во время перебора нельзя.
+
+        :param limit: Максимальное количество книг; None — без ограничения.
+        :param offset: Сколько книг пропустить с начала.
+        :return: Итератор книг.
+        """
+        return _paginate(self._iter_catalog(), limit, offset)
+
+    def _iter_catalog(self) -> Iterator[Book]:
+        """Перебирает все книги, при ленивой загрузке дочитывая файл.
+
+        :return: Итератор книг.
+        """
+        if self._pending is None:
+            yield from self._books.values()
+            return
+        yield from list(self._books.values())
+        book = self._load_next()
+        while book is not None:
+            yield book
+            book = self._load_next()
+
+    def _find_in_storage(self, query: str) -> Iterator[Book]:
+        """Ищет книги в хранилище, не дочитывая каталог при ленивой загрузке.
+
+        Найденные книги сопоставляются с каталогом через `_resolve_stored`.
+
+        :param query: Строка для поиска.
+        :return: Итератор найденных книг в порядке каталога.
+        """
+        for book in self.storage.find(query):
+            resolved = self._resolve_stored(book)
+            if resolved is not None:
+                yield resolved
+
+    def _resolve_stored(self, book: Book) -> Optional[Book]:
+        """Сопоставляет книгу, найденную в хранилище, с книгой каталога.
+
+        Книги, которые уже загружены или прочитаны по ID, заменяются теми же
+        объектами, удалённые пропускаются; остальные найденные книги
+        запоминаются, как при чтении по ID.
+
+        :param book: Книга, прочитанная из хранилища.
+        :return: Книга каталога или None, если книга удалена.
+        """
+        loaded = self._books.get(book.id)
+        if loaded is not None:
+            return loaded
+        if self._pending is None:
+            # Каталог дочитан, и книги в нём нет: она удалена.
+            return None
+        if book.id in self._fetched:
+            return self._fetched[book.id]
+        self._fetched[book.id] = book
+        return book
+
+    def iter_find_books(
+        self, query: str, limit: Optional[int] = None, offset: int = 0
+    ) -> Iterator[Book]:
+        """Лениво ищет книги по названию, автору или году.
+
+        Книги проверяются по мере перебора результата, поэтому время до первой
+        найденной книги и расход памяти не зависят от размера каталога. Если
+        включён триграммный индекс, проверяются только книги-кандидаты из
+        индекса; если включён параллельный поиск, большой каталог проверяется
+        сразу в нескольких процессах. Пока каталог загружается лениво из
+        хранилища с поиском (двоичный снимок), книги ищет само хранилище, не
+        дочитывая каталог. Результат совпадает с полным перебором.
+
+        :param query: Строка для поиска.
+        :param limit: Максимальное количество книг; None — без ограничения.
+        :param offset: Сколько найденных книг пропустить с начала.
+        :return: Итератор книг, соответствующих запросу.
+        """
+        if self._parallel is not None:
+            self._ensure_loaded()
+            if len(self._books) >= self._parallel.min_books:
+                if self._parallel.version != self._catalog_version:
+                    self._parallel.build(
+                        list(self._books.values()), self._catalog_version
+                    )
+                return _paginate(iter(self._parallel.find(query)), limit, offset)
+        if self._pending is not None and self.storage.searchable:
+            books: Iterator[Book] = self._find_in_storage(query)
+        elif self._search_index is None:
+            books = self._iter_catalog()
         else:
-            print(f"Книга с ID {book_id} не найдена.")
+            self._ensure_loaded()
+            candidates = self._search_index.candidates(query)
+            books = (self._books[book_id] for book_id in candidates)
+        query_lower = query.lower()
+        if query.isdigit():
+            found = (
+                book
+                for book in books
+                if query_lower in book.title_key
+                or query_lower in book.author_key
+                or query in str(book.year)
+            )
+        else:
+            # Год состоит только из цифр, поэтому с другими запросами он не
+            # совпадёт; строка года не создаётся.
+            found = (
+                book
+                for book in books
+                if query_lower in book.title_key or query_lower in book.author_key
+            )
+        return _paginate(found, limit, offset)
 
-    def find_books(self, query: str) -> List[Book]:
+    @timed("find_books")
+    def find_books(
+        self, query: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Book]:
         """Поиск книг по названию, автору или году.
 
         Функция ищет книги, соответствующие запросу в названии, авторе или годе.
+        Для постраничного вывода больших результатов используйте
+        `iter_find_books`. Результаты кэшируются до следующего изменения
+        каталога.
 
         :param query: Строка для поиска.
+        :param limit: Максимальное количество книг; None — без ограничения.
+        :param offset: Сколько найденных книг пропустить с начала.
         :return: Список книг, соответствующих запросу.
         """
-        results = [
-            book
-            for book in self.books
-            if query.lower() in book.title.lower()
-            or query.lower() in book.author.lower()
-            or query in str(book.year)
+        return self._cached(
+            ("find", query, limit, offset),
+            lambda: list(self.iter_find_books(query, limit, offset)),
+        )
+
+    @timed("find_books_fuzzy")
+    def find_books_fuzzy(
+        self, query: str, limit: int = 10, min_score: float = FUZZY_MIN_SCORE
+    ) -> List[Book]:
+        """Нечёткий поиск книг по названию и автору с ранжированием.
+
+        Опечатки и различия в регистре и буквах ё/е не мешают поиску: книги
+        сравниваются с запросом по триграммам, возвращаются лучшие `limit`
+        совпадений. Индекс строится при первом вызове и дальше обновляется
+        вместе с каталогом.
+
+        :param query: Строка для поиска.
+        :param limit: Максимальное количество книг.
+        :param min_score: Минимальная доля триграмм запроса, найденных в книге.
+        :return: Список книг по убыванию сходства.
+        """
+        return self._cached(
+            ("fuzzy", query, limit, min_score),
+            lambda: self._search_fuzzy(query, limit, min_score),
+        )
+
+    def _search_fuzzy(self, query: str, limit: int, min_score: float) -> List[Book]:
+        """Выполняет нечёткий поиск, при необходимости строя индекс.
+
+        :param query: Строка для поиска.
+        :param limit: Максимальное количество книг.
+        :param min_score: Минимальная доля триграмм запроса, найденных в книге.
+        :return: Список книг по убыванию сходства.
+        """
+        self._ensure_loaded()
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyIndex(self._books.values())
+        return [
+            self._books[book_id]
+            for book_id, _ in self._fuzzy_index.search(query, limit, min_score)
         ]
-        return results
 
-    def display_books(self) -> None:
+    @timed("find_by_author")
+    def find_by_author(self, author: str) -> List[Book]:
+        """Все книги автора по словарю авторов, без перебора каталога.
+
+        Имя сравнивается целиком, без учёта регистра, различия ё/е и лишних
+        пробелов: «лев толстой» находит книги Льва Толстого, а «Толст» — нет
+        (для поиска по части имени используйте `find_books`).
+
+        :param author: Имя автора.
+        :return: Список книг автора в порядке добавления.
+        """
+        self._ensure_loaded()
+        return [self._books[book_id] for book_id in self._author_index.find(author)]
+
+    @timed("find_by_year")
+    def find_by_year(self, year: int) -> List[Book]:
+        """Поиск книг, изданных в указанном году, по индексу лет.
+
+        В отличие от `find_books`, год сравнивается целиком: запрос 1866 не
+        находит книги 1860-х годов других лет.
+
+        :param year: Год издания.
+        :return: Список книг в порядке добавления.
+        """
+        return self.find_by_year_range(year, year)
+
+    @timed("find_by_year_range")
+    def find_by_year_range(self, start: int, end: int) -> List[Book]:
+        """Поиск книг, изданных в диапазоне лет включительно, за O(log n + k).
+
+        Пока каталог загружается лениво из хранилища с индексами (SQLite),
+        книги ищет само хранилище, не дочитывая каталог.
+
+        :param start: Первый год диапазона.
+        :param end: Последний год диапазона.
+        :return: Список книг, упорядоченный по году и порядку добавления.
+        """
+        if self._pending is not None and self.storage.indexed:
+            found = (
+                self._resolve_stored(book)
+                for book in self.storage.find_by_year_range(start, end)
+            )
+            return [book for book in found if book is not None]
+        self._ensure_loaded()
+        return [
+            self._books[book_id] for book_id in self._year_index.find_range(start, end)
+        ]
+
+    def stats(self, top_authors: Optional[int] = TOP_AUTHORS) -> Dict[str, Any]:
+        """Сводка по каталогу без перебора книг.
+
+        Показатели обновляются при каждом добавлении, удалении и смене статуса
+        и пересчитываются за один проход при загрузке каталога.
+
+        :param top_authors: Сколько авторов с наибольшим количеством книг
+        включить в отчёт; None — всех.
+        :return: Словарь с ключами total (всего книг), statuses (книг по
+        статусам), years и decades (книг по годам и десятилетиям) и authors
+        (пары (автор, количество книг) по убыванию количества).
+        """
+        self._ensure_loaded()
+        return self._stats.report(top_authors)
+
+    def count_books(self, query: Optional[str] = None) -> int:
+        """Подсчитывает книги каталога или результаты поиска без построения списка.
+
+        :param query: Строка для поиска; None — все книги каталога.
+        :return: Количество книг.
+        """
+        if query is None:
+            self._ensure_loaded()
+            return self._stats.total
+        return sum(1 for _ in self.iter_find_books(query))
+
+    def display_books(self, limit: Optional[int] = None, offset: int = 0) -> None:
         """Отображение всех книг.
 
-        Функция выводит информацию о всех книгах в библиотеке.
+        Функция выводит информацию о книгах в библиотеке, при необходимости —
+        только указанную страницу.
 
         Если библиотека пуста, выводится сообщение о том, что книги не найдены.
+
+        :param limit: Максимальное количество книг; None — все книги.
+        :param offset: Сколько книг пропустить с начала.
         """
-        if not self.books:
-            print("Библиотека пуста.")
-        for book in self.books:
+        shown = 0
+        for book in self.iter_books(limit, offset):
             print(book)
+            shown += 1
+        if not shown and not offset:
+            print("Библиотека пуста.")
 
-    def update_book_status(self, book_id: str, new_status: str) -> None:
+    @timed("update_book_status")
+    def update_book_status(self, book_id: str, new_status: str) -> bool:
         """Изменение статуса книги по ID.
 
         Функция обновляет статус книги по указанному ID, если книга найдена.
 
         :param book_id: Идентификатор книги.
         :param new_status: Новый статус книги ('в наличии' или 'выдана').
+        :return: True, если книга найдена и статус установлен.
         """
-        book_to_update = next((book for book in self.books if book.id == book_id), None)
+        book_to_update = self.get_book(book_id)
         if book_to_update:
             try:
-                book_to_update.update_status(new_status)
-                save_books(self.books, self.storage_file)
+                self._set_status(book_to_update, new_status)
                 print(f"Статус книги с ID {book_id} изменен на '{new_status}'.")
+                return True
             except ValueError as e:
                 print(f"Ошибка: {e}")
-        else:
-            print(f"Книга с ID {book_id} не найдена.")
+                return False
+        print(f"Книга с ID {book_id} не найдена.")
+        return False
+
+    def _set_status(self, book: Book, new_status: str) -> None:
+        """Меняет статус книги и сохраняет изменение.
+
+        Внутри `batch()` запоминает прежний статус для отката.
+
+        :param book: Книга.
+        :param new_status: Новый статус книги.
+        :raises ValueError: Если статус недопустим.
+        """
+        previous_status = book.status
+        book.update_status(new_status)
+        if book.id in self._books:
+            # Книгу, прочитанную по ID до ленивой загрузки, статистика учтёт с
+            # новым статусом, когда до неё дойдёт загрузка.
+            self._stats.change_status(previous_status, book.status)
+        self._catalog_changed()
+        if self._batch_depth:
+            self._batch_statuses.setdefault(book.id, (book, previous_status))
+        self._persist("update", book)
+
+    @timed("update_statuses")
+    def update_statuses(self, statuses: Dict[str, str]) -> int:
+        """Массовое изменение статусов книг с однократным сохранением.
+
+        Изменения выполняются как единый блок `batch()`: если хотя бы одна книга
+        не найдена или статус недопустим, ни одно изменение не применяется.
+
+        :param statuses: Словарь {ID книги: новый статус}.
+        :return: Количество книг, статус которых изменился.
+        :raises KeyError: Если книга с указанным ID не найдена.
+        :raises ValueError: Если статус недопустим.
+        """
+        updated = 0
+        with self.batch():
+            for book_id, new_status in statuses.items():
+                book = self.get_book(book_id)
+                if book is None:
+                    raise KeyError(f"Книга с ID {book_id} не найдена.")
+                if book.status != new_status:
+                    self._set_status(book, new_status)
+                    updated += 1
+        return updated
@@ -0,0 +1,360 @@
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Верхние границы корзин гистограммы задержек, в секундах.
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+# Период фоновой выгрузки метрик в приёмники, в секундах.
+METRICS_FLUSH_INTERVAL = 10.0
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Гистограмма задержек с фиксированными корзинами.
+
+        :param buckets: Возрастающие верхние границы корзин в секундах.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Учитывает одно значение.
+
+        :param value: Длительность в секундах.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает гистограмму в виде словаря с накопленными счётчиками.
+
+        :return: Словарь с ключами buckets ({граница: количество}), count и sum.
+        """
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        """Реестр метрик: число вызовов и задержки операций, байты ввода-вывода.
+
+        Пока реестр выключен, инструментированный код только проверяет флаг
+        `enabled`, поэтому накладные расходы почти нулевые. Счётчики обновляются
+        под блокировкой: их используют потоки HTTP-сервера.
+        """
+        self.enabled = False
+        self.sinks: List["MetricsSink"] = []
+        self._lock = threading.Lock()
+        # Выгрузка в приёмники идёт по одной: фоновая и при выходе могут совпасть.
+        self._flush_lock = threading.Lock()
+        self._flusher: Optional[Tuple[threading.Event, threading.Thread]] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Обнуляет все накопленные метрики.
+
+        :return: None
+        """
+        with self._lock:
+            self.calls: Dict[str, int] = {}
+            self.latencies: Dict[str, Histogram] = {}
+            self.bytes_read = 0
+            self.bytes_written = 0
+
+    def observe(self, operation: str, seconds: float) -> None:
+        """Учитывает вызов операции и его длительность.
+
+        :param operation: Имя операции.
+        :param seconds: Длительность вызова в секундах.
+        """
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            histogram = self.latencies.get(operation)
+            if histogram is None:
+                histogram = self.latencies[operation] = Histogram()
+            histogram.observe(seconds)
+
+    def add_bytes_read(self, count: int) -> None:
+        """Учитывает прочитанные хранилищем байты.
+
+        :param count: Количество байт.
+        """
+        with self._lock:
+            self.bytes_read += count
+
+    def add_bytes_written(self, count: int) -> None:
+        """Учитывает записанные хранилищем байты.
+
+        :param count: Количество байт.
+        """
+        with self._lock:
+            self.bytes_written += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Возвращает текущие значения всех метрик.
+
+        :return: Словарь с ключами calls, latency_seconds, bytes_read, bytes_written.
+        """
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "latency_seconds": {
+                    operation: histogram.to_dict()
+                    for operation, histogram in self.latencies.items()
+                },
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+            }
+
+    def enable(self, *sinks: "MetricsSink") -> None:
+        """Включает сбор метрик и подключает приёмники.
+
+        :param sinks: Приёмники, в которые `flush` выгружает метрики.
+        """
+        self.sinks.extend(sinks)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Выключает сбор метрик, фоновую выгрузку и отключает приёмники.
+
+        :return: None
+        """
+        self.stop_flushing()
+        self.enabled = False
+        self.sinks = []
+
+    def flush(self) -> None:
+        """Выгружает текущие метрики во все подключённые приёмники.
+
+        :return: None
+        """
+        with self._flush_lock:
+            snapshot = self.snapshot()
+            for sink in self.sinks:
+                sink.write(snapshot)
+
+    def start_flushing(self, interval: float = METRICS_FLUSH_INTERVAL) -> None:
+        """Запускает фоновую выгрузку метрик в приёмники с заданным периодом.
+
+        Нужна долго работающим процессам (HTTP-серверу), которые иначе выгрузили
+        бы метрики только при завершении.
+
+        :param interval: Период выгрузки в секундах.
+        :return: None
+        """
+        self.stop_flushing()
+        stop = threading.Event()
+
+        def run() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.flush()
+                except OSError as e:
+                    print(f"Ошибка при выгрузке метрик: {e}")
+
+        thread = threading.Thread(target=run, name="metrics-flush", daemon=True)
+        self._flusher = (stop, thread)
+        thread.start()
+
+    def stop_flushing(self) -> None:
+        """Останавливает фоновую выгрузку метрик, если она запущена.
+
+        :return: None
+        """
+        if self._flusher is not None:
+            stop, thread = self._flusher
+            stop.set()
+            thread.join()
+            self._flusher = None
+
+
+metrics = MetricsRegistry()
+
+
+def timed(operation: str) -> Callable[[F], F]:
+    """Декоратор, который учитывает вызовы функции в реестре метрик.
+
+    :param operation: Имя операции в метриках.
+    :return: Декоратор.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.observe(operation, time.perf_counter() - started)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+class MetricsSink:
+    """Приёмник метрик."""
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        """Сохраняет снимок метрик.
+
+        :param snapshot: Результат `MetricsRegistry.snapshot()`.
+        """
+        raise NotImplementedError
+
+
+class InMemorySink(MetricsSink):
+    def __init__(self) -> None:
+        """Приёмник, который хранит все выгруженные снимки в памяти."""
+        self.snapshots: List[Dict[str, Any]] = []
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        """Добавляет снимок в список.
+
+        :param snapshot: Снимок метрик.
+        """
+        self.snapshots.append(snapshot)
+
+
+def _write_atomically(path: str, text: str) -> None:
+    """Записывает текст во временный файл и подменяет им целевой.
+
+    :param path: Путь к файлу.
+    :param text: Содержимое.
+    """
+    temp_file = f"{path}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(temp_file, path)
+
+
+class JsonFileSink(MetricsSink):
+    def __init__(self, path: str) -> None:
+        """Приёмник, который сохраняет последний снимок в JSON-файл.
+
+        :param path: Путь к файлу.
+        """
+        self.path = path
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        """Перезаписывает файл снимком метрик.
+
+        :param snapshot: Снимок метрик.
+        """
+        _write_atomically(self.path, json.dumps(snapshot, ensure_ascii=False, indent=4))
+
+
+class PrometheusFileSink(MetricsSink):
+    def __init__(self, path: str, prefix: str = "library_manager") -> None:
+        """Приёмник в текстовом формате Prometheus (например, для textfile collector).
+
+        :param path: Путь к файлу.
+        :param prefix: Префикс имён метрик.
+        """
+        self.path = path
+        self.prefix = prefix
+
+    def render(self, snapshot: Dict[str, Any]) -> str:
+        """Преобразует снимок метрик в текстовый формат Prometheus.
+
+        :param snapshot: Снимок метрик.
+        :return: Текст для записи в файл.
+        """
+        calls = f"{self.prefix}_operation_calls_total"
+        seconds = f"{self.prefix}_operation_seconds"
+        lines = [f"# TYPE {calls} counter"]
+        for operation, count in sorted(snapshot["calls"].items()):
+            lines.append(f'{calls}{{operation="{operation}"}} {count}')
+        lines.append(f"# TYPE {seconds} histogram")
+        for operation, histogram in sorted(snapshot["latency_seconds"].items()):
+            for bound, count in histogram["buckets"].items():
+                lines.append(
+                    f'{seconds}_bucket{{operation="{operation}",le="{bound}"}} {count}'
+                )
+            lines.append(f'{seconds}_sum{{operation="{operation}"}} {histogram["sum"]}')
+            lines.append(
+                f'{seconds}_count{{operation="{operation}"}} {histogram["count"]}'
+            )
+        for direction in ("read", "written"):
+            name = f"{self.prefix}_storage_bytes_{direction}_total"
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {snapshot[f'bytes_{direction}']}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        """Перезаписывает файл снимком метрик.
+
+        :param snapshot: Снимок метрик.
+        """
+        _write_atomically(self.path, self.render(snapshot))
+
+
+def sink_for_path(path: str) -> MetricsSink:
+    """Выбирает приёмник по расширению файла: .prom — Prometheus, иначе JSON.
+
+    :param path: Путь к файлу метрик.
+    :return: Приёмник метрик.
+    """
+    if path.endswith(".prom"):
+        return PrometheusFileSink(path)
+    return JsonFileSink(path)
+
+
+@contextmanager
+def profile_session(mode: Optional[str], output: Optional[str] = None) -> Iterator[None]:
+    """Профилирует выполнение блока с помощью cProfile или tracemalloc.
+
+    В режиме 'cpu' статистика cProfile сохраняется в `output` (если указан) и
+    печатаются 20 самых затратных функций. В режиме 'memory' печатаются 20 мест
+    с наибольшим объёмом выделенной памяти. Без режима блок выполняется как есть.
+
+    :param mode: 'cpu', 'memory' или None.
+    :param output: Файл для сохранения статистики cProfile.
+    """
+    if mode is None:
+        yield
+    elif mode == "cpu":
+        # Профилировщики нужны редко, поэтому импортируются только здесь.
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            if output:
+                profiler.dump_stats(output)
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+    elif mode == "memory":
+        import tracemalloc
+
+        tracemalloc.start()
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            print("Наибольшие выделения памяти:")
+            for stat in snapshot.statistics("lineno")[:20]:
+                print(stat)
+    else:
+        raise ValueError("Режим профилирования может быть только 'cpu' или 'memory'.")
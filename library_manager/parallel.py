@@ -0,0 +1,205 @@
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Tuple
+
+from library_manager.book import Book
+
+# Каталоги меньше этого размера ищутся в основном процессе: передача запроса
+# и результатов между процессами обходится дороже самого поиска.
+PARALLEL_MIN_BOOKS = 50_000
+
+
+def _serve_partition(connection: Connection) -> None:
+    """Цикл рабочего процесса: хранит свою часть каталога и ищет в ней.
+
+    Команды приходят кортежами: ("load", названия, авторы, годы) заменяет
+    часть каталога (названия и авторы — уже в нижнем регистре), ("add",
+    название, автор, год) добавляет книгу в конец части, ("remove", номер)
+    удаляет книгу с этим номером, ("find", запрос) возвращает номера
+    подходящих книг внутри части, ("stop",) завершает процесс.
+
+    :param connection: Канал связи с основным процессом.
+    :return: None
+    """
+    titles: List[str] = []
+    authors: List[str] = []
+    years: List[str] = []
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return
+        command = message[0]
+        if command == "load":
+            titles = message[1]
+            authors = message[2]
+            years = [str(year) for year in message[3]]
+        elif command == "add":
+            titles.append(message[1])
+            authors.append(message[2])
+            years.append(str(message[3]))
+        elif command == "remove":
+            del titles[message[1]], authors[message[1]], years[message[1]]
+        elif command == "find":
+            query = message[1]
+            query_lower = query.lower()
+            connection.send(
+                [
+                    number
+                    for number, (title, author, year) in enumerate(
+                        zip(titles, authors, years)
+                    )
+                    if query_lower in title or query_lower in author or query in year
+                ]
+            )
+        else:
+            connection.close()
+            return
+
+
+class ParallelSearch:
+    def __init__(self, workers: Optional[int] = None) -> None:
+        """Параллельный поиск по каталогу в нескольких процессах.
+
+        Каталог делится на непрерывные части по числу процессов. Каждый процесс
+        получает названия, авторов и годы своей части один раз при `build()` и
+        держит их в памяти, поэтому запрос передаётся в процессы строкой, а
+        обратно приходят только номера найденных книг. Результаты частей
+        склеиваются по порядку, что сохраняет порядок каталога. Условие
+        совпадения то же, что у `LibraryManager.find_books`.
+
+        Добавление и удаление книги (`add`, `remove`) передаются только процессу,
+        которому она принадлежит; новые книги попадают в последнюю часть, как и в
+        конец каталога. Каталог раздаётся заново только при `build()`.
+
+        :param workers: Количество рабочих процессов; по умолчанию — число ядер.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        # Меньшие каталоги владелец поисковика ищет сам.
+        self.min_books = PARALLEL_MIN_BOOKS
+        self.version: Optional[int] = None
+        # Книги каждой части в том же порядке, что и в рабочем процессе.
+        self._parts: List[List[Book]] = []
+        # Номер части, в которой лежит книга, по ID книги.
+        self._owners: Dict[str, int] = {}
+        self._partitions: List[Tuple[Connection, multiprocessing.Process]] = []
+
+    def __enter__(self) -> "ParallelSearch":
+        """Возвращает поисковик для использования в блоке `with`.
+
+        :return: Поисковик.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Останавливает рабочие процессы при выходе из блока."""
+        self.close()
+
+    def _start(self) -> None:
+        """Запускает рабочие процессы, если они ещё не запущены.
+
+        :return: None
+        """
+        if self._partitions:
+            return
+        for _ in range(self.workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve_partition, args=(child,), daemon=True
+            )
+            process.start()
+            child.close()
+            self._partitions.append((parent, process))
+
+    def build(self, books: List[Book], version: Optional[int] = None) -> None:
+        """Раздаёт каталог рабочим процессам.
+
+        :param books: Книги в порядке каталога.
+        :param version: Номер версии каталога, по которому владелец поисковика
+        определяет, что каталог нужно раздать заново.
+        :return: None
+        """
+        self._start()
+        size = -(-len(books) // self.workers)
+        self._parts = []
+        self._owners = {}
+        for number, (connection, _) in enumerate(self._partitions):
+            part = books[number * size:(number + 1) * size]
+            connection.send(
+                (
+                    "load",
+                    [book.title_key for book in part],
+                    [book.author_key for book in part],
+                    [book.year for book in part],
+                )
+            )
+            self._parts.append(part)
+            self._owners.update((book.id, number) for book in part)
+        self.version = version
+
+    def add(self, book: Book, version: Optional[int] = None) -> None:
+        """Добавляет книгу в конец каталога, не раздавая его заново.
+
+        :param book: Новая книга.
+        :param version: Номер версии каталога после добавления.
+        :return: None
+        """
+        number = len(self._partitions) - 1
+        self._partitions[number][0].send(
+            ("add", book.title_key, book.author_key, book.year)
+        )
+        self._parts[number].append(book)
+        self._owners[book.id] = number
+        self.version = version
+
+    def remove(self, book: Book, version: Optional[int] = None) -> None:
+        """Удаляет книгу из части, которой она принадлежит.
+
+        :param book: Удаляемая книга.
+        :param version: Номер версии каталога после удаления.
+        :return: None
+        """
+        number = self._owners.pop(book.id, None)
+        if number is not None:
+            part = self._parts[number]
+            position = next(
+                position
+                for position, current in enumerate(part)
+                if current.id == book.id
+            )
+            self._partitions[number][0].send(("remove", position))
+            del part[position]
+        self.version = version
+
+    def find(self, query: str) -> List[Book]:
+        """Ищет книги по названию, автору или году во всех частях каталога.
+
+        :param query: Строка для поиска.
+        :return: Список найденных книг в порядке каталога.
+        """
+        for connection, _ in self._partitions:
+            connection.send(("find", query))
+        found = []
+        for part, (connection, _) in zip(self._parts, self._partitions):
+            found.extend(part[number] for number in connection.recv())
+        return found
+
+    def close(self) -> None:
+        """Останавливает рабочие процессы.
+
+        :return: None
+        """
+        for connection, process in self._partitions:
+            try:
+                connection.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._partitions = []
+        self._parts = []
+        self._owners = {}
+        self.version = None
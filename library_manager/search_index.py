@@ -0,0 +1,416 @@
+import bisect
+import heapq
+import math
+import re
+from array import array
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from library_manager.book import Book
+
+_WORD = re.compile(r"\w+")
+
+# Сколько различных авторов FuzzyIndex помнит вместе с их триграммами.
+AUTHOR_GRAMS_CACHE_SIZE = 10_000
+
+# Ключ книги в индексе по годам: год * _POSITION_LIMIT + порядковый номер книги,
+# поэтому книги одного года идут в порядке добавления.
+_POSITION_LIMIT = 1 << 40
+
+
+def get_ngrams(text: str, n: int) -> Set[str]:
+    """Возвращает множество n-грамм строки.
+
+    :param text: Исходная строка.
+    :param n: Длина n-граммы.
+    :return: Множество подстрок длины n.
+    """
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def fold_text(text: str) -> str:
+    """Приводит текст к виду для нечёткого сравнения: без регистра, ё → е.
+
+    :param text: Исходная строка.
+    :return: Нормализованная строка.
+    """
+    return text.casefold().replace("ё", "е")
+
+
+def get_trigrams(text: str) -> Set[str]:
+    """Возвращает триграммы слов нормализованного текста.
+
+    Каждое слово дополняется двумя пробелами в начале и одним в конце, поэтому
+    начало слова весит больше, а короткие слова тоже дают триграммы.
+
+    :param text: Исходная строка.
+    :return: Множество триграмм.
+    """
+    grams: Set[str] = set()
+    for word in _WORD.findall(fold_text(text)):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NgramIndex:
+    def __init__(self, books: Iterable[Book] = (), n: int = 3) -> None:
+        """Инвертированный индекс n-грамм по названию и автору книг.
+
+        Индекс только сужает множество кандидатов для поиска подстроки:
+        окончательная проверка выполняется вызывающим кодом, поэтому результаты
+        совпадают с полным перебором.
+
+        :param books: Книги, по которым строится индекс.
+        :param n: Длина n-граммы.
+        """
+        self.n = n
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._short: Set[str] = set()
+        self._years: Dict[int, Set[str]] = defaultdict(set)
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        for book in books:
+            self.add(book)
+
+    def _field_grams(self, book: Book) -> Set[str]:
+        """Возвращает n-граммы названия и автора книги в нижнем регистре.
+
+        :param book: Книга.
+        :return: Объединённое множество n-грамм.
+        """
+        grams: Set[str] = set()
+        for text in (book.title.lower(), book.author.lower()):
+            grams |= get_ngrams(text, self.n)
+        return grams
+
+    def _is_short(self, book: Book) -> bool:
+        """Проверяет, короче ли название или автор книги длины n-граммы.
+
+        :param book: Книга.
+        :return: True, если хотя бы одно поле не даёт ни одной n-граммы.
+        """
+        return (
+            len(book.title.lower()) < self.n or len(book.author.lower()) < self.n
+        )
+
+    def add(self, book: Book) -> None:
+        """Добавляет книгу в индекс.
+
+        :param book: Книга.
+        """
+        for gram in self._field_grams(book):
+            self._postings[gram].add(book.id)
+        if self._is_short(book):
+            self._short.add(book.id)
+        self._years[book.year].add(book.id)
+        self._positions[book.id] = self._next_position
+        self._next_position += 1
+
+    def remove(self, book: Book) -> None:
+        """Удаляет книгу из индекса.
+
+        :param book: Книга.
+        """
+        for gram in self._field_grams(book):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(book.id)
+                if not postings:
+                    del self._postings[gram]
+        self._short.discard(book.id)
+        year_ids = self._years.get(book.year)
+        if year_ids is not None:
+            year_ids.discard(book.id)
+            if not year_ids:
+                del self._years[book.year]
+        self._positions.pop(book.id, None)
+
+    def candidates(self, query: str) -> List[str]:
+        """Возвращает ID книг, которые могут содержать запрос.
+
+        Для запросов не короче n пересекаются списки всех n-грамм запроса. Более
+        короткие запросы объединяют списки n-грамм, содержащих запрос, и книги с
+        полями короче n. Совпадения по году ищутся среди различных годов каталога.
+
+        :param query: Строка поиска.
+        :return: Список ID в порядке добавления книг.
+        """
+        query_lower = query.lower()
+        ids: Set[str] = set()
+        if len(query_lower) >= self.n:
+            postings = [
+                self._postings.get(gram, set())
+                for gram in get_ngrams(query_lower, self.n)
+            ]
+            postings.sort(key=len)
+            if postings:
+                ids = set(postings[0]).intersection(*postings[1:])
+        else:
+            for gram, gram_ids in self._postings.items():
+                if query_lower in gram:
+                    ids |= gram_ids
+            ids |= self._short
+
+        for year, year_ids in self._years.items():
+            if query in str(year):
+                ids |= year_ids
+        return sorted(ids, key=self._positions.__getitem__)
+
+
+class YearIndex:
+    def __init__(self, books: Iterable[Book] = ()) -> None:
+        """Отсортированный индекс книг по году издания.
+
+        Ключи (год и порядковый номер) и ID книг хранятся в двух параллельных
+        списках, отсортированных по ключу, поэтому поиск года или диапазона лет
+        выполняется двоичным поиском за O(log n + k). Книги, добавленные до
+        первого запроса (например, при загрузке каталога), дописываются в конец
+        и сортируются один раз.
+
+        :param books: Книги, по которым строится индекс.
+        """
+        self._keys: List[int] = []
+        self._ids: List[str] = []
+        self._sorted = False
+        self._next_position = 0
+        for book in books:
+            self.add(book)
+
+    def _sort(self) -> None:
+        """Сортирует ключи, если после загрузки ещё не было запросов.
+
+        :return: None
+        """
+        if self._sorted:
+            return
+        order = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+        self._keys = [self._keys[index] for index in order]
+        self._ids = [self._ids[index] for index in order]
+        self._sorted = True
+
+    def _bounds(self, start: int, end: int) -> Tuple[int, int]:
+        """Находит границы диапазона лет в отсортированных списках.
+
+        :param start: Первый год диапазона.
+        :param end: Последний год диапазона.
+        :return: Индексы первой книги диапазона и следующей за последней.
+        """
+        self._sort()
+        return (
+            bisect.bisect_left(self._keys, start * _POSITION_LIMIT),
+            bisect.bisect_left(self._keys, (end + 1) * _POSITION_LIMIT),
+        )
+
+    def add(self, book: Book) -> None:
+        """Добавляет книгу в индекс.
+
+        :param book: Книга.
+        """
+        key = book.year * _POSITION_LIMIT + self._next_position
+        self._next_position += 1
+        if self._sorted:
+            index = bisect.bisect_right(self._keys, key)
+            self._keys.insert(index, key)
+            self._ids.insert(index, book.id)
+        else:
+            self._keys.append(key)
+            self._ids.append(book.id)
+
+    def remove(self, book: Book) -> None:
+        """Удаляет книгу из индекса.
+
+        :param book: Книга.
+        """
+        low, high = self._bounds(book.year, book.year)
+        try:
+            index = self._ids.index(book.id, low, high)
+        except ValueError:
+            return
+        del self._keys[index]
+        del self._ids[index]
+
+    def find_range(self, start: int, end: int) -> List[str]:
+        """Возвращает ID книг, изданных в диапазоне лет включительно.
+
+        :param start: Первый год диапазона.
+        :param end: Последний год диапазона.
+        :return: Список ID, упорядоченный по году и порядку добавления.
+        """
+        low, high = self._bounds(start, end)
+        return self._ids[low:high]
+
+
+def normalize_author(author: str) -> str:
+    """Приводит имя автора к ключу словаря авторов.
+
+    Регистр, буквы ё/е и лишние пробелы не учитываются.
+
+    :param author: Имя автора.
+    :return: Нормализованное имя.
+    """
+    return " ".join(fold_text(author).split())
+
+
+class AuthorIndex:
+    def __init__(self, books: Iterable[Book] = ()) -> None:
+        """Словарь авторов с книгами каждого автора.
+
+        На каждого автора приходится одна запись с нормализованным ключом (без
+        учёта регистра, ё/е и лишних пробелов), каноническим именем (как оно
+        записано у первой добавленной книги) и ID его книг в порядке
+        добавления. Поэтому все книги автора находятся одним обращением к
+        словарю.
+
+        :param books: Книги, по которым строится индекс.
+        """
+        self._names: Dict[str, str] = {}
+        # Для каждого автора — словарь ID его книг (без значений): он сохраняет
+        # порядок и позволяет удалить книгу за O(1).
+        self._books: Dict[str, Dict[str, None]] = {}
+        for book in books:
+            self.add(book)
+
+    def __len__(self) -> int:
+        """Количество авторов.
+
+        :return: Количество авторов, у которых есть книги.
+        """
+        return len(self._books)
+
+    def add(self, book: Book) -> None:
+        """Добавляет книгу к её автору.
+
+        :param book: Книга.
+        """
+        key = normalize_author(book.author)
+        ids = self._books.get(key)
+        if ids is None:
+            ids = self._books[key] = {}
+            self._names[key] = book.author
+        ids[book.id] = None
+
+    def remove(self, book: Book) -> None:
+        """Удаляет книгу; автор без книг удаляется из словаря.
+
+        :param book: Книга.
+        """
+        key = normalize_author(book.author)
+        ids = self._books.get(key)
+        if ids is None:
+            return
+        ids.pop(book.id, None)
+        if not ids:
+            del self._books[key]
+            del self._names[key]
+
+    def find(self, author: str) -> List[str]:
+        """Возвращает ID книг автора.
+
+        :param author: Имя автора в любом регистре, с ё или е.
+        :return: Список ID в порядке добавления книг.
+        """
+        return list(self._books.get(normalize_author(author), ()))
+
+    def canonical_name(self, author: str) -> Optional[str]:
+        """Возвращает имя автора так, как оно записано в каталоге.
+
+        :param author: Имя автора в любом регистре, с ё или е.
+        :return: Каноническое имя или None, если такого автора нет.
+        """
+        return self._names.get(normalize_author(author))
+
+
+class FuzzyIndex:
+    def __init__(self, books: Iterable[Book] = ()) -> None:
+        """Триграммный индекс для нечёткого поиска по названию и автору.
+
+        Книги нумеруются по порядку добавления, списки триграмм хранят номера
+        книг в компактных массивах. Удалённые книги только помечаются, поэтому
+        удаление не перестраивает списки.
+
+        :param books: Книги, по которым строится индекс.
+        """
+        self._postings: Dict[str, array] = {}
+        self._ids: List[Optional[str]] = []
+        self._sizes = array("H")
+        self._positions: Dict[str, int] = {}
+        self._author_grams: Dict[str, FrozenSet[str]] = {}
+        for book in books:
+            self.add(book)
+
+    def _get_author_grams(self, author: str) -> FrozenSet[str]:
+        """Возвращает триграммы автора; авторы повторяются, поэтому они кешируются.
+
+        :param author: Имя автора.
+        :return: Множество триграмм.
+        """
+        grams = self._author_grams.get(author)
+        if grams is None:
+            if len(self._author_grams) >= AUTHOR_GRAMS_CACHE_SIZE:
+                self._author_grams.clear()
+            grams = self._author_grams[author] = frozenset(get_trigrams(author))
+        return grams
+
+    def add(self, book: Book) -> None:
+        """Добавляет книгу в индекс.
+
+        :param book: Книга.
+        """
+        position = len(self._ids)
+        grams = get_trigrams(book.title) | self._get_author_grams(book.author)
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array("I")
+            postings.append(position)
+        self._ids.append(book.id)
+        self._sizes.append(min(len(grams), 0xFFFF))
+        self._positions[book.id] = position
+
+    def remove(self, book: Book) -> None:
+        """Удаляет книгу из индекса.
+
+        :param book: Книга.
+        """
+        position = self._positions.pop(book.id, None)
+        if position is not None:
+            self._ids[position] = None
+
+    def search(
+        self, query: str, limit: int = 10, min_score: float = 0.5
+    ) -> List[Tuple[str, float]]:
+        """Находит книги, больше всего похожие на запрос.
+
+        Оценка — доля триграмм запроса, найденных в названии или авторе книги.
+        При равной оценке выше книга, в тексте которой запрос занимает большую
+        часть, затем — добавленная раньше. Лучшие `limit` книг отбираются
+        ограниченной кучей, без сортировки всех кандидатов.
+
+        :param query: Строка поиска.
+        :param limit: Максимальное количество результатов.
+        :param min_score: Минимальная оценка от 0 до 1.
+        :return: Список пар (ID книги, оценка) по убыванию оценки.
+        """
+        query_grams = get_trigrams(query)
+        if not query_grams or limit <= 0:
+            return []
+        matches: Counter = Counter()
+        for gram in query_grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                matches.update(postings)
+        total = len(query_grams)
+        needed = max(1, math.ceil(min_score * total - 1e-9))
+        ids, sizes = self._ids, self._sizes
+        scored = (
+            (matched / total, matched / sizes[position], -position)
+            for position, matched in matches.items()
+            if matched >= needed and ids[position] is not None
+        )
+        results = []
+        for score, _, negative_position in heapq.nlargest(limit, scored):
+            book_id = ids[-negative_position]
+            assert book_id is not None
+            results.append((book_id, score))
+        return results
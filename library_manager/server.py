@@ -0,0 +1,298 @@
+"""HTTP-сервер с JSON API поверх одного каталога в памяти.
+
+Терминалы выдачи обращаются к одному процессу вместо того, чтобы каждый
+загружал каталог сам. Запросы обслуживает пул потоков; поиск и чтение идут
+параллельно под блокировкой чтения, изменения выполняются по одному под
+блокировкой записи.
+
+Методы API:
+
+    GET    /books?q=запрос&limit=20&offset=0   поиск книг (без q — все книги)
+    GET    /books/<id>                          книга по ID
+    POST   /books                               добавление: {"title", "author", "year"}
+    DELETE /books/<id>                          удаление
+    PUT    /books/<id>/status                   смена статуса: {"status"}
+
+Ответ — JSON-объект с полем book или books, при ошибке — с полем error и
+кодом 400 (некорректный запрос) или 404 (книга не найдена). Поиск отдаёт не
+больше `MAX_PAGE_SIZE` книг за запрос, по умолчанию `PAGE_SIZE`; запрос должен
+содержать хотя бы два символа.
+
+Запуск: python main.py --serve 8080 [--host 127.0.0.1]
+"""
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from library_manager.batch import execute_command
+from library_manager.manager import MIN_QUERY_LENGTH, LibraryManager
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+# Количество потоков, которые одновременно обрабатывают запросы.
+SERVER_WORKERS = 16
+# Максимальный размер тела запроса в байтах.
+MAX_BODY_BYTES = 64 * 1024
+# Сколько книг отдаёт поиск без параметра limit и сколько — не больше.
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class ReadWriteLock:
+    def __init__(self) -> None:
+        """Блокировка с раздельным доступом для чтения и записи.
+
+        Читателей может быть сколько угодно одновременно, писатель работает
+        один. Ожидающий писатель не пропускает новых читателей вперёд, поэтому
+        поток поисковых запросов не может бесконечно откладывать изменения.
+        """
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Блок, выполняемый под блокировкой чтения.
+
+        :return: Контекстный менеджер.
+        """
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Блок, выполняемый под блокировкой записи.
+
+        :return: Контекстный менеджер.
+        """
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class LibraryHTTPServer(HTTPServer):
+    def __init__(
+        self,
+        manager: LibraryManager,
+        address: Tuple[str, int] = (DEFAULT_HOST, DEFAULT_PORT),
+        workers: int = SERVER_WORKERS,
+    ) -> None:
+        """HTTP-сервер, который обрабатывает запросы в пуле потоков.
+
+        :param manager: Менеджер библиотеки с загруженным каталогом.
+        :param address: Пара (хост, порт); порт 0 — выбрать свободный.
+        :param workers: Количество потоков обработки запросов.
+        """
+        super().__init__(address, LibraryRequestHandler)
+        self.manager = manager
+        self.lock = ReadWriteLock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="library-http"
+        )
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Передаёт соединение в пул потоков.
+
+        :param request: Сокет соединения.
+        :param client_address: Адрес клиента.
+        :return: None
+        """
+        self._executor.submit(self._process, request, client_address)
+
+    def _process(self, request: Any, client_address: Any) -> None:
+        """Обрабатывает соединение в потоке пула.
+
+        :param request: Сокет соединения.
+        :param client_address: Адрес клиента.
+        :return: None
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        """Дожидается обработки начатых запросов и закрывает сокет.
+
+        :return: None
+        """
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+
+class LibraryRequestHandler(BaseHTTPRequestHandler):
+    server: LibraryHTTPServer
+    protocol_version = "HTTP/1.1"
+    # Простаивающее соединение закрывается, чтобы не занимать поток пула.
+    timeout = 5
+    # Заголовки и тело ответа уходят одной записью в сокет. Без буфера они
+    # отправляются отдельными пакетами, и на соединении keep-alive каждый ответ
+    # ждёт подтверждения около 40 мс (алгоритм Нейгла и отложенный ACK).
+    wbufsize = -1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Не выводит журнал запросов: он замедляет сервер под нагрузкой."""
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        """Отправляет ответ в формате JSON.
+
+        :param status: Код ответа HTTP.
+        :param payload: Тело ответа.
+        :return: None
+        """
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+
+    def _read_json(self) -> Dict[str, Any]:
+        """Читает тело запроса в формате JSON.
+
+        :return: Объект из тела запроса.
+        :raises ValueError: Если тело слишком большое или не является объектом JSON.
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError("Слишком большое тело запроса.")
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(payload, dict):
+            raise ValueError("Тело запроса должно быть объектом JSON.")
+        return payload
+
+    def _route(self, method: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """Сопоставляет запрос с командой менеджера.
+
+        :param method: Метод HTTP.
+        :return: Пара (команда, изменяет ли она каталог) или None, если такого
+        метода API нет.
+        :raises ValueError: Если тело запроса, поисковый запрос или размер
+        страницы некорректны.
+        """
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.split("/") if part]
+        if not parts or parts[0] != "books":
+            return None
+        if method == "GET" and len(parts) == 1:
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            text = query.get("q", "").strip()
+            if text and len(text) < MIN_QUERY_LENGTH:
+                raise ValueError(
+                    f"Запрос должен содержать хотя бы {MIN_QUERY_LENGTH} символа."
+                )
+            command = {
+                "op": "find",
+                "query": text,
+                "limit": min(int(query.get("limit", PAGE_SIZE)), MAX_PAGE_SIZE),
+            }
+            if "offset" in query:
+                command["offset"] = query["offset"]
+            return command, False
+        if method == "GET" and len(parts) == 2:
+            return {"op": "get", "id": parts[1]}, False
+        if method == "POST" and len(parts) == 1:
+            return dict(self._read_json(), op="add"), True
+        if method == "DELETE" and len(parts) == 2:
+            return {"op": "remove", "id": parts[1]}, True
+        if method == "PUT" and len(parts) == 3 and parts[2] == "status":
+            return dict(self._read_json(), op="set-status", id=parts[1]), True
+        return None
+
+    def _handle(self, method: str) -> None:
+        """Выполняет запрос под нужной блокировкой и отправляет ответ.
+
+        :param method: Метод HTTP.
+        :return: None
+        """
+        try:
+            route = self._route(method)
+            if route is None:
+                # Тело запроса не прочитано: следующий запрос на этом соединении
+                # начался бы с него.
+                self.close_connection = True
+                self._send_json(404, {"error": "Неизвестный метод API."})
+                return
+            command, mutates = route
+            lock = self.server.lock
+            with lock.write_locked() if mutates else lock.read_locked():
+                result = execute_command(self.server.manager, command)
+        except KeyError as e:
+            self._send_json(404, {"error": str(e.args[0])})
+            return
+        except (ValueError, TypeError) as e:
+            # Тело запроса могло остаться непрочитанным.
+            self.close_connection = True
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(201 if command["op"] == "add" else 200, result)
+
+    def do_GET(self) -> None:
+        """Обрабатывает запрос GET."""
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        """Обрабатывает запрос POST."""
+        self._handle("POST")
+
+    def do_PUT(self) -> None:
+        """Обрабатывает запрос PUT."""
+        self._handle("PUT")
+
+    def do_DELETE(self) -> None:
+        """Обрабатывает запрос DELETE."""
+        self._handle("DELETE")
+
+
+def serve(
+    storage_file: str,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = SERVER_WORKERS,
+) -> None:
+    """Загружает каталог и обслуживает запросы до прерывания (Ctrl+C).
+
+    :param storage_file: Путь к файлу или адрес хранилища.
+    :param host: Адрес, на котором принимаются соединения.
+    :param port: Порт.
+    :param workers: Количество потоков обработки запросов.
+    :return: None
+    """
+    manager = LibraryManager(storage_file)
+    server = LibraryHTTPServer(manager, (host, port), workers)
+    print(f"Сервер библиотеки запущен: http://{host}:{server.server_port}/books")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Остановка сервера...")
+    finally:
+        server.server_close()
+        manager.close()
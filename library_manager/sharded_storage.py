@@ -0,0 +1,237 @@
+import json
+import os
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from library_manager.book import Book
+from library_manager.metrics import metrics
+from library_manager.storage import (
+    SHARD_MANIFEST,
+    Change,
+    JsonStorage,
+    book_from_record,
+    migrate_storage,
+    read_generation,
+)
+
+DEFAULT_SHARD_COUNT = 16
+# Максимальное количество потоков, которые одновременно читают шарды.
+LOAD_WORKERS = 8
+
+
+def shard_for(book_id: str, shard_count: int) -> int:
+    """Возвращает номер шарда, в котором хранится книга.
+
+    :param book_id: Идентификатор книги.
+    :param shard_count: Количество шардов.
+    :return: Номер шарда от 0 до shard_count - 1.
+    """
+    return zlib.crc32(book_id.encode("utf-8")) % shard_count
+
+
+class ShardedStorage(JsonStorage):
+    incremental = True
+
+    def __init__(self, directory: str, shard_count: int = DEFAULT_SHARD_COUNT) -> None:
+        """Хранилище каталога в каталоге из нескольких JSON-файлов (шардов).
+
+        Книга попадает в шард по crc32 своего ID, поэтому изменение одной книги
+        перезаписывает только её шард. Порядок каталога сохраняется в поле seq
+        каждой записи. Список файлов шардов хранится в manifest.json: изменённые
+        шарды записываются в новые файлы, после чего манифест атомарно
+        подменяется, так что читатель всегда видит согласованный набор шардов.
+        Блокировка и номер поколения работают так же, как у JSON-хранилища.
+
+        :param directory: Каталог с шардами и манифестом.
+        :param shard_count: Количество шардов для нового хранилища; у
+        существующего берётся из манифеста.
+        """
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(os.path.join(directory, SHARD_MANIFEST))
+        self.directory = directory
+        self.shard_count = shard_count
+        self._files: List[Optional[str]] = [None] * shard_count
+        self._shards: List[Dict[str, Tuple[int, Book]]] = [
+            {} for _ in range(shard_count)
+        ]
+        self._next_seq = 0
+
+    def _read_manifest(self) -> None:
+        """Читает из манифеста количество шардов и имена их файлов.
+
+        :return: None
+        """
+        try:
+            with open(self.storage_file, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            self._files = [None] * self.shard_count
+            self._next_seq = 0
+            return
+        self.shard_count = manifest["shard_count"]
+        self._files = manifest["files"]
+        self._next_seq = manifest["next_seq"]
+
+    def _write_manifest(self) -> None:
+        """Атомарно перезаписывает манифест.
+
+        :return: None
+        """
+        manifest = {
+            "shard_count": self.shard_count,
+            "files": self._files,
+            "next_seq": self._next_seq,
+        }
+        temp_file = f"{self.storage_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.storage_file)
+
+    def _read_shard(self, file_name: Optional[str]) -> List[Tuple[int, Book]]:
+        """Читает записи одного шарда.
+
+        :param file_name: Имя файла шарда или None, если шард ещё не записывался.
+        :return: Список пар (порядковый номер, книга).
+        """
+        if file_name is None:
+            return []
+        path = os.path.join(self.directory, file_name)
+        with open(path, encoding="utf-8") as file:
+            records = json.load(file)
+        if metrics.enabled:
+            metrics.add_bytes_read(os.path.getsize(path))
+        return [(record.pop("seq"), book_from_record(record)) for record in records]
+
+    def _write_shard(self, index: int) -> None:
+        """Записывает шард в новый файл с номером текущего поколения.
+
+        :param index: Номер шарда.
+        :return: None
+        """
+        entries = sorted(self._shards[index].values(), key=itemgetter(0))
+        records = [dict(book.to_dict(), seq=seq) for seq, book in entries]
+        file_name = f"shard-{index:03d}-{self.generation}.json"
+        path = os.path.join(self.directory, file_name)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(records, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        if metrics.enabled:
+            metrics.add_bytes_written(os.path.getsize(path))
+        self._files[index] = file_name
+
+    def _commit(self, dirty: Iterable[int]) -> None:
+        """Записывает изменённые шарды, манифест и удаляет устаревшие файлы.
+
+        Файлы, на которые не ссылается манифест, остаются после прерванной
+        записи или от прежних версий шардов и удаляются.
+
+        :param dirty: Номера изменённых шардов.
+        :return: None
+        """
+        for index in sorted(dirty):
+            self._write_shard(index)
+        self._write_manifest()
+        current = set(self._files)
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith("shard-") and file_name not in current:
+                os.remove(os.path.join(self.directory, file_name))
+
+    def load(self) -> List[Book]:
+        """Параллельно читает все шарды и восстанавливает порядок каталога.
+
+        :return: Список книг в порядке добавления.
+        """
+        with self.lock():
+            self.generation = read_generation(self.storage_file)
+            self._read_manifest()
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(LOAD_WORKERS, self.shard_count))
+            ) as pool:
+                shards = list(pool.map(self._read_shard, self._files))
+        self._shards = [{book.id: (seq, book) for seq, book in shard} for shard in shards]
+        entries = sorted(
+            (entry for shard in shards for entry in shard), key=itemgetter(0)
+        )
+        return [book for _, book in entries]
+
+    def iter_books(self) -> Iterator[Book]:
+        """Загружает каталог целиком.
+
+        Порядок книг известен только после чтения всех шардов, поэтому отдавать
+        их по одной во время чтения нельзя.
+
+        :return: Итератор книг.
+        """
+        return iter(self.load())
+
+    def save_all(self, books: Iterable[Book]) -> None:
+        """Перераспределяет все книги по шардам и перезаписывает их.
+
+        :param books: Все книги каталога.
+        :return: None
+        """
+        with self.lock():
+            self._bump_generation()
+            self._shards = [{} for _ in range(self.shard_count)]
+            self._files = [None] * self.shard_count
+            self._next_seq = 0
+            for book in books:
+                self._shards[shard_for(book.id, self.shard_count)][book.id] = (
+                    self._next_seq,
+                    book,
+                )
+                self._next_seq += 1
+            self._commit(range(self.shard_count))
+
+    def apply(self, changes: List[Change]) -> None:
+        """Применяет изменения и перезаписывает только затронутые ими шарды.
+
+        Изменение статуса книги, которой нет в хранилище (её удалил другой
+        процесс), пропускается, как и в JSON-хранилище.
+
+        :param changes: Список пар (операция, книга).
+        :return: None
+        """
+        with self.lock():
+            self._bump_generation()
+            dirty: Set[int] = set()
+            for operation, book in changes:
+                index = shard_for(book.id, self.shard_count)
+                shard = self._shards[index]
+                entry = shard.get(book.id)
+                if operation == "remove":
+                    shard.pop(book.id, None)
+                elif entry is not None:
+                    shard[book.id] = (entry[0], book)
+                elif operation == "add":
+                    shard[book.id] = (self._next_seq, book)
+                    self._next_seq += 1
+                else:
+                    continue
+                dirty.add(index)
+            self._commit(dirty)
+
+
+def main() -> None:
+    """Переносит каталог в шардированное хранилище или обратно.
+
+    Запуск: python -m library_manager.sharded_storage data/books.json shards://data/books
+    """
+    if len(sys.argv) != 3:
+        print(
+            "Использование: python -m library_manager.sharded_storage "
+            "<исходное хранилище> <целевое хранилище>"
+        )
+        sys.exit(1)
+    count = migrate_storage(sys.argv[1], sys.argv[2])
+    print(f"Перенесено книг: {count}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""Двоичный снимок каталога для быстрого запуска.
+
+Формат файла (все числа в little-endian):
+
+- заголовок: сигнатура `LIBSNAP1` и количество книг;
+- таблица записей фиксированной длины в порядке каталога: смещения и длины
+  ID, названия и автора в пуле строк, год и номер статуса;
+- таблица номеров записей, отсортированная по ID, для двоичного поиска;
+- пул строк в UTF-8; одинаковые строки (например, авторы) хранятся один раз.
+
+Файл открывается через `mmap`, поэтому книгу по ID можно найти, а названия
+просмотреть, не разбирая весь файл и не создавая объекты Book для всех книг.
+
+Преобразование между JSON и снимком в обе стороны:
+    python -m library_manager.snapshot data/books.json data/books.snap
+    python -m library_manager.snapshot data/books.snap data/books.json
+"""
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from library_manager.book import STATUSES, Book
+from library_manager.metrics import metrics, timed
+from library_manager.storage import JsonStorage, migrate_storage, read_generation
+
+_MAGIC = b"LIBSNAP1"
+_HEADER = struct.Struct("<8sI")
+# Смещение и длина ID, названия и автора, год, номер статуса.
+_RECORD = struct.Struct("<6IiB3x")
+_INDEX = struct.Struct("<I")
+# Количество записей, которые разбираются за один проход при переборе снимка.
+_CHUNK_RECORDS = 4096
+
+
+@timed("write_snapshot")
+def write_snapshot(books: Iterable[Book], path: str) -> int:
+    """Атомарно сохраняет книги в двоичный снимок.
+
+    :param books: Книги в порядке каталога.
+    :param path: Путь к файлу снимка.
+    :return: Количество сохранённых книг.
+    """
+    pool = bytearray()
+    strings: Dict[str, Tuple[int, int]] = {}
+    records = bytearray()
+    ids: List[Tuple[bytes, int]] = []
+
+    def add_string(text: str) -> Tuple[int, int]:
+        reference = strings.get(text)
+        if reference is None:
+            encoded = text.encode("utf-8")
+            reference = strings[text] = (len(pool), len(encoded))
+            pool.extend(encoded)
+        return reference
+
+    for number, book in enumerate(books):
+        book_id = book.id
+        records += _RECORD.pack(
+            *add_string(book_id),
+            *add_string(book.title),
+            *add_string(book.author),
+            book.year,
+            STATUSES.index(book.status),
+        )
+        ids.append((book_id.encode("utf-8"), number))
+    ids.sort()
+
+    temp_file = f"{path}.tmp"
+    with open(temp_file, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, len(ids)))
+        file.write(records)
+        file.write(b"".join(_INDEX.pack(number) for _, number in ids))
+        file.write(pool)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_file, path)
+    if metrics.enabled:
+        metrics.add_bytes_written(os.path.getsize(path))
+    return len(ids)
+
+
+class Snapshot:
+    def __init__(self, path: str) -> None:
+        """Открывает двоичный снимок каталога только для чтения.
+
+        :param path: Путь к файлу снимка.
+        :raises ValueError: Если файл не является снимком каталога.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл {path} не является снимком каталога.") from None
+        if len(self._data) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Файл {path} не является снимком каталога.")
+        magic, self._count = _HEADER.unpack_from(self._data)
+        self._index_offset = _HEADER.size + self._count * _RECORD.size
+        self._pool_offset = self._index_offset + self._count * _INDEX.size
+        if magic != _MAGIC or len(self._data) < self._pool_offset:
+            self.close()
+            raise ValueError(f"Файл {path} не является снимком каталога.")
+        if metrics.enabled:
+            metrics.add_bytes_read(len(self._data))
+
+    def __enter__(self) -> "Snapshot":
+        """Возвращает снимок для использования в блоке `with`.
+
+        :return: Снимок.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Закрывает снимок при выходе из блока."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Количество книг в снимке.
+
+        :return: Количество книг.
+        """
+        return self._count
+
+    def __iter__(self) -> Iterator[Book]:
+        """Перебирает книги в порядке каталога, создавая их по одной.
+
+        Записи разбираются блоками, а имена авторов, которые повторяются,
+        декодируются по одному разу.
+
+        :return: Итератор книг.
+        """
+        data = self._data
+        pool = self._pool_offset
+        authors: Dict[int, str] = {}
+        for start in range(0, self._count, _CHUNK_RECORDS):
+            stop = min(start + _CHUNK_RECORDS, self._count)
+            chunk = data[
+                _HEADER.size + start * _RECORD.size:_HEADER.size + stop * _RECORD.size
+            ]
+            for (
+                id_offset, id_length, title_offset, title_length,
+                author_offset, author_length, year, status,
+            ) in _RECORD.iter_unpack(chunk):
+                author = authors.get(author_offset)
+                if author is None:
+                    author = authors[author_offset] = data[
+                        pool + author_offset:pool + author_offset + author_length
+                    ].decode("utf-8")
+                title_start = pool + title_offset
+                id_start = pool + id_offset
+                yield Book(
+                    data[title_start:title_start + title_length].decode("utf-8"),
+                    author,
+                    year,
+                    STATUSES[status],
+                    id=data[id_start:id_start + id_length].decode("utf-8"),
+                )
+
+    def _record(self, number: int) -> tuple:
+        """Читает запись фиксированной длины.
+
+        :param number: Номер записи в порядке каталога.
+        :return: Поля записи.
+        """
+        return _RECORD.unpack_from(self._data, _HEADER.size + number * _RECORD.size)
+
+    def _bytes(self, offset: int, length: int) -> bytes:
+        """Читает строку из пула без декодирования.
+
+        :param offset: Смещение строки от начала пула.
+        :param length: Длина строки в байтах.
+        :return: Байты строки.
+        """
+        start = self._pool_offset + offset
+        return self._data[start:start + length]
+
+    def _string(self, offset: int, length: int) -> str:
+        """Читает строку из пула.
+
+        :param offset: Смещение строки от начала пула.
+        :param length: Длина строки в байтах.
+        :return: Строка.
+        """
+        return self._bytes(offset, length).decode("utf-8")
+
+    def book(self, number: int) -> Book:
+        """Создаёт книгу из записи снимка.
+
+        :param number: Номер записи в порядке каталога.
+        :return: Объект Book.
+        """
+        (
+            id_offset, id_length, title_offset, title_length,
+            author_offset, author_length, year, status,
+        ) = self._record(number)
+        return Book(
+            self._string(title_offset, title_length),
+            self._string(author_offset, author_length),
+            year,
+            STATUSES[status],
+            id=self._string(id_offset, id_length),
+        )
+
+    def lookup(self, book_id: str) -> Optional[Book]:
+        """Ищет книгу по ID двоичным поиском по отсортированной таблице.
+
+        Читаются только записи, через которые проходит поиск.
+
+        :param book_id: Идентификатор книги.
+        :return: Книга или None, если её нет.
+        """
+        key = book_id.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (number,) = _INDEX.unpack_from(
+                self._data, self._index_offset + middle * _INDEX.size
+            )
+            id_offset, id_length = self._record(number)[:2]
+            current = self._bytes(id_offset, id_length)
+            if current == key:
+                return self.book(number)
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def find(self, query: str) -> Iterator[Book]:
+        """Ищет книги по названию, автору или году так же, как `find_books`.
+
+        Из пула декодируются только поля, нужные для проверки, причём каждый
+        автор — один раз; объект Book создаётся лишь для найденных книг.
+
+        :param query: Строка для поиска.
+        :return: Итератор найденных книг в порядке каталога.
+        """
+        query_lower = query.lower()
+        check_year = query.isdigit()
+        # Совпадение запроса с автором по смещению его имени в пуле строк.
+        authors: Dict[int, bool] = {}
+        for number in range(self._count):
+            record = self._record(number)
+            author_matches = authors.get(record[4])
+            if author_matches is None:
+                author_matches = authors[record[4]] = (
+                    query_lower in self._string(record[4], record[5]).lower()
+                )
+            if (
+                author_matches
+                or query_lower in self._string(record[2], record[3]).lower()
+                or (check_year and query in str(record[6]))
+            ):
+                yield self.book(number)
+
+    def close(self) -> None:
+        """Закрывает отображение файла в память.
+
+        :return: None
+        """
+        if not self._data.closed:
+            self._data.close()
+        self._file.close()
+
+
+class SnapshotStorage(JsonStorage):
+    random_access = True
+    searchable = True
+
+    def __init__(self, storage_file: str) -> None:
+        """Хранилище каталога в двоичном снимке.
+
+        Как и JSON без журнала, снимок перезаписывается целиком при каждом
+        изменении; блокировка и номер поколения работают так же. Книгу по ID и
+        книги по поисковому запросу можно получить без загрузки всего каталога.
+
+        :param storage_file: Путь к файлу снимка.
+        """
+        super().__init__(storage_file)
+        self._snapshot: Optional[Snapshot] = None
+
+    def _open(self) -> Optional[Snapshot]:
+        """Открывает текущий файл снимка, если он ещё не открыт.
+
+        :return: Снимок или None, если файла нет.
+        """
+        if self._snapshot is None and os.path.exists(self.storage_file):
+            self._snapshot = Snapshot(self.storage_file)
+        return self._snapshot
+
+    def _reopen(self) -> Optional[Snapshot]:
+        """Переоткрывает снимок: файл мог быть заменён другим процессом.
+
+        :return: Снимок или None, если файла нет.
+        """
+        self.close()
+        return self._open()
+
+    def load(self) -> List[Book]:
+        """Загружает все книги из снимка и запоминает номер поколения.
+
+        :return: Список книг.
+        """
+        with self.lock():
+            self.generation = read_generation(self.storage_file)
+            snapshot = self._reopen()
+            return list(snapshot) if snapshot is not None else []
+
+    def iter_books(self) -> Iterator[Book]:
+        """Отдаёт книги из снимка по одной.
+
+        :return: Итератор книг.
+        """
+        with self.lock():
+            self.generation = read_generation(self.storage_file)
+            snapshot = self._reopen()
+        return iter(snapshot) if snapshot is not None else iter(())
+
+    def get_book(self, book_id: str) -> Optional[Book]:
+        """Ищет книгу по ID в снимке.
+
+        :param book_id: Идентификатор книги.
+        :return: Книга или None, если её нет.
+        """
+        snapshot = self._open()
+        return snapshot.lookup(book_id) if snapshot is not None else None
+
+    def find(self, query: str) -> Iterator[Book]:
+        """Ищет книги в снимке, создавая объекты Book только для найденных.
+
+        :param query: Строка для поиска.
+        :return: Итератор найденных книг в порядке каталога.
+        """
+        snapshot = self._open()
+        return snapshot.find(query) if snapshot is not None else iter(())
+
+    def save_all(self, books: Iterable[Book]) -> None:
+        """Атомарно перезаписывает снимок.
+
+        :param books: Все книги каталога.
+        :return: None
+        """
+        with self.lock():
+            self._bump_generation()
+            self.close()
+            write_snapshot(books, self.storage_file)
+
+    def close(self) -> None:
+        """Закрывает открытый снимок.
+
+        :return: None
+        """
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+
+def main() -> None:
+    """Преобразует каталог между JSON и двоичным снимком.
+
+    Запуск: python -m library_manager.snapshot data/books.json data/books.snap
+    """
+    if len(sys.argv) != 3:
+        print(
+            "Использование: python -m library_manager.snapshot "
+            "<исходный файл> <целевой файл>"
+        )
+        sys.exit(1)
+    count = migrate_storage(sys.argv[1], sys.argv[2])
+    print(f"Перенесено книг: {count}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+import sqlite3
+import sys
+from typing import Iterable, Iterator, List, Optional
+
+from library_manager.book import Book, normalize_title_author
+from library_manager.storage import Change, StorageBackend, migrate_storage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    title_norm TEXT,
+    author_norm TEXT
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_books_title_author ON books (title_norm, author_norm);
+CREATE INDEX IF NOT EXISTS idx_books_year ON books (year);
+"""
+
+_COLUMNS = "id, title, author, year, status"
+# Столбцы для записи: к данным книги добавляются название и автор в виде ключа
+# `normalize_title_author`, по которому ищутся дубликаты.
+_WRITE_COLUMNS = f"{_COLUMNS}, title_norm, author_norm"
+_WRITE_VALUES = "?, ?, ?, ?, ?, ?, ?"
+
+# Сколько строк читается одним запросом при построчной загрузке каталога.
+SQLITE_READ_BATCH = 1000
+
+
+def _row_to_book(row: tuple) -> Book:
+    """Создаёт книгу из строки таблицы.
+
+    :param row: Строка таблицы books.
+    :return: Объект Book.
+    """
+    book_id, title, author, year, status = row
+    return Book(title, author, year, status, id=book_id)
+
+
+def _book_to_row(book: Book) -> tuple:
+    """Преобразует книгу в параметры запроса INSERT.
+
+    :param book: Книга.
+    :return: Кортеж значений в порядке столбцов `_WRITE_COLUMNS`.
+    """
+    return (
+        book.id,
+        book.title,
+        book.author,
+        book.year,
+        book.status,
+        *normalize_title_author(book.title, book.author),
+    )
+
+
+class SQLiteStorage(StorageBackend):
+    incremental = True
+    random_access = True
+    indexed = True
+
+    def __init__(self, database: str) -> None:
+        """Хранилище каталога в базе SQLite.
+
+        Каждое изменение выполняется отдельным запросом INSERT, UPDATE или DELETE
+        по первичному ключу, без перезаписи всего каталога. Порядок книг
+        определяется порядком вставки (rowid).
+
+        :param database: Путь к файлу базы данных.
+        """
+        self.database = database
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._add_normalized_columns()
+        self._connection.executescript(_INDEXES)
+        self._data_version = self._read_data_version()
+
+    def _add_normalized_columns(self) -> None:
+        """Добавляет в базу старого формата столбцы ключа названия и автора.
+
+        Прежний индекс по точным названию и автору заменяется индексом по ключу.
+
+        :return: None
+        """
+        columns = {
+            row[1] for row in self._connection.execute("PRAGMA table_info(books)")
+        }
+        if "title_norm" in columns:
+            return
+        with self._connection:
+            self._connection.execute("ALTER TABLE books ADD COLUMN title_norm TEXT")
+            self._connection.execute("ALTER TABLE books ADD COLUMN author_norm TEXT")
+            self._connection.execute("DROP INDEX IF EXISTS idx_books_title_author")
+            rows = self._connection.execute(
+                "SELECT id, title, author FROM books"
+            ).fetchall()
+            self._connection.executemany(
+                "UPDATE books SET title_norm = ?, author_norm = ? WHERE id = ?",
+                (
+                    (*normalize_title_author(title, author), book_id)
+                    for book_id, title, author in rows
+                ),
+            )
+
+    def _read_data_version(self) -> int:
+        """Читает счётчик изменений базы, сделанных другими соединениями.
+
+        :return: Значение PRAGMA data_version.
+        """
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def is_stale(self) -> bool:
+        """Проверяет, изменяли ли базу другие процессы после загрузки.
+
+        :return: True, если загруженные данные устарели.
+        """
+        return self._read_data_version() != self._data_version
+
+    def load(self) -> List[Book]:
+        """Загружает все книги из базы.
+
+        :return: Список книг в порядке добавления.
+        """
+        return list(self.iter_books())
+
+    def iter_books(self) -> Iterator[Book]:
+        """Читает книги из базы порциями по `SQLITE_READ_BATCH` строк.
+
+        Каждая порция читается отдельным запросом до конца, поэтому между
+        обращениями к итератору курсор не держит блокировку чтения и другие
+        соединения могут писать в базу, пока менеджер загружает каталог лениво.
+
+        :return: Итератор книг в порядке добавления.
+        """
+        self._data_version = self._read_data_version()
+        last_rowid = 0
+        while True:
+            rows = self._connection.execute(
+                f"SELECT rowid, {_COLUMNS} FROM books WHERE rowid > ? "
+                "ORDER BY rowid LIMIT ?",
+                (last_rowid, SQLITE_READ_BATCH),
+            ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            for row in rows:
+                yield _row_to_book(row[1:])
+
+    def save_all(self, books: Iterable[Book]) -> None:
+        """Перезаписывает таблицу книг в одной транзакции.
+
+        :param books: Все книги каталога.
+        :return: None
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM books")
+            self._connection.executemany(
+                f"INSERT INTO books ({_WRITE_COLUMNS}) VALUES ({_WRITE_VALUES})",
+                (_book_to_row(book) for book in books),
+            )
+
+    def apply(self, changes: List[Change]) -> None:
+        """Выполняет изменения отдельными запросами в одной транзакции.
+
+        :param changes: Список пар (операция, книга).
+        :return: None
+        """
+        with self._connection:
+            for operation, book in changes:
+                if operation == "add":
+                    self._connection.execute(
+                        f"INSERT OR REPLACE INTO books ({_WRITE_COLUMNS}) "
+                        f"VALUES ({_WRITE_VALUES})",
+                        _book_to_row(book),
+                    )
+                elif operation == "update":
+                    self._connection.execute(
+                        "UPDATE books SET status = ? WHERE id = ?",
+                        (book.status, book.id),
+                    )
+                elif operation == "remove":
+                    self._connection.execute(
+                        "DELETE FROM books WHERE id = ?", (book.id,)
+                    )
+
+    def get_book(self, book_id: str) -> Optional[Book]:
+        """Ищет книгу по ID с использованием первичного ключа.
+
+        :param book_id: Идентификатор книги.
+        :return: Книга или None, если её нет.
+        """
+        row = self._connection.execute(
+            f"SELECT {_COLUMNS} FROM books WHERE id = ?", (book_id,)
+        ).fetchone()
+        return _row_to_book(row) if row else None
+
+    def find_by_title_author(self, title: str, author: str) -> Optional[Book]:
+        """Ищет книгу по индексу ключа названия и автора.
+
+        Регистр и лишние пробелы не учитываются, как в `LibraryManager.has_book`.
+
+        :param title: Название книги.
+        :param author: Автор книги.
+        :return: Книга или None, если её нет.
+        """
+        row = self._connection.execute(
+            f"SELECT {_COLUMNS} FROM books "
+            "WHERE title_norm = ? AND author_norm = ?",
+            normalize_title_author(title, author),
+        ).fetchone()
+        return _row_to_book(row) if row else None
+
+    def find_by_year_range(self, start: int, end: int) -> List[Book]:
+        """Ищет книги, изданные в диапазоне лет включительно.
+
+        :param start: Первый год диапазона.
+        :param end: Последний год диапазона.
+        :return: Список книг, упорядоченный по году и порядку добавления.
+        """
+        cursor = self._connection.execute(
+            f"SELECT {_COLUMNS} FROM books WHERE year BETWEEN ? AND ? "
+            "ORDER BY year, rowid",
+            (start, end),
+        )
+        return [_row_to_book(row) for row in cursor]
+
+    def close(self) -> None:
+        """Закрывает соединение с базой.
+
+        :return: None
+        """
+        self._connection.close()
+
+
+def main() -> None:
+    """Переносит JSON-каталог в SQLite.
+
+    Запуск: python -m library_manager.sqlite_storage data/books.json data/books.db
+    """
+    if len(sys.argv) != 3:
+        print(
+            "Использование: python -m library_manager.sqlite_storage "
+            "<исходный файл> <файл базы>"
+        )
+        sys.exit(1)
+    count = migrate_storage(sys.argv[1], sys.argv[2])
+    print(f"Перенесено книг: {count}.")
+
+
+if __name__ == "__main__":
+    main()
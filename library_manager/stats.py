@@ -0,0 +1,82 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+from library_manager.book import STATUSES, Book
+
+# Сколько авторов с наибольшим количеством книг попадает в отчёт по умолчанию.
+TOP_AUTHORS = 10
+
+
+class CatalogStats:
+    def __init__(self, books: Iterable[Book] = ()) -> None:
+        """Сводные показатели каталога, которые обновляются вместе с ним.
+
+        Количество книг по статусам, по годам издания и по авторам хранится в
+        счётчиках, поэтому добавление, удаление и смена статуса обновляют их за
+        O(1), а отчёт не требует перебора каталога.
+
+        :param books: Книги для начального подсчёта.
+        """
+        self.total = 0
+        self.statuses: Counter = Counter({status: 0 for status in STATUSES})
+        self.years: Counter = Counter()
+        self.authors: Counter = Counter()
+        for book in books:
+            self.add(book)
+
+    def add(self, book: Book) -> None:
+        """Учитывает книгу.
+
+        :param book: Книга.
+        """
+        self.total += 1
+        self.statuses[book.status] += 1
+        self.years[book.year] += 1
+        self.authors[book.author] += 1
+
+    def remove(self, book: Book) -> None:
+        """Исключает книгу из подсчёта.
+
+        :param book: Книга.
+        """
+        self.total -= 1
+        self.statuses[book.status] -= 1
+        for counter, key in ((self.years, book.year), (self.authors, book.author)):
+            counter[key] -= 1
+            if not counter[key]:
+                del counter[key]
+
+    def change_status(self, previous_status: str, new_status: str) -> None:
+        """Учитывает смену статуса книги.
+
+        :param previous_status: Прежний статус.
+        :param new_status: Новый статус.
+        """
+        self.statuses[previous_status] -= 1
+        self.statuses[new_status] += 1
+
+    def decades(self) -> Dict[int, int]:
+        """Количество книг по десятилетиям, собранное из гистограммы лет.
+
+        :return: Словарь {первый год десятилетия: количество} по возрастанию.
+        """
+        decades: Counter = Counter()
+        for year, count in self.years.items():
+            decades[year - year % 10] += count
+        return dict(sorted(decades.items()))
+
+    def report(self, top_authors: Optional[int] = TOP_AUTHORS) -> Dict[str, Any]:
+        """Отчёт по каталогу.
+
+        :param top_authors: Сколько авторов с наибольшим количеством книг
+        включить в отчёт; None — всех.
+        :return: Словарь с ключами total, statuses, years, decades и authors
+        (список пар (автор, количество) по убыванию количества).
+        """
+        return {
+            "total": self.total,
+            "statuses": dict(self.statuses),
+            "years": dict(sorted(self.years.items())),
+            "decades": self.decades(),
+            "authors": self.authors.most_common(top_authors),
+        }
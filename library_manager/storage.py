@@ -1,46 +1,600 @@
 import json
-from typing import List
+import os
+import re
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from library_manager.book import Book
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
+from library_manager.book import STATUS_AVAILABLE, STATUSES, Book
+from library_manager.metrics import metrics, timed
 
+# Размер журнала (в байтах), после превышения которого журнал сворачивается
+# в снимок.
+JOURNAL_COMPACT_THRESHOLD = 1024 * 1024
+
+# Размер блока (в символах), которым читается файл при потоковой загрузке.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+SQLITE_URI_PREFIX = "sqlite:///"
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+SNAPSHOT_EXTENSIONS = (".snap",)
+SHARDS_URI_PREFIX = "shards://"
+# Манифест шардированного хранилища: по нему каталог с шардами и распознаётся.
+SHARD_MANIFEST = "manifest.json"
+
+# Изменение каталога: операция ('add', 'update' или 'remove') и книга.
+Change = Tuple[str, Book]
+
+
+def book_from_record(record: Dict[str, Any]) -> Book:
+    """Создаёт книгу из записи хранилища.
+
+    Файлы, записанные до проверки статусов, могут содержать статус в другом
+    регистре или с пробелами по краям — он приводится к одному из `STATUSES`.
+    Книга с неизвестным статусом загружается со статусом 'в наличии', о чём
+    выводится сообщение.
+
+    :param record: Запись книги с ключами id, title, author, year и status.
+    :return: Объект книги.
+    """
+    status = record.get("status", STATUS_AVAILABLE)
+    if status not in STATUSES:
+        normalized = str(status).strip().lower()
+        if normalized not in STATUSES:
+            print(
+                f"Книга с ID {record.get('id')}: неизвестный статус '{status}' "
+                f"заменён на '{STATUS_AVAILABLE}'."
+            )
+            normalized = STATUS_AVAILABLE
+        record = dict(record, status=normalized)
+    return Book(**record)
+
+
+def get_journal_file(storage_file: str) -> str:
+    """Возвращает путь к журналу изменений, который лежит рядом с файлом данных.
+
+    :param storage_file: Путь к файлу снимка с книгами.
+    :return: Путь к файлу журнала.
+    """
+    return f"{storage_file}.log"
+
+
+def get_lock_file(storage_file: str) -> str:
+    """Возвращает путь к файлу блокировки, в котором хранится номер поколения.
+
+    :param storage_file: Путь к файлу снимка с книгами.
+    :return: Путь к файлу блокировки.
+    """
+    return f"{storage_file}.lock"
+
+
+def read_generation(storage_file: str) -> int:
+    """Читает номер поколения каталога на диске.
+
+    Номер увеличивается при каждой записи, поэтому по нему можно без чтения
+    самого каталога понять, менялся ли он с момента загрузки.
+
+    :param storage_file: Путь к файлу снимка с книгами.
+    :return: Номер поколения; 0, если каталог ещё не записывался.
+    """
+    try:
+        with open(get_lock_file(storage_file), encoding="utf-8") as file:
+            return int(file.read().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+@contextmanager
+def file_lock(storage_file: str) -> Iterator[Optional[IO[str]]]:
+    """Захватывает межпроцессную блокировку каталога на время блока.
+
+    Используется flock на POSIX и msvcrt.locking на Windows; если ни то, ни
+    другое недоступно, блокировка не выполняется. Отсутствующий каталог для
+    файла данных создаётся. Если файл блокировки создать нельзя (например,
+    каталог доступен только для чтения), блок выполняется без блокировки:
+    прочитать каталог это не мешает.
+
+    :param storage_file: Путь к файлу снимка с книгами.
+    :return: Открытый файл блокировки или None, если его не удалось открыть.
+    """
+    lock_file = get_lock_file(storage_file)
+    try:
+        directory = os.path.dirname(lock_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        descriptor = os.open(lock_file, os.O_RDWR | os.O_CREAT)
+    except OSError:
+        descriptor = None
+    if descriptor is None:
+        yield None
+        return
+    with os.fdopen(descriptor, "r+", encoding="utf-8") as file:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield file
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@timed("load_books")
 def load_books(storage_file: str) -> List[Book]:
     """Загружает список книг из файла.
 
     Эта функция открывает указанный файл и пытается загрузить данные книг. Если файл
     не найден или данные повреждены, возвращается пустой список. Если данные успешно
-    загружены, они преобразуются в список объектов `Book`.
+    загружены, они преобразуются в список объектов `Book`. Если рядом с файлом есть
+    журнал изменений, его записи применяются поверх снимка.
 
     :param storage_file: Путь к файлу, из которого необходимо загрузить книги.
     :return: Список объектов Book, загруженных из файла.
     """
     try:
-        with open(storage_file, encoding="utf-8") as file:
-            data = json.load(file)
-            books = [Book(**book_data) for book_data in data]
-            return books
+        books = list(iter_books(storage_file))
     except FileNotFoundError:
         print(f"Файл '{storage_file}' не найден. Создан новый.")
-        return []
+        books = []
     except json.JSONDecodeError:
         print("Ошибка при чтении данных из файла. Возможно, файл поврежден.")
         return []
 
+    journal_file = get_journal_file(storage_file)
+    if os.path.exists(journal_file):
+        books = replay_journal(books, journal_file)
+    return books
+
+
+def iter_books(
+    storage_file: str, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[Book]:
+    """Потоково читает книги из JSON-файла.
+
+    Файл читается блоками, а записи массива разбираются по одной, поэтому в памяти
+    одновременно находятся только текущий блок и очередная запись. Журнал
+    изменений не применяется.
+
+    :param storage_file: Путь к файлу с массивом книг.
+    :param chunk_size: Размер блока чтения в символах.
+    :return: Генератор объектов Book в порядке следования в файле.
+    :raises FileNotFoundError: Если файл не найден.
+    :raises json.JSONDecodeError: Если файл не является массивом записей JSON.
+    """
+    decoder = json.JSONDecoder()
+    with open(storage_file, encoding="utf-8") as file:
+        buffer = ""
+        position = 0
+        in_array = False
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    raise json.JSONDecodeError(
+                        "Unexpected end of file", buffer, position
+                    )
+                if metrics.enabled:
+                    metrics.add_bytes_read(len(chunk.encode("utf-8")))
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            char = buffer[position]
+            if not in_array:
+                if char != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, position)
+                in_array = True
+                position += 1
+            elif char == "]":
+                return
+            elif char == ",":
+                position += 1
+            else:
+                try:
+                    book_data, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        raise
+                    if metrics.enabled:
+                        metrics.add_bytes_read(len(chunk.encode("utf-8")))
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+                yield book_from_record(book_data)
+
+
+def replay_journal(books: Iterable[Book], journal_file: str) -> List[Book]:
+    """Применяет записи журнала изменений к списку книг.
+
+    Повторное применение записей безопасно: добавление книги с уже известным ID
+    заменяет её, удаление отсутствующей книги игнорируется. Оборванная последняя
+    строка (например, после сбоя во время записи) пропускается.
+
+    :param books: Книги из снимка.
+    :param journal_file: Путь к файлу журнала.
+    :return: Список книг после применения журнала.
+    """
+    catalog: Dict[str, Book] = {book.id: book for book in books}
+    with open(journal_file, encoding="utf-8") as file:
+        for line in file:
+            if metrics.enabled:
+                metrics.add_bytes_read(len(line.encode("utf-8")))
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                print("Ошибка при чтении журнала. Повреждённый хвост пропущен.")
+                break
+            if record["op"] == "remove":
+                catalog.pop(record["id"], None)
+            else:
+                book = book_from_record(record["book"])
+                catalog[book.id] = book
+    return list(catalog.values())
+
+
+@timed("append_journal")
+def append_journal(changes: Iterable[Change], storage_file: str) -> int:
+    """Дописывает изменения в журнал одной записью на строку.
 
+    :param changes: Последовательность пар (операция, книга).
+    :param storage_file: Путь к файлу снимка, рядом с которым лежит журнал.
+    :return: Размер журнала в байтах после записи.
+    """
+    lines = []
+    for operation, book in changes:
+        if operation == "remove":
+            record = {"op": operation, "id": book.id}
+        else:
+            record = {"op": operation, "book": book.to_dict()}
+        lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+
+    payload = "".join(lines)
+    if metrics.enabled:
+        metrics.add_bytes_written(len(payload.encode("utf-8")))
+    with open(get_journal_file(storage_file), "a", encoding="utf-8") as file:
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+        return file.tell()
+
+
+def compact_journal(storage_file: str) -> None:
+    """Сворачивает журнал изменений в новый снимок.
+
+    Снимок перечитывается с диска вместе с журналом и атомарно перезаписывается,
+    после чего журнал удаляется. Если процесс прервётся между этими шагами,
+    при следующей загрузке журнал будет повторно применён к новому снимку без
+    потери данных.
+
+    :param storage_file: Путь к файлу снимка.
+    :return: None
+    """
+    journal_file = get_journal_file(storage_file)
+    if not os.path.exists(journal_file):
+        return
+    save_books(load_books(storage_file), storage_file)
+    os.remove(journal_file)
+
+
+@timed("save_books")
 def save_books(books: List[Book], storage_file: str) -> None:
     """Сохраняет список книг в файл.
 
     Эта функция принимает список объектов `Book` и сохраняет
-    их в указанный файл в формате JSON.
+    их в указанный файл в формате JSON. Данные сначала пишутся во временный
+    файл, который затем атомарно подменяет исходный, поэтому сбой во время
+    записи не оставляет файл обрезанным.
 
     :param books: Список объектов Book, которые необходимо сохранить.
     :param storage_file: Путь к файлу, в который необходимо сохранить данные.
     :return: None
     """
-    data = [book.__dict__ for book in books]
+    data = [book.to_dict() for book in books]
+    temp_file = f"{storage_file}.tmp"
     try:
-        with open(storage_file, "w", encoding="utf-8") as file:
+        with open(temp_file, "w", encoding="utf-8") as file:
             json.dump(data, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, storage_file)
+        if metrics.enabled:
+            metrics.add_bytes_written(os.path.getsize(storage_file))
     except Exception as e:
         print(f"Ошибка при сохранении данных в файл: {e}")
         raise
+
+
+class StorageBackend(ABC):
+    """Интерфейс хранилища каталога книг.
+
+    Хранилище загружает каталог целиком и сохраняет его. Хранилища, которые умеют
+    записывать отдельные изменения (`incremental`), получают их через `apply`,
+    остальные при каждом изменении перезаписываются через `save_all`. Хранилища
+    с произвольным доступом (`random_access`) отдают книгу по ID через
+    `get_book`, не загружая каталог, хранилища с поиском (`searchable`) —
+    книги по запросу через `find`, а хранилища с индексами (`indexed`) ищут
+    книгу по названию с автором и книги по диапазону лет.
+    """
+
+    incremental = False
+    random_access = False
+    searchable = False
+    indexed = False
+
+    @abstractmethod
+    def load(self) -> List[Book]:
+        """Загружает все книги из хранилища.
+
+        :return: Список книг в порядке добавления.
+        """
+
+    def iter_books(self) -> Iterator[Book]:
+        """Последовательно отдаёт книги из хранилища для ленивой загрузки.
+
+        :return: Итератор книг в порядке добавления.
+        """
+        return iter(self.load())
+
+    @abstractmethod
+    def save_all(self, books: Iterable[Book]) -> None:
+        """Перезаписывает хранилище переданным каталогом.
+
+        :param books: Все книги каталога.
+        :return: None
+        """
+
+    def apply(self, changes: List[Change]) -> None:
+        """Записывает отдельные изменения каталога.
+
+        :param changes: Список пар (операция, книга).
+        :raises NotImplementedError: Если хранилище не поддерживает запись изменений.
+        """
+        raise NotImplementedError
+
+    def get_book(self, book_id: str) -> Optional[Book]:
+        """Читает из хранилища одну книгу по ID.
+
+        :param book_id: Идентификатор книги.
+        :return: Книга или None, если её нет.
+        :raises NotImplementedError: Если хранилище не поддерживает произвольный доступ.
+        """
+        raise NotImplementedError
+
+    def find(self, query: str) -> Iterator[Book]:
+        """Ищет книги по названию, автору или году так же, как `find_books`.
+
+        :param query: Строка для поиска.
+        :return: Итератор найденных книг в порядке каталога.
+        :raises NotImplementedError: Если хранилище не поддерживает поиск.
+        """
+        raise NotImplementedError
+
+    def find_by_title_author(self, title: str, author: str) -> Optional[Book]:
+        """Ищет книгу по названию и автору без учёта регистра и лишних пробелов.
+
+        :param title: Название книги.
+        :param author: Автор книги.
+        :return: Книга или None, если её нет.
+        :raises NotImplementedError: Если у хранилища нет индексов.
+        """
+        raise NotImplementedError
+
+    def find_by_year_range(self, start: int, end: int) -> List[Book]:
+        """Ищет книги, изданные в диапазоне лет включительно.
+
+        :param start: Первый год диапазона.
+        :param end: Последний год диапазона.
+        :return: Список книг, упорядоченный по году и порядку добавления.
+        :raises NotImplementedError: Если у хранилища нет индексов.
+        """
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Блокирует хранилище от записи другими процессами на время блока.
+
+        :return: None
+        """
+        yield
+
+    def is_stale(self) -> bool:
+        """Проверяет, менялось ли хранилище другими процессами после загрузки.
+
+        :return: True, если загруженные данные устарели.
+        """
+        return False
+
+    def close(self) -> None:
+        """Освобождает ресурсы хранилища.
+
+        :return: None
+        """
+
+
+class JsonStorage(StorageBackend):
+    def __init__(self, storage_file: str, journal: bool = False) -> None:
+        """Хранилище в JSON-файле, при необходимости с журналом изменений.
+
+        :param storage_file: Путь к JSON-файлу.
+        :param journal: Если True, изменения дописываются в журнал рядом с файлом,
+        а не перезаписывают файл целиком.
+        """
+        self.storage_file = storage_file
+        self.journal = journal
+        self.generation = 0
+        self._lock_file: Optional[IO[str]] = None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Захватывает файловую блокировку каталога; повторный захват не блокирует.
+
+        :return: None
+        """
+        if self._lock_file is not None:
+            yield
+            return
+        with file_lock(self.storage_file) as lock_file:
+            self._lock_file = lock_file
+            try:
+                yield
+            finally:
+                self._lock_file = None
+
+    def is_stale(self) -> bool:
+        """Сравнивает номер поколения на диске с номером при загрузке.
+
+        :return: True, если каталог на диске изменил другой процесс.
+        """
+        return read_generation(self.storage_file) != self.generation
+
+    def _bump_generation(self) -> None:
+        """Увеличивает номер поколения в файле блокировки.
+
+        Номер увеличивается до записи данных: если запись прервётся, другие
+        процессы всё равно перечитают каталог, а не перезапишут его устаревшей
+        копией.
+
+        :return: None
+        """
+        lock_file = self._lock_file
+        if lock_file is None:
+            raise PermissionError(
+                f"Нет доступа к файлу блокировки '{get_lock_file(self.storage_file)}'."
+            )
+        lock_file.seek(0)
+        generation = int(lock_file.read().strip() or 0) + 1
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(generation))
+        lock_file.flush()
+        os.fsync(lock_file.fileno())
+        self.generation = generation
+
+    @property
+    def incremental(self) -> bool:
+        """Хранилище записывает отдельные изменения только в режиме журнала.
+
+        :return: True в режиме журнала.
+        """
+        return self.journal
+
+    def load(self) -> List[Book]:
+        """Загружает книги из файла с учётом журнала и запоминает номер поколения.
+
+        :return: Список книг.
+        """
+        with self.lock():
+            self.generation = read_generation(self.storage_file)
+            return load_books(self.storage_file)
+
+    def iter_books(self) -> Iterator[Book]:
+        """Потоково читает файл; при наличии журнала загружает каталог целиком.
+
+        Журнал может менять любую запись снимка, поэтому потоковое чтение возможно
+        только без него.
+
+        :return: Итератор книг.
+        """
+        if not os.path.exists(self.storage_file) or os.path.exists(
+            get_journal_file(self.storage_file)
+        ):
+            return iter(self.load())
+        self.generation = read_generation(self.storage_file)
+        return iter_books(self.storage_file)
+
+    def save_all(self, books: Iterable[Book]) -> None:
+        """Атомарно перезаписывает файл и удаляет ставший ненужным журнал.
+
+        :param books: Все книги каталога.
+        :return: None
+        """
+        with self.lock():
+            self._bump_generation()
+            save_books(list(books), self.storage_file)
+            journal_file = get_journal_file(self.storage_file)
+            if os.path.exists(journal_file):
+                os.remove(journal_file)
+
+    def apply(self, changes: List[Change]) -> None:
+        """Дописывает изменения в журнал и сворачивает его при превышении порога.
+
+        :param changes: Список пар (операция, книга).
+        :return: None
+        """
+        with self.lock():
+            self._bump_generation()
+            if append_journal(changes, self.storage_file) > JOURNAL_COMPACT_THRESHOLD:
+                compact_journal(self.storage_file)
+
+
+def open_storage(storage_file: str, journal: bool = False) -> StorageBackend:
+    """Открывает хранилище, выбирая его тип по адресу или расширению файла.
+
+    Адреса вида `sqlite:///путь` и файлы с расширением .db, .sqlite, .sqlite3
+    открываются в SQLite, файлы .snap — как двоичный снимок, адреса вида
+    `shards://каталог` и каталоги с manifest.json — как шардированное
+    хранилище, остальные пути считаются JSON-файлами.
+
+    :param storage_file: Путь к файлу или адрес хранилища.
+    :param journal: Режим журнала для JSON-хранилища.
+    :return: Объект хранилища.
+    """
+    if storage_file.startswith(SQLITE_URI_PREFIX) or storage_file.endswith(
+        SQLITE_EXTENSIONS
+    ):
+        from library_manager.sqlite_storage import SQLiteStorage
+
+        if storage_file.startswith(SQLITE_URI_PREFIX):
+            storage_file = storage_file[len(SQLITE_URI_PREFIX):]
+        return SQLiteStorage(storage_file)
+    if storage_file.startswith(SHARDS_URI_PREFIX) or os.path.isfile(
+        os.path.join(storage_file, SHARD_MANIFEST)
+    ):
+        from library_manager.sharded_storage import ShardedStorage
+
+        if storage_file.startswith(SHARDS_URI_PREFIX):
+            storage_file = storage_file[len(SHARDS_URI_PREFIX):]
+        return ShardedStorage(storage_file)
+    if storage_file.endswith(SNAPSHOT_EXTENSIONS):
+        from library_manager.snapshot import SnapshotStorage
+
+        return SnapshotStorage(storage_file)
+    return JsonStorage(storage_file, journal=journal)
+
+
+def migrate_storage(source: str, target: str) -> int:
+    """Переносит каталог из одного хранилища в другое.
+
+    Например, `migrate_storage("data/books.json", "data/books.db")` переводит
+    существующий JSON-файл в SQLite.
+
+    :param source: Путь или адрес исходного хранилища.
+    :param target: Путь или адрес целевого хранилища.
+    :return: Количество перенесённых книг.
+    """
+    source_storage = open_storage(source)
+    target_storage = open_storage(target)
+    try:
+        books = source_storage.load()
+        target_storage.save_all(books)
+    finally:
+        source_storage.close()
+        target_storage.close()
+    return len(books)
@@ -1,11 +1,24 @@
+import argparse
+import itertools
 import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from library_manager.book import Book
 from library_manager.manager import (
     LibraryManager,
     get_search_query,
     get_status_input,
+    parse_year_range,
     validate_year,
 )
+from library_manager.metrics import (
+    METRICS_FLUSH_INTERVAL,
+    metrics,
+    profile_session,
+    sink_for_path,
+)
+
+PAGE_SIZE = 20
 
 
 def print_menu() -> None:
@@ -20,22 +33,180 @@ def print_menu() -> None:
     print("3. Поиск книги")
     print("4. Отобразить все книги")
     print("5. Изменить статус книги")
-    print("6. Выйти")
+    print("6. Статистика каталога")
+    print("7. Выйти")
+
+
+def search_results(
+    library_manager: LibraryManager, query: str, page_size: int = PAGE_SIZE
+) -> Iterator[Book]:
+    """Результаты поиска для постраничного вывода.
+
+    Первые две страницы берутся из `find_books`, поэтому повторный запрос
+    отвечается из кэша: `page_books` заглядывает во вторую страницу, чтобы
+    решить, предлагать ли продолжение. Дальнейшие страницы ищутся лениво,
+    только если пользователь до них дойдёт.
+
+    :param library_manager: Менеджер библиотеки.
+    :param query: Строка для поиска.
+    :param page_size: Количество книг на странице.
+    :return: Итератор найденных книг.
+    """
+    cached = 2 * page_size
+    first_pages = library_manager.find_books(query, limit=cached)
+    if len(first_pages) < cached:
+        return iter(first_pages)
+    return itertools.chain(
+        first_pages, library_manager.iter_find_books(query, offset=cached)
+    )
+
+
+def page_books(books: Iterable[Book], page_size: int = PAGE_SIZE) -> int:
+    """Выводит книги постранично.
+
+    Книги берутся из итератора по одной странице, поэтому вывод начинается
+    сразу и не требует построения полного списка. После каждой страницы, если
+    книги ещё остались, пользователь выбирает: продолжить или прекратить вывод.
+
+    :param books: Книги для вывода.
+    :param page_size: Количество книг на странице.
+    :return: Количество выведенных книг.
+    """
+    books = iter(books)
+    shown = 0
+    page = list(itertools.islice(books, page_size))
+    while page:
+        for book in page:
+            print(book)
+        shown += len(page)
+        page = list(itertools.islice(books, page_size))
+        if page:
+            answer = input(
+                f"Показано книг: {shown}. Enter — следующая страница, q — закончить: "
+            )
+            if answer.strip().lower() == "q":
+                break
+    return shown
+
+
+def print_stats(stats: Dict[str, Any]) -> None:
+    """Выводит сводку по каталогу.
+
+    :param stats: Сводка, которую возвращает `LibraryManager.stats()`.
+    """
+    print(f"Всего книг: {stats['total']}")
+    for status, count in stats["statuses"].items():
+        print(f"  {status}: {count}")
+    if stats["decades"]:
+        print("Книг по десятилетиям:")
+        for decade, count in stats["decades"].items():
+            print(f"  {decade}-е: {count}")
+    if stats["authors"]:
+        print("Авторы с наибольшим количеством книг:")
+        for author, count in stats["authors"]:
+            print(f"  {author}: {count}")
+
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Разбирает аргументы командной строки.
 
-def main() -> None:
+    :param argv: Аргументы командной строки; по умолчанию берутся из sys.argv.
+    :return: Разобранные аргументы.
+    """
+    parser = argparse.ArgumentParser(description="Управление библиотекой книг.")
+    parser.add_argument(
+        "--storage", default="data/books.json", help="Файл или адрес хранилища"
+    )
+    parser.add_argument(
+        "--metrics",
+        help="Файл для метрик операций: .prom — формат Prometheus, иначе JSON",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=METRICS_FLUSH_INTERVAL,
+        metavar="СЕКУНДЫ",
+        help="Как часто обновлять файл метрик (0 — только при выходе)",
+    )
+    parser.add_argument(
+        "--profile", choices=["cpu", "memory"], help="Профилирование cProfile/tracemalloc"
+    )
+    parser.add_argument("--profile-output", help="Файл для статистики cProfile")
+    parser.add_argument(
+        "--page-size", type=int, default=PAGE_SIZE, help="Книг на одной странице вывода"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="ФАЙЛ",
+        help="Выполнить команды из файла ('-' — из stdin) без меню",
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        metavar="ПОРТ",
+        help="Запустить HTTP-сервер с JSON API вместо меню",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Адрес, на котором работает сервер"
+    )
+    args = parser.parse_args(argv)
+    if args.page_size < 1:
+        parser.error("--page-size должен быть не меньше 1")
+    if args.metrics_interval < 0:
+        parser.error("--metrics-interval не может быть отрицательным")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Точка входа приложения.
+
+    Включает метрики и профилирование и запускает меню, пакетный режим или
+    HTTP-сервер.
+
+    :param argv: Аргументы командной строки.
+    """
+    args = parse_args(argv)
+    if args.metrics:
+        metrics.enable(sink_for_path(args.metrics))
+        if args.metrics_interval:
+            metrics.start_flushing(args.metrics_interval)
+    failed = 0
+    try:
+        with profile_session(args.profile, args.profile_output):
+            if args.batch:
+                # Пакетный режим нужен только при запуске с --batch.
+                from library_manager.batch import run_batch_file
+
+                failed = run_batch_file(args.storage, args.batch)
+            elif args.serve is not None:
+                from library_manager.server import serve
+
+                serve(args.storage, args.host, args.serve)
+            else:
+                run_menu(LibraryManager(args.storage), args.page_size)
+    finally:
+        if metrics.enabled:
+            metrics.stop_flushing()
+            metrics.flush()
+    if failed:
+        sys.exit(1)
+
+
+def run_menu(library_manager: LibraryManager, page_size: int = PAGE_SIZE) -> None:
     """Главная функция для работы с пользователем через командную строку.
 
     Эта функция выполняет цикл, в котором пользователю предоставляется меню для
     выполнения различных операций с книгами. В зависимости от выбора пользователя,
     вызываются соответствующие методы для добавления, удаления, поиска, отображения
     книг и изменения их статуса.
-    """
-    library_manager = LibraryManager()
 
+    :param library_manager: Менеджер библиотеки.
+    :param page_size: Количество книг на странице при выводе списков.
+    """
     while True:
+        library_manager.reload_if_changed()
         print_menu()
-        choice = input("Выберите действие (1-6): ")
+        choice = input("Выберите действие (1-7): ")
 
         if choice == "1":
             title = input("Введите название книги: ")
@@ -43,15 +214,7 @@ def main() -> None:
             valid_year = validate_year()
             if valid_year is None:
                 continue
-            existing_book = next(
-                (
-                    book
-                    for book in library_manager.books
-                    if book.title == title and book.author == author
-                ),
-                None,
-            )
-            if existing_book:
+            if library_manager.has_book(title, author):
                 print(f"Ошибка: Книга '{title}' авторства '{author}' уже есть в базе.")
             else:
                 library_manager.add_book(title, author, valid_year)
@@ -62,21 +225,29 @@ def main() -> None:
 
         elif choice == "3":
             query = get_search_query()
-            found_books = library_manager.find_books(query)
-            if found_books:
-                for book in found_books:
-                    print(book)
+            year_range = parse_year_range(query)
+            if year_range is not None:
+                found_books = iter(library_manager.find_by_year_range(*year_range))
             else:
-                print("Книги не найдены.")
+                found_books = search_results(library_manager, query, page_size)
+            if not page_books(found_books, page_size):
+                suggestions = []
+                if year_range is None:
+                    suggestions = library_manager.find_books_fuzzy(query, limit=5)
+                if suggestions:
+                    print("Точных совпадений нет. Возможно, вы искали:")
+                    for book in suggestions:
+                        print(book)
+                else:
+                    print("Книги не найдены.")
 
         elif choice == "4":
-            library_manager.display_books()
+            if not page_books(library_manager.iter_books(), page_size):
+                print("Библиотека пуста.")
 
         elif choice == "5":
             book_id = input("Введите ID книги, статус которой хотите изменить: ")
-            book = next(
-                (book for book in library_manager.books if book.id == book_id), None
-            )
+            book = library_manager.get_book(book_id)
 
             if book:
                 print(f"Информация о книге: {book}")
@@ -91,11 +262,14 @@ def main() -> None:
                 print(f"Книга с ID {book_id} не найдена.")
 
         elif choice == "6":
+            print_stats(library_manager.stats())
+
+        elif choice == "7":
             print("Выход из программы...")
             sys.exit()
 
         else:
-            print("Неверный выбор. Пожалуйста, выберите число от 1 до 6.")
+            print("Неверный выбор. Пожалуйста, выберите число от 1 до 7.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from library_manager.async_manager import AsyncLibraryManager
+from library_manager.manager import LibraryManager
+
+
+class TestAsyncLibraryManager(unittest.IsolatedAsyncioTestCase):
+    """Тесты для асинхронной обёртки AsyncLibraryManager."""
+
+    def setUp(self) -> None:
+        """Создаёт временный каталог для файла хранилища.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_file = os.path.join(self.temp_dir.name, "books.json")
+
+    def tearDown(self) -> None:
+        """Удаляет временный каталог.
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+    def count_saves(self, manager: AsyncLibraryManager) -> list:
+        """Подменяет save_all хранилища так, чтобы считать вызовы.
+
+        :param manager: Открытый асинхронный менеджер.
+        :return: Список, в который добавляется запись на каждый вызов.
+        """
+        calls = []
+        storage = manager.manager.storage
+        save_all = storage.save_all
+        storage.save_all = lambda books: calls.append(save_all(books))
+        return calls
+
+    async def test_operations(self) -> None:
+        """Тест операций: результаты совпадают с синхронным менеджером."""
+        async with AsyncLibraryManager(self.storage_file) as manager:
+            book = await manager.add_book("Book One", "Author One", 2000)
+            self.assertIsNotNone(book)
+            self.assertIsNone(await manager.add_book("book one", "author one", 2001))
+            await manager.add_book("Book Two", "Author Two", 2010)
+
+            self.assertTrue(await manager.update_book_status(book.id, "выдана"))
+            self.assertFalse(await manager.update_book_status(book.id, "утеряна"))
+            self.assertEqual((await manager.get_book(book.id)).status, "выдана")
+            self.assertEqual(len(await manager.find_books("Book")), 2)
+            self.assertTrue(await manager.remove_book(book.id))
+            self.assertFalse(await manager.remove_book(book.id))
+
+        reloaded = LibraryManager(self.storage_file)
+        self.assertEqual([book.title for book in reloaded.books], ["Book Two"])
+
+    async def test_periodic_flush_coalesces_writes(self) -> None:
+        """Тест периодической записи: несколько операций сохраняются один раз."""
+        manager = AsyncLibraryManager(self.storage_file, flush_interval=3600)
+        await manager.open()
+        calls = self.count_saves(manager)
+        await manager.add_book("Book One", "Author One", 2000)
+        await manager.add_book("Book Two", "Author Two", 2010)
+        await manager.update_statuses({manager.manager.books[0].id: "выдана"})
+        self.assertEqual(calls, [])
+
+        await manager.close()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(LibraryManager(self.storage_file).books), 2)
+
+    async def test_periodic_flush_runs_in_background(self) -> None:
+        """Тест фоновой записи по таймеру."""
+        async with AsyncLibraryManager(self.storage_file, flush_interval=0.01) as manager:
+            await manager.add_book("Book One", "Author One", 2000)
+            for _ in range(100):
+                if not manager.manager.has_unflushed_changes:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertFalse(manager.manager.has_unflushed_changes)
+            self.assertEqual(len(LibraryManager(self.storage_file).books), 1)
+
+    async def test_always_durability(self) -> None:
+        """Тест режима always: каждая операция сразу записывается на диск."""
+        async with AsyncLibraryManager(self.storage_file, durability="always") as manager:
+            calls = self.count_saves(manager)
+            await manager.add_book("Book One", "Author One", 2000)
+            self.assertEqual(len(calls), 1)
+            self.assertFalse(manager.manager.has_unflushed_changes)
+
+    def test_invalid_durability(self) -> None:
+        """Тест неизвестного режима durability."""
+        with self.assertRaises(ValueError):
+            AsyncLibraryManager(self.storage_file, durability="never")
+
+
+if __name__ == "__main__":
+    unittest.main()
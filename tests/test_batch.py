@@ -0,0 +1,100 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from library_manager.batch import parse_command, run_batch, run_batch_file
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.storage import load_books, save_books
+
+
+class TestBatch(unittest.TestCase):
+    """Тесты для пакетного режима."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем временный каталог с книгами.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_file = os.path.join(self.temp_dir.name, "books.json")
+        self.book = Book("Анна Каренина", "Лев Толстой", 1877)
+        save_books([self.book], self.storage_file)
+
+    def test_parse_command(self) -> None:
+        """Тест на разбор подкоманд, JSON, комментариев и ошибок."""
+        self.assertEqual(
+            parse_command('add "Война и мир" "Лев Толстой" 1869'),
+            {
+                "op": "add",
+                "title": "Война и мир",
+                "author": "Лев Толстой",
+                "year": "1869",
+            },
+        )
+        self.assertEqual(
+            parse_command('{"op": "remove", "id": "42"}'), {"op": "remove", "id": "42"}
+        )
+        self.assertIsNone(parse_command("  # комментарий"))
+        self.assertIsNone(parse_command(""))
+        for line in ["remove", "list", '{"op": "find"', "[1]", 'add "Война']:
+            with self.subTest(line=line), self.assertRaises(ValueError):
+                parse_command(line)
+
+    def test_run_batch(self) -> None:
+        """Тест на выполнение команд с результатами в JSON и одной записью."""
+        manager = LibraryManager(self.storage_file)
+        lines = [
+            'add "Война и мир" "Лев Толстой" 1869',
+            "add Мы 'Евгений Замятин' 1700",
+            f"set-status {self.book.id} выдана",
+            '{"op": "find", "query": "толстой", "limit": 1, "offset": 1}',
+            "remove missing-id",
+            f'{{"op": "get", "id": "{self.book.id}"}}',
+        ]
+        output = io.StringIO()
+        with mock.patch.object(
+            manager.storage, "save_all", wraps=manager.storage.save_all
+        ) as save_all:
+            executed, failed = run_batch(manager, lines, output)
+        self.assertEqual((executed, failed), (6, 2))
+        self.assertEqual(save_all.call_count, 1)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(
+            [result["ok"] for result in results], [True, False, True, True, False, True]
+        )
+        self.assertEqual(results[1]["line"], 2)
+        self.assertIn("1800", results[1]["error"])
+        self.assertEqual(results[3]["books"][0]["title"], "Война и мир")
+        self.assertEqual(results[5]["book"]["status"], "выдана")
+        self.assertEqual(
+            [book.title for book in load_books(self.storage_file)],
+            ["Анна Каренина", "Война и мир"],
+        )
+
+    def test_run_batch_file(self) -> None:
+        """Тест на чтение команд из файла и вывод только результатов в stdout."""
+        commands_file = os.path.join(self.temp_dir.name, "commands.txt")
+        with open(commands_file, "w", encoding="utf-8") as file:
+            file.write(f"remove {self.book.id}\n")
+        stdout = io.StringIO()
+        with mock.patch("sys.stdout", stdout), mock.patch("sys.stderr", io.StringIO()):
+            failed = run_batch_file(self.storage_file, commands_file)
+        self.assertEqual(failed, 0)
+        self.assertEqual(json.loads(stdout.getvalue())["op"], "remove")
+        self.assertEqual(load_books(self.storage_file), [])
+
+    def tearDown(self) -> None:
+        """Удаляет временный каталог.
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
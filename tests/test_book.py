@@ -0,0 +1,76 @@
+import unittest
+
+from library_manager.book import STATUS_ISSUED, Book
+
+
+class TestBook(unittest.TestCase):
+    """Тесты для компактного представления книги."""
+
+    def test_to_dict_round_trip(self) -> None:
+        """Тест на сохранение всех полей книги при преобразовании в словарь.
+
+        :return: None
+        """
+        book = Book("Война и мир", "Лев Толстой", 1869, STATUS_ISSUED)
+        data = book.to_dict()
+        self.assertEqual(list(data), ["id", "title", "author", "year", "status"])
+        self.assertEqual(Book(**data).to_dict(), data)
+
+    def test_invalid_status(self) -> None:
+        """Тест на отказ создавать книгу с недопустимым статусом.
+
+        :return: None
+        """
+        with self.assertRaises(ValueError):
+            Book("Война и мир", "Лев Толстой", 1869, "потеряна")
+
+    def test_authors_are_interned(self) -> None:
+        """Тест на то, что одинаковые имена авторов хранятся одной строкой.
+
+        :return: None
+        """
+        first = Book("Война и мир", "".join(["Лев ", "Толстой"]), 1869)
+        second = Book("Анна Каренина", "".join(["Лев ", "Толстой"]), 1877)
+        self.assertIs(first.author, second.author)
+        self.assertIs(first.author_key, second.author_key)
+
+    def test_search_keys(self) -> None:
+        """Тест на обновление ключей поиска при смене названия и автора.
+
+        :return: None
+        """
+        book = Book("Война и мир", "Лев Толстой", 1869)
+        self.assertEqual(book.title_key, "война и мир")
+        self.assertEqual(book.author_key, "лев толстой")
+        book.title = "Анна Каренина"
+        book.author = "Л. Н. Толстой"
+        self.assertEqual(
+            (book.title_key, book.author_key), ("анна каренина", "л. н. толстой")
+        )
+
+    def test_compact_ids(self) -> None:
+        """Тест на хранение UUID в 16 байтах без изменения строкового ID.
+
+        :return: None
+        """
+        Book.compact_ids = True
+        try:
+            book = Book("Война и мир", "Лев Толстой", 1869)
+            custom = Book("Анна Каренина", "Лев Толстой", 1877, id="book-1")
+        finally:
+            Book.compact_ids = False
+        self.assertEqual(len(book._id), 16)
+        self.assertEqual(len(book.id), 36)
+        self.assertEqual(custom.id, "book-1")
+
+    def test_no_instance_dict(self) -> None:
+        """Тест на отсутствие словаря атрибутов у экземпляра.
+
+        :return: None
+        """
+        with self.assertRaises(AttributeError):
+            Book("Война и мир", "Лев Толстой", 1869).extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from library_manager.cache import QueryCache, estimate_size
+
+
+class TestQueryCache(unittest.TestCase):
+    """Тесты для LRU-кэша результатов поиска."""
+
+    def test_hits_and_misses(self) -> None:
+        """Тест на попадания, промахи и копирование результатов."""
+        cache = QueryCache()
+        self.assertIsNone(cache.get("толстой"))
+        cache.put("толстой", [1, 2], cache.generation)
+        found = cache.get("толстой")
+        self.assertEqual(found, [1, 2])
+        found.append(3)
+        self.assertEqual(cache.get("толстой"), [1, 2])
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Тест на вытеснение давно не использованных записей по количеству."""
+        cache = QueryCache(max_entries=2)
+        cache.put("a", [1], 0)
+        cache.put("b", [2], 0)
+        cache.get("a")
+        cache.put("c", [3], 0)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), [1])
+        self.assertEqual(cache.get("c"), [3])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_byte_limit(self) -> None:
+        """Тест на ограничение суммарного размера записей."""
+        value = list(range(100))
+        size = estimate_size("a", value)
+        cache = QueryCache(max_bytes=size * 2)
+        cache.put("a", value, 0)
+        cache.put("b", value, 0)
+        cache.put("c", value, 0)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.bytes, size * 2)
+        cache.put("big", list(range(1000)), 0)
+        self.assertIsNone(cache.get("big"))
+
+    def test_invalidate(self) -> None:
+        """Тест на то, что результат прежнего поколения в кэш не попадает."""
+        cache = QueryCache()
+        generation = cache.generation
+        cache.put("a", [1], generation)
+        cache.invalidate()
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", [1], generation)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
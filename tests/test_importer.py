@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+from library_manager.importer import import_file
+from library_manager.manager import LibraryManager
+
+
+class TestImporter(unittest.TestCase):
+    """Тесты для массового импорта книг."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем временный каталог и менеджер.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_file = os.path.join(self.temp_dir.name, "books.json")
+        self.manager = LibraryManager(self.storage_file)
+
+    def write(self, name: str, content: str) -> str:
+        """Создает файл импорта во временном каталоге.
+
+        :param name: Имя файла.
+        :param content: Содержимое файла.
+        :return: Путь к файлу.
+        """
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_add_books_rejects_invalid_and_duplicates(self) -> None:
+        """Тест на отклонение некорректных записей и дубликатов за один проход.
+
+        :return: None
+        """
+        self.manager.add_book("Война и мир", "Лев Толстой", 1869)
+        result = self.manager.add_books(
+            [
+                {"title": "Анна Каренина", "author": "Лев Толстой", "year": 1877},
+                {"title": "Война и мир", "author": "Лев Толстой", "year": 1869},
+                {"title": "Анна Каренина", "author": "лев толстой", "year": "1877"},
+                {"title": "Будущее", "author": "Автор", "year": 2100},
+                {"title": "", "author": "Автор", "year": 2000},
+                {"title": "Книга", "author": "Автор", "year": "год"},
+                "не запись",
+            ]
+        )
+        self.assertEqual(result.added, 1)
+        self.assertEqual([number for number, _ in result.rejected], [2, 3, 4, 5, 6, 7])
+        self.assertEqual(len(LibraryManager(self.storage_file).books), 2)
+
+    def test_add_books_saves_once(self) -> None:
+        """Тест на однократную запись в хранилище при массовом добавлении.
+
+        :return: None
+        """
+        calls = []
+        self.manager.storage.save_all = lambda books: calls.append(list(books))
+        self.manager.add_books(
+            {"title": f"Книга {i}", "author": "Автор", "year": 2000} for i in range(50)
+        )
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(calls[0]), 50)
+
+    def test_import_csv(self) -> None:
+        """Тест на импорт из CSV.
+
+        :return: None
+        """
+        path = self.write(
+            "books.csv",
+            "title,author,year\n"
+            "Война и мир,Лев Толстой,1869\n"
+            "Анна Каренина,Лев Толстой,1700\n",
+        )
+        result = import_file(self.manager, path)
+        self.assertEqual(result.added, 1)
+        self.assertEqual(result.rejected[0][0], 2)
+
+    def test_import_csv_with_bom(self) -> None:
+        """Тест на импорт CSV, сохранённого в UTF-8 с BOM.
+
+        :return: None
+        """
+        path = self.write(
+            "books.csv", "\ufefftitle,author,year\nМы,Евгений Замятин,1920\n"
+        )
+        result = import_file(self.manager, path)
+        self.assertEqual(result.added, 1)
+        self.assertEqual(result.rejected, [])
+
+    def test_import_jsonl(self) -> None:
+        """Тест на импорт из JSONL с повреждённой строкой.
+
+        :return: None
+        """
+        path = self.write(
+            "books.jsonl",
+            '{"title": "Война и мир", "author": "Лев Толстой", "year": 1869}\n'
+            '{"title": "Анна\n'
+            "\n"
+            '{"title": "Мы", "author": "Евгений Замятин", "year": 1920}\n',
+        )
+        result = import_file(self.manager, path)
+        self.assertEqual(result.added, 2)
+        self.assertEqual([number for number, _ in result.rejected], [2])
+        self.assertGreater(result.records_per_second, 0)
+
+    def tearDown(self) -> None:
+        """Очистка после тестов (удаление временного каталога).
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
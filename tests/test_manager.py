@@ -1,8 +1,11 @@
+import os
+import tempfile
 from typing import List  
 import unittest
 
 from library_manager.book import Book
 from library_manager.manager import LibraryManager
+from library_manager.storage import get_journal_file, save_books
 
 
 class TestLibraryManager(unittest.TestCase):
@@ -33,6 +36,18 @@ class TestLibraryManager(unittest.TestCase):
         )
         self.assertEqual(len(self.library_manager.books), 2)
 
+    def test_has_book(self) -> None:
+        """Тест проверки наличия книги по названию и автору."""
+        self.assertTrue(self.library_manager.has_book("Book One", "Author One"))
+        self.assertTrue(self.library_manager.has_book(" book  one", "AUTHOR ONE"))
+        self.assertFalse(self.library_manager.has_book("Book One", "Author Two"))
+
+        self.library_manager.add_book("book one ", "author one", 2001)
+        self.assertEqual(len(self.library_manager.books), 2)
+
+        self.library_manager.remove_book(self.book1.id)
+        self.assertFalse(self.library_manager.has_book("Book One", "Author One"))
+
     def test_update_book_status(self) -> None:
         """Тест изменения статуса книги."""
         self.library_manager.update_book_status(self.book1.id, "выдана")
@@ -43,6 +58,21 @@ class TestLibraryManager(unittest.TestCase):
         self.library_manager.update_book_status(self.book1.id, "в наличии")
         self.assertEqual(self.book1.status, "в наличии")
 
+    def test_get_book(self) -> None:
+        """Тест поиска книги по ID."""
+        self.assertIs(self.library_manager.get_book(self.book2.id), self.book2)
+        self.assertIsNone(self.library_manager.get_book("missing-id"))
+
+    def test_remove_book_keeps_order(self) -> None:
+        """Тест удаления книги: порядок остальных книг не меняется."""
+        self.library_manager.add_book("Book Three", "Author Three", 2020)
+        self.library_manager.remove_book(self.book2.id)
+        self.assertIsNone(self.library_manager.get_book(self.book2.id))
+        self.assertEqual(
+            [book.title for book in self.library_manager.books],
+            ["Book One", "Book Three"],
+        )
+
     def test_find_books(self) -> None:
         """Тест поиска книги по запросу."""
         found_books = self.library_manager.find_books("Book One")
@@ -54,6 +84,41 @@ class TestLibraryManager(unittest.TestCase):
         found_books = self.library_manager.find_books("Nonexistent Book")
         self.assertEqual(len(found_books), 0)
 
+    def test_query_cache(self) -> None:
+        """Тест кэша результатов поиска и его сброса при изменениях каталога."""
+        cache = self.library_manager.query_cache
+        self.assertEqual(len(self.library_manager.find_books("Author")), 2)
+        self.assertEqual(len(self.library_manager.find_books("Author")), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        new_book = self.library_manager.add_book("Book Three", "Author Three", 2020)
+        self.assertEqual(len(self.library_manager.find_books("Author")), 3)
+        self.library_manager.update_book_status(new_book.id, "выдана")
+        self.assertEqual(self.library_manager.find_books("Three")[0].status, "выдана")
+        self.library_manager.remove_book(new_book.id)
+        self.assertEqual(len(self.library_manager.find_books("Author")), 2)
+        self.assertEqual(cache.hits, 1)
+
+        uncached = LibraryManager(self.library_manager.storage_file, query_cache=False)
+        self.assertIsNone(uncached.query_cache)
+        self.assertEqual(len(uncached.find_books("Author")), 2)
+
+    def test_pagination(self) -> None:
+        """Тест постраничного перебора каталога и результатов поиска."""
+        self.library_manager.books = [
+            Book(f"Book {number}", "Author", 2000 + number) for number in range(5)
+        ]
+        titles = [book.title for book in self.library_manager.iter_books(2, 1)]
+        self.assertEqual(titles, ["Book 1", "Book 2"])
+        found = self.library_manager.find_books("book", limit=2, offset=3)
+        self.assertEqual([book.title for book in found], ["Book 3", "Book 4"])
+        self.assertEqual(list(self.library_manager.iter_find_books("Bo", offset=5)), [])
+        self.assertEqual(self.library_manager.count_books(), 5)
+        self.assertEqual(self.library_manager.count_books("200"), 5)
+        self.assertEqual(self.library_manager.count_books("Book 3"), 1)
+        with self.assertRaises(ValueError):
+            self.library_manager.iter_books(limit=-1)
+
     def test_invalid_year(self) -> None:
         """Тест на валидацию года (должен быть числом в диапазоне от 1800 до 2030)."""
         valid_year: int = 1999
@@ -66,6 +131,142 @@ class TestLibraryManager(unittest.TestCase):
         invalid_status: str = "not_a_valid_status"
         self.assertNotIn(invalid_status, ["в наличии", "выдана"])
 
+    def test_journal_mode(self) -> None:
+        """Тест режима журнала: изменения переживают перезапуск менеджера."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "books.json")
+            manager = LibraryManager(storage_file, journal=True)
+            manager.add_book("Book One", "Author One", 2000)
+            manager.add_book("Book Two", "Author Two", 2010)
+            manager.update_book_status(manager.books[1].id, "выдана")
+            manager.remove_book(manager.books[0].id)
+            self.assertFalse(os.path.exists(storage_file))
+            self.assertTrue(os.path.exists(get_journal_file(storage_file)))
+
+            reloaded = LibraryManager(storage_file, journal=True)
+            self.assertEqual(len(reloaded.books), 1)
+            self.assertEqual(reloaded.books[0].status, "выдана")
+
+            reloaded.compact()
+            self.assertTrue(os.path.exists(storage_file))
+            self.assertFalse(os.path.exists(get_journal_file(storage_file)))
+            self.assertEqual(len(LibraryManager(storage_file).books), 1)
+
+    def test_lazy_loading(self) -> None:
+        """Тест ленивой загрузки: поиск по ID не дочитывает весь файл."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "books.json")
+            save_books([self.book1, self.book2], storage_file)
+            manager = LibraryManager(storage_file, lazy=True)
+            self.assertFalse(manager.is_loaded)
+
+            self.assertEqual(manager.get_book(self.book1.id).title, "Book One")
+            self.assertFalse(manager.is_loaded)
+
+            first_page = [book.title for book in manager.iter_books(limit=1)]
+            self.assertEqual(first_page, ["Book One"])
+            self.assertFalse(manager.is_loaded)
+            self.assertEqual(len(list(manager.iter_books())), 2)
+            self.assertEqual(len(manager.find_books("Book")), 2)
+            self.assertTrue(manager.is_loaded)
+            self.assertIsNone(manager.get_book("missing-id"))
+
+    def test_batch_writes_once(self) -> None:
+        """Тест блока изменений: хранилище записывается один раз при выходе."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = LibraryManager(os.path.join(temp_dir, "books.json"))
+            calls = []
+            manager.storage.save_all = lambda books: calls.append(list(books))
+            with manager.batch():
+                manager.add_book("Book One", "Author One", 2000)
+                manager.add_book("Book Two", "Author Two", 2010)
+                manager.update_book_status(manager.books[0].id, "выдана")
+                self.assertEqual(calls, [])
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(len(calls[0]), 2)
+
+    def test_batch_rollback(self) -> None:
+        """Тест отката блока изменений при исключении."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = LibraryManager(os.path.join(temp_dir, "books.json"))
+            manager.books = [self.book1, self.book2]
+            calls = []
+            manager.storage.save_all = lambda books: calls.append(list(books))
+            with self.assertRaises(RuntimeError):
+                with manager.batch():
+                    manager.update_book_status(self.book1.id, "выдана")
+                    manager.remove_book(self.book2.id)
+                    manager.add_book("Book Three", "Author Three", 2020)
+                    raise RuntimeError("сбой")
+            self.assertEqual(calls, [])
+            self.assertEqual(manager.books, [self.book1, self.book2])
+            self.assertEqual(self.book1.status, "в наличии")
+            self.assertFalse(manager.has_book("Book Three", "Author Three"))
+
+    def test_update_statuses(self) -> None:
+        """Тест массового изменения статусов."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = LibraryManager(os.path.join(temp_dir, "books.json"))
+            manager.books = [self.book1, self.book2]
+            updated = manager.update_statuses(
+                {self.book1.id: "выдана", self.book2.id: "в наличии"}
+            )
+            self.assertEqual(updated, 1)
+            self.assertEqual(self.book1.status, "выдана")
+
+            with self.assertRaises(KeyError):
+                manager.update_statuses(
+                    {self.book2.id: "выдана", "missing-id": "выдана"}
+                )
+            self.assertEqual(self.book2.status, "в наличии")
+
+    def test_write_behind(self) -> None:
+        """Тест отложенной записи: изменения сохраняются одним вызовом flush."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "books.json")
+            manager = LibraryManager(storage_file, write_behind=True)
+            calls = []
+            save_all = manager.storage.save_all
+            manager.storage.save_all = lambda books: calls.append(save_all(books))
+            book = manager.add_book("Book One", "Author One", 2000)
+            manager.update_book_status(book.id, "выдана")
+            self.assertTrue(manager.has_unflushed_changes)
+            self.assertEqual(calls, [])
+
+            manager.flush()
+            self.assertEqual(len(calls), 1)
+            self.assertFalse(manager.has_unflushed_changes)
+            reloaded = LibraryManager(storage_file)
+            self.assertEqual(reloaded.get_book(book.id).status, "выдана")
+
+    def test_concurrent_writers_merge(self) -> None:
+        """Тест слияния изменений двух менеджеров, работающих с одним файлом."""
+        for journal in (False, True):
+            with self.subTest(journal=journal), tempfile.TemporaryDirectory() as temp_dir:
+                storage_file = os.path.join(temp_dir, "books.json")
+                first = LibraryManager(storage_file, journal=journal)
+                second = LibraryManager(storage_file, journal=journal)
+
+                first.add_book("Book One", "Author One", 2000)
+                second.add_book("Book Two", "Author Two", 2010)
+                self.assertEqual(len(second.books), 2)
+
+                self.assertTrue(first.reload_if_changed())
+                self.assertFalse(first.reload_if_changed())
+                book_one = first.books[0]
+                first.remove_book(book_one.id)
+                second.update_book_status(book_one.id, "выдана")
+                second.add_book("Book One", "Author One", 2001)
+
+                reloaded = LibraryManager(storage_file, journal=journal)
+                self.assertEqual(
+                    sorted(book.title for book in reloaded.books),
+                    ["Book One", "Book Two"],
+                )
+                self.assertEqual(
+                    [book.status for book in reloaded.books], ["в наличии"] * 2
+                )
+
     def tearDown(self) -> None:
         """Очистка после каждого теста (необязательно)."""
         del self.library_manager
@@ -1,7 +1,13 @@
 import unittest
 from unittest.mock import patch
 
-from library_manager.manager import get_search_query, get_status_input, validate_year
+from library_manager.manager import (
+    get_search_query,
+    get_status_input,
+    parse_book_record,
+    parse_year_range,
+    validate_year,
+)
 
 
 class TestManagerFunctions(unittest.TestCase):
@@ -50,6 +56,30 @@ class TestManagerFunctions(unittest.TestCase):
         status: str = get_status_input()
         self.assertEqual(status, "выдана")
 
+    def test_parse_year_range(self) -> None:
+        """Тест на распознавание диапазона лет в поисковом запросе.
+
+        :return: None
+        """
+        self.assertEqual(parse_year_range("1860-1880"), (1860, 1880))
+        self.assertEqual(parse_year_range(" 1860 – 1880 "), (1860, 1880))
+        self.assertIsNone(parse_year_range("1860"))
+        self.assertIsNone(parse_year_range("Толстой 1860-1880"))
+
+    def test_parse_book_record_year(self) -> None:
+        """Тест на проверку года в записи для импорта.
+
+        :return: None
+        """
+        record = {"title": "Мы", "author": "Евгений Замятин"}
+        for year in (1920, "1920", 1920.0):
+            with self.subTest(year=year):
+                self.assertEqual(parse_book_record(dict(record, year=year))[2], 1920)
+        for year in (1999.7, True, "1999.7", None, float("inf")):
+            with self.subTest(year=year):
+                with self.assertRaises(ValueError):
+                    parse_book_record(dict(record, year=year))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from library_manager.book import Book
+from library_manager.metrics import (
+    InMemorySink,
+    JsonFileSink,
+    PrometheusFileSink,
+    metrics,
+    timed,
+)
+from library_manager.storage import load_books, save_books
+
+
+class TestMetrics(unittest.TestCase):
+    """Тесты для сбора метрик операций."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, обнуляем реестр метрик.
+
+        :return: None
+        """
+        metrics.reset()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def test_disabled_by_default(self) -> None:
+        """Тест на отсутствие учета вызовов, пока метрики выключены.
+
+        :return: None
+        """
+        timed("noop")(lambda: None)()
+        self.assertEqual(metrics.snapshot()["calls"], {})
+
+    def test_storage_operations_and_bytes(self) -> None:
+        """Тест на учет вызовов хранилища и объема ввода-вывода.
+
+        :return: None
+        """
+        sink = InMemorySink()
+        metrics.enable(sink)
+        storage_file = os.path.join(self.temp_dir.name, "books.json")
+        save_books([Book("Война и мир", "Лев Толстой", 1869)], storage_file)
+        load_books(storage_file)
+        metrics.flush()
+
+        snapshot = sink.snapshots[-1]
+        size = os.path.getsize(storage_file)
+        self.assertEqual(snapshot["calls"], {"save_books": 1, "load_books": 1})
+        self.assertEqual(snapshot["bytes_written"], size)
+        self.assertEqual(snapshot["bytes_read"], size)
+        self.assertEqual(snapshot["latency_seconds"]["load_books"]["count"], 1)
+
+    def test_file_sinks(self) -> None:
+        """Тест на выгрузку метрик в JSON и в формат Prometheus.
+
+        :return: None
+        """
+        json_file = os.path.join(self.temp_dir.name, "metrics.json")
+        prom_file = os.path.join(self.temp_dir.name, "metrics.prom")
+        metrics.enable(JsonFileSink(json_file), PrometheusFileSink(prom_file))
+        metrics.observe("find_books", 0.002)
+        metrics.flush()
+
+        with open(json_file, encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["calls"], {"find_books": 1})
+        with open(prom_file, encoding="utf-8") as file:
+            text = file.read()
+        self.assertIn(
+            'library_manager_operation_calls_total{operation="find_books"} 1', text
+        )
+        bucket = 'library_manager_operation_seconds_bucket{operation="find_books"'
+        self.assertIn(f'{bucket},le="0.001"}} 0', text)
+        self.assertIn(f'{bucket},le="0.005"}} 1', text)
+
+    def test_concurrent_updates(self) -> None:
+        """Тест на то, что счётчики не теряют обновления из нескольких потоков.
+
+        :return: None
+        """
+
+        def work() -> None:
+            for _ in range(2000):
+                metrics.observe("find_books", 0.001)
+                metrics.add_bytes_read(1)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["calls"]["find_books"], 16000)
+        self.assertEqual(snapshot["latency_seconds"]["find_books"]["count"], 16000)
+        self.assertEqual(snapshot["bytes_read"], 16000)
+
+    def test_periodic_flush(self) -> None:
+        """Тест на фоновую выгрузку метрик без завершения процесса.
+
+        :return: None
+        """
+        sink = InMemorySink()
+        metrics.enable(sink)
+        try:
+            metrics.start_flushing(0.01)
+            deadline = time.monotonic() + 5
+            while len(sink.snapshots) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            metrics.disable()
+        self.assertGreaterEqual(len(sink.snapshots), 2)
+        count = len(sink.snapshots)
+        time.sleep(0.05)
+        self.assertEqual(len(sink.snapshots), count)
+
+    def tearDown(self) -> None:
+        """Очистка после тестов: выключаем метрики и удаляем временные файлы.
+
+        :return: None
+        """
+        metrics.disable()
+        metrics.reset()
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.parallel import ParallelSearch
+
+
+class TestParallelSearch(unittest.TestCase):
+    """Тесты для параллельного поиска в нескольких процессах."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем временный каталог и книги.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_file = os.path.join(self.temp_dir.name, "books.json")
+        self.books = [
+            Book(f"Книга {number}", f"Автор {number % 7}", 1850 + number)
+            for number in range(50)
+        ]
+        self.books.append(Book("Анна Каренина", "Лев Толстой", 1877))
+        self.plain = LibraryManager(self.storage_file)
+        self.plain.books = self.books
+
+    def test_same_results_as_find_books(self) -> None:
+        """Тест на совпадение результатов и порядка с обычным поиском."""
+        queries = ["книга 1", "АВТОР 3", "187", "1877", "толст", "", "нет такой"]
+        with ParallelSearch(workers=3) as search:
+            search.build(self.books)
+            for query in queries:
+                with self.subTest(query=query):
+                    self.assertEqual(search.find(query), self.plain.find_books(query))
+
+    def test_manager_rebuilds_after_changes(self) -> None:
+        """Тест параллельного поиска через менеджер с изменениями каталога."""
+        with mock.patch("library_manager.parallel.PARALLEL_MIN_BOOKS", 0):
+            manager = LibraryManager(self.storage_file, parallel_search=True)
+            manager.books = self.books
+            self.assertEqual(
+                manager.find_books("Автор 2"), self.plain.find_books("Автор 2")
+            )
+            book = manager.add_book("Книга о Толстом", "Автор 2", 2000)
+            self.assertEqual(manager.find_books("толст", limit=1, offset=1), [book])
+            manager.remove_book(self.books[-1].id)
+            self.assertEqual(manager.find_books("толст"), [book])
+        manager.close()
+
+    def test_manager_updates_partitions_incrementally(self) -> None:
+        """Тест: изменения каталога не раздают его процессам заново."""
+        with mock.patch("library_manager.parallel.PARALLEL_MIN_BOOKS", 0):
+            manager = LibraryManager(self.storage_file, parallel_search=True)
+            manager.books = self.books
+            with mock.patch.object(
+                ParallelSearch, "build", wraps=manager._parallel.build
+            ) as build:
+                manager.find_books("книга")
+                book = manager.add_book("Книга 7 бис", "Автор 7", 2001)
+                manager.remove_book(self.books[7].id)
+                manager.remove_book(self.books[40].id)
+                self.plain.add_book(book.title, book.author, book.year)
+                self.plain.remove_book(self.books[7].id)
+                self.plain.remove_book(self.books[40].id)
+                for query in ["книга 7", "автор 5", "2001", "книга 4"]:
+                    with self.subTest(query=query):
+                        self.assertEqual(
+                            [found.title for found in manager.find_books(query)],
+                            [found.title for found in self.plain.find_books(query)],
+                        )
+                self.assertEqual(build.call_count, 1)
+                manager.books = self.books[:10]
+                manager.find_books("книга")
+                self.assertEqual(build.call_count, 2)
+        manager.close()
+
+    def tearDown(self) -> None:
+        """Удаляет временный каталог.
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
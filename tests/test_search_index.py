@@ -0,0 +1,177 @@
+import os
+import tempfile
+import unittest
+
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.search_index import (
+    AuthorIndex,
+    FuzzyIndex,
+    NgramIndex,
+    YearIndex,
+)
+
+
+class TestNgramIndex(unittest.TestCase):
+    """Тесты для триграммного индекса поиска."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем менеджеры с индексом и без него.
+
+        :return: None
+        """
+        self.books = [
+            Book("Война и мир", "Лев Толстой", 1869),
+            Book("Анна Каренина", "Лев Толстой", 1877),
+            Book("Преступление и наказание", "Фёдор Достоевский", 1866),
+            Book("Ад", "Данте", 1835),
+            Book("Мы", "Евгений Замятин", 1920),
+        ]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        storage_file = os.path.join(self.temp_dir.name, "books.json")
+        self.plain = LibraryManager(storage_file)
+        self.plain.books = self.books
+        self.indexed = LibraryManager(storage_file, search_index=True)
+        self.indexed.books = self.books
+
+    def test_same_results_as_full_scan(self) -> None:
+        """Тест на совпадение результатов поиска с полным перебором.
+
+        :return: None
+        """
+        queries = ["толст", "Лев", "ИЕ", "ад", "мы", "18", "1866", "и м", "нет такой"]
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(
+                    self.indexed.find_books(query), self.plain.find_books(query)
+                )
+
+    def test_candidates_are_narrowed(self) -> None:
+        """Тест на сужение множества кандидатов индексом.
+
+        :return: None
+        """
+        index = NgramIndex(self.books)
+        self.assertEqual(
+            index.candidates("толстой"), [self.books[0].id, self.books[1].id]
+        )
+
+    def test_index_follows_remove(self) -> None:
+        """Тест на обновление индекса при удалении книги.
+
+        :return: None
+        """
+        index = NgramIndex(self.books)
+        index.remove(self.books[0])
+        self.assertEqual(index.candidates("толстой"), [self.books[1].id])
+        self.assertNotIn(self.books[0].id, index.candidates("1869"))
+
+    def test_year_index(self) -> None:
+        """Тест на поиск по индексу лет и его обновление.
+
+        :return: None
+        """
+        index = YearIndex(self.books)
+        self.assertEqual(
+            index.find_range(1860, 1880),
+            [self.books[2].id, self.books[0].id, self.books[1].id],
+        )
+        self.assertEqual(index.find_range(1869, 1869), [self.books[0].id])
+        self.assertEqual(index.find_range(1880, 1860), [])
+
+        book = Book("Бесы", "Фёдор Достоевский", 1869)
+        index.add(book)
+        index.remove(self.books[1])
+        self.assertEqual(index.find_range(1869, 1877), [self.books[0].id, book.id])
+
+    def test_find_by_year(self) -> None:
+        """Тест на точный поиск года и диапазона лет через менеджер.
+
+        :return: None
+        """
+        self.assertEqual(self.plain.find_by_year(1869), [self.books[0]])
+        self.assertEqual(self.plain.find_by_year(18), [])
+        self.assertEqual(
+            self.plain.find_by_year_range(1800, 1870),
+            [self.books[3], self.books[2], self.books[0]],
+        )
+        self.plain.remove_book(self.books[2].id)
+        self.assertEqual(
+            self.plain.find_by_year_range(1800, 1870), [self.books[3], self.books[0]]
+        )
+
+    def test_author_index(self) -> None:
+        """Тест на словарь авторов: регистр, ё/е, пробелы и удаление книг.
+
+        :return: None
+        """
+        index = AuthorIndex(self.books)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(
+            index.find("лев  толстой "), [self.books[0].id, self.books[1].id]
+        )
+        self.assertEqual(index.find("Федор Достоевский"), [self.books[2].id])
+        self.assertEqual(index.canonical_name("ФЕДОР достоевский"), "Фёдор Достоевский")
+        self.assertEqual(index.find("Толстой"), [])
+
+        index.remove(self.books[2])
+        self.assertEqual(index.find("Фёдор Достоевский"), [])
+        self.assertIsNone(index.canonical_name("Фёдор Достоевский"))
+        self.assertEqual(len(index), 3)
+
+    def test_find_by_author(self) -> None:
+        """Тест на поиск всех книг автора через менеджер.
+
+        :return: None
+        """
+        self.assertEqual(
+            self.plain.find_by_author("ЛЕВ ТОЛСТОЙ"), [self.books[0], self.books[1]]
+        )
+        book = self.plain.add_book("Бесы", "Федор Достоевский", 1872)
+        self.assertEqual(
+            self.plain.find_by_author("фёдор достоевский"), [self.books[2], book]
+        )
+        self.plain.remove_book(self.books[0].id)
+        self.assertEqual(self.plain.find_by_author("Лев Толстой"), [self.books[1]])
+        self.assertEqual(self.plain.find_by_author("Пушкин"), [])
+
+    def test_fuzzy_index(self) -> None:
+        """Тест на нечёткий поиск с опечатками, ё/е и ограничением выдачи.
+
+        :return: None
+        """
+        index = FuzzyIndex(self.books)
+        found = [book_id for book_id, _ in index.search("Толстй")]
+        self.assertEqual(found, [self.books[0].id, self.books[1].id])
+        self.assertEqual(
+            index.search("федор достоевскии")[0][0], self.books[2].id
+        )
+        self.assertEqual(len(index.search("Толстой", limit=1)), 1)
+        self.assertEqual(index.search("щщщ"), [])
+        self.assertEqual(index.search(""), [])
+
+        index.remove(self.books[0])
+        found = [book_id for book_id, _ in index.search("Толстй")]
+        self.assertEqual(found, [self.books[1].id])
+
+    def test_find_books_fuzzy(self) -> None:
+        """Тест на нечёткий поиск через менеджер и обновление индекса.
+
+        :return: None
+        """
+        self.assertEqual(self.plain.find_books_fuzzy("Замятн"), [self.books[4]])
+        book = self.plain.add_book("Евгений Онегин", "Александр Пушкин", 1833)
+        self.assertEqual(self.plain.find_books_fuzzy("Пушкн онегн")[0], book)
+        self.plain.remove_book(self.books[4].id)
+        self.assertEqual(self.plain.find_books_fuzzy("Замятн"), [])
+
+    def tearDown(self) -> None:
+        """Очистка после тестов (удаление временного каталога).
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
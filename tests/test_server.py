@@ -0,0 +1,156 @@
+import contextlib
+import http.client
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from typing import Any, Dict, Optional, Tuple
+
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.server import (
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+    LibraryHTTPServer,
+    ReadWriteLock,
+)
+from library_manager.storage import load_books, save_books
+
+
+class TestServer(unittest.TestCase):
+    """Тесты для HTTP-сервера библиотеки."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, запускаем сервер на свободном порту.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_file = os.path.join(self.temp_dir.name, "books.json")
+        self.book = Book("Анна Каренина", "Лев Толстой", 1877)
+        save_books([self.book], self.storage_file)
+        self.manager = LibraryManager(self.storage_file)
+        self.server = LibraryHTTPServer(self.manager, ("127.0.0.1", 0), workers=4)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def request(
+        self, method: str, path: str, body: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Выполняет запрос к серверу.
+
+        :param method: Метод HTTP.
+        :param path: Путь запроса.
+        :param body: Тело запроса.
+        :return: Пара (код ответа, тело ответа).
+        """
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port)
+        try:
+            data = None if body is None else json.dumps(body).encode("utf-8")
+            with contextlib.redirect_stdout(io.StringIO()):
+                connection.request(method, path, body=data)
+                response = connection.getresponse()
+                return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def test_endpoints(self) -> None:
+        """Тест на поиск, чтение, добавление, смену статуса и удаление."""
+        status, payload = self.request("GET", "/books?q=%D1%82%D0%BE%D0%BB%D1%81%D1%82")
+        self.assertEqual(status, 200)
+        self.assertEqual([book["id"] for book in payload["books"]], [self.book.id])
+
+        status, payload = self.request(
+            "POST",
+            "/books",
+            {"title": "Война и мир", "author": "Лев Толстой", "year": 1869},
+        )
+        self.assertEqual(status, 201)
+        added_id = payload["book"]["id"]
+        status, payload = self.request("GET", "/books?q=1869&limit=1")
+        self.assertEqual([book["id"] for book in payload["books"]], [added_id])
+
+        status, payload = self.request(
+            "PUT", f"/books/{added_id}/status", {"status": "выдана"}
+        )
+        self.assertEqual((status, payload["book"]["status"]), (200, "выдана"))
+        status, payload = self.request("DELETE", f"/books/{self.book.id}")
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            [(book.title, book.status) for book in load_books(self.storage_file)],
+            [("Война и мир", "выдана")],
+        )
+
+    def test_errors(self) -> None:
+        """Тест на ответы с ошибками."""
+        self.assertEqual(self.request("GET", "/books/missing")[0], 404)
+        self.assertEqual(self.request("GET", "/authors")[0], 404)
+        self.assertEqual(self.request("POST", "/books", {"title": "Без автора"})[0], 400)
+        status, payload = self.request(
+            "PUT", f"/books/{self.book.id}/status", {"status": "утеряна"}
+        )
+        self.assertEqual(status, 400)
+        self.assertIn("error", payload)
+        self.assertEqual(self.request("GET", "/books?q=xy&limit=-1")[0], 400)
+        self.assertEqual(self.request("GET", "/books?q=x")[0], 400)
+        self.assertEqual(self.request("GET", "/books?limit=many")[0], 400)
+
+    def test_page_size(self) -> None:
+        """Тест на размер страницы поиска по умолчанию и его ограничение."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager.add_books(
+                {"title": f"Книга {number}", "author": "Автор", "year": 2000}
+                for number in range(MAX_PAGE_SIZE + 5)
+            )
+        self.assertEqual(len(self.request("GET", "/books")[1]["books"]), PAGE_SIZE)
+        status, payload = self.request("GET", f"/books?limit={MAX_PAGE_SIZE * 2}")
+        self.assertEqual((status, len(payload["books"])), (200, MAX_PAGE_SIZE))
+
+    def test_unknown_route_keeps_next_request_intact(self) -> None:
+        """Тест на два запроса по одному соединению после неизвестного метода."""
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port)
+        try:
+            connection.request("POST", "/authors", body=b'{"name": "Tolstoy"}')
+            response = connection.getresponse()
+            self.assertEqual(response.status, 404)
+            response.read()
+            connection.request("GET", f"/books/{self.book.id}")
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(json.loads(response.read())["book"]["id"], self.book.id)
+        finally:
+            connection.close()
+
+    def test_read_write_lock(self) -> None:
+        """Тест на то, что писатель ждёт завершения читателей."""
+        lock = ReadWriteLock()
+        events = []
+
+        def write() -> None:
+            with lock.write_locked():
+                events.append("write")
+
+        with lock.read_locked(), lock.read_locked():
+            writer = threading.Thread(target=write)
+            writer.start()
+            writer.join(timeout=0.1)
+            events.append("read")
+        writer.join(timeout=5)
+        self.assertEqual(events, ["read", "write"])
+
+    def tearDown(self) -> None:
+        """Останавливает сервер и удаляет временный каталог.
+
+        :return: None
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.manager.close()
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+import unittest
+
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.sharded_storage import ShardedStorage, shard_for
+from library_manager.storage import load_books, migrate_storage, open_storage, save_books
+
+
+class TestShardedStorage(unittest.TestCase):
+    """Тесты для шардированного хранилища."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем временный каталог и книги.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_dir.name, "books")
+        self.address = f"shards://{self.directory}"
+        self.books = [
+            Book(f"Книга {number}", f"Автор {number % 3}", 1900 + number)
+            for number in range(20)
+        ]
+
+    def read_manifest(self) -> dict:
+        """Читает манифест хранилища.
+
+        :return: Содержимое manifest.json.
+        """
+        manifest_file = os.path.join(self.directory, "manifest.json")
+        with open(manifest_file, encoding="utf-8") as file:
+            return json.load(file)
+
+    def test_open_storage(self) -> None:
+        """Тест на выбор хранилища по адресу и по каталогу с манифестом."""
+        storage = open_storage(self.address)
+        self.assertIsInstance(storage, ShardedStorage)
+        storage.save_all(self.books)
+        self.assertIsInstance(open_storage(self.directory), ShardedStorage)
+
+    def test_round_trip_keeps_order(self) -> None:
+        """Тест на сохранение и параллельную загрузку с исходным порядком."""
+        ShardedStorage(self.directory, shard_count=4).save_all(self.books)
+        manifest = self.read_manifest()
+        self.assertEqual(manifest["shard_count"], 4)
+        self.assertEqual(len(manifest["files"]), 4)
+
+        books = ShardedStorage(self.directory).load()
+        self.assertEqual(
+            [book.to_dict() for book in books], [book.to_dict() for book in self.books]
+        )
+
+    def test_change_rewrites_one_shard(self) -> None:
+        """Тест на то, что изменение книги перезаписывает только её шард."""
+        manager = LibraryManager(self.address)
+        manager.books = self.books
+        manager.compact()
+        before = self.read_manifest()["files"]
+
+        book = self.books[5]
+        manager.update_book_status(book.id, "выдана")
+        after = self.read_manifest()["files"]
+        changed = [index for index in range(len(after)) if before[index] != after[index]]
+        self.assertEqual(changed, [shard_for(book.id, len(after))])
+        shard_files = [
+            name for name in os.listdir(self.directory) if name.startswith("shard-")
+        ]
+        self.assertEqual(sorted(shard_files), sorted(after))
+
+        manager.remove_book(self.books[0].id)
+        added = manager.add_book("Новая книга", "Новый автор", 2020)
+        reloaded = LibraryManager(self.address)
+        self.assertEqual(len(reloaded.books), 20)
+        self.assertEqual(reloaded.books[4].status, "выдана")
+        self.assertEqual(reloaded.books[-1].id, added.id)
+
+    def test_concurrent_writers_merge(self) -> None:
+        """Тест слияния изменений двух менеджеров, работающих с одним каталогом."""
+        first = LibraryManager(self.address)
+        second = LibraryManager(self.address)
+        first.add_book("Book One", "Author One", 2000)
+        second.add_book("Book Two", "Author Two", 2010)
+        self.assertEqual(
+            [book.title for book in LibraryManager(self.address).books],
+            ["Book One", "Book Two"],
+        )
+
+    def test_update_of_removed_book_is_skipped(self) -> None:
+        """Тест на то, что смена статуса не возвращает удалённую другим книгу."""
+        first = ShardedStorage(self.directory, shard_count=4)
+        first.save_all(self.books)
+        second = ShardedStorage(self.directory)
+        book = second.load()[3]
+        first.apply([("remove", book)])
+        # Менеджер перечитывает устаревшее хранилище перед записью изменений.
+        second.load()
+        book.status = "выдана"
+        second.apply([("update", book)])
+        self.assertNotIn(
+            book.id, [stored.id for stored in ShardedStorage(self.directory).load()]
+        )
+
+    def test_migrate(self) -> None:
+        """Тест на перенос каталога из JSON в шарды и обратно."""
+        json_file = os.path.join(self.temp_dir.name, "books.json")
+        back_file = os.path.join(self.temp_dir.name, "back.json")
+        save_books(self.books, json_file)
+        self.assertEqual(migrate_storage(json_file, self.address), 20)
+        self.assertEqual(migrate_storage(self.directory, back_file), 20)
+        self.assertEqual(
+            [book.to_dict() for book in load_books(back_file)],
+            [book.to_dict() for book in self.books],
+        )
+
+    def tearDown(self) -> None:
+        """Удаляет временный каталог.
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
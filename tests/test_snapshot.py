@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.snapshot import Snapshot, SnapshotStorage, write_snapshot
+from library_manager.storage import load_books, migrate_storage, open_storage, save_books
+
+
+class TestSnapshot(unittest.TestCase):
+    """Тесты для двоичного снимка каталога."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем временный каталог и книги.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "books.snap")
+        self.books = [
+            Book("Война и мир", "Лев Толстой", 1869),
+            Book("Анна Каренина", "Лев Толстой", 1877, "выдана"),
+            Book("Преступление и наказание", "Фёдор Достоевский", 1866),
+        ]
+
+    def test_round_trip(self) -> None:
+        """Тест на запись и чтение снимка с сохранением порядка и полей."""
+        self.assertEqual(write_snapshot(self.books, self.path), 3)
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+            self.assertEqual(
+                [book.to_dict() for book in snapshot],
+                [book.to_dict() for book in self.books],
+            )
+
+    def test_lookup_and_find(self) -> None:
+        """Тест на поиск по ID и просмотр названий без загрузки каталога."""
+        write_snapshot(self.books, self.path)
+        with Snapshot(self.path) as snapshot:
+            for book in self.books:
+                self.assertEqual(snapshot.lookup(book.id).to_dict(), book.to_dict())
+            self.assertIsNone(snapshot.lookup("missing-id"))
+            self.assertEqual(
+                [book.title for book in snapshot.find("толстой")],
+                ["Война и мир", "Анна Каренина"],
+            )
+            self.assertEqual(
+                [book.title for book in snapshot.find("186")],
+                ["Война и мир", "Преступление и наказание"],
+            )
+
+    def test_invalid_file(self) -> None:
+        """Тест на открытие файла, который не является снимком."""
+        save_books(self.books, self.path)
+        with self.assertRaises(ValueError):
+            Snapshot(self.path)
+
+    def test_conversion_both_ways(self) -> None:
+        """Тест на преобразование JSON в снимок и обратно."""
+        json_file = os.path.join(self.temp_dir.name, "books.json")
+        back_file = os.path.join(self.temp_dir.name, "back.json")
+        save_books(self.books, json_file)
+        self.assertIsInstance(open_storage(self.path), SnapshotStorage)
+
+        self.assertEqual(migrate_storage(json_file, self.path), 3)
+        self.assertEqual(migrate_storage(self.path, back_file), 3)
+        self.assertEqual(
+            [book.to_dict() for book in load_books(back_file)],
+            [book.to_dict() for book in self.books],
+        )
+
+    def test_manager_lazy_lookup(self) -> None:
+        """Тест менеджера со снимком: книга по ID читается без загрузки каталога."""
+        write_snapshot(self.books, self.path)
+        manager = LibraryManager(self.path, lazy=True)
+        book = manager.get_book(self.books[2].id)
+        self.assertEqual(book.title, "Преступление и наказание")
+        self.assertIs(manager.get_book(self.books[2].id), book)
+        self.assertFalse(manager.is_loaded)
+
+        manager.update_book_status(book.id, "выдана")
+        self.assertIs(manager.books[2], book)
+        manager.remove_book(self.books[0].id)
+        manager.close()
+
+        reloaded = LibraryManager(self.path)
+        self.assertEqual(
+            [(book.title, book.status) for book in reloaded.books],
+            [("Анна Каренина", "выдана"), ("Преступление и наказание", "выдана")],
+        )
+        reloaded.close()
+
+    def test_manager_lazy_find(self) -> None:
+        """Тест поиска менеджером со снимком без загрузки каталога."""
+        write_snapshot(self.books, self.path)
+        manager = LibraryManager(self.path, lazy=True, write_behind=True)
+        fetched = manager.get_book(self.books[1].id)
+        self.assertEqual(
+            [book.title for book in manager.find_books("ТОЛСТОЙ")],
+            ["Война и мир", "Анна Каренина"],
+        )
+        self.assertIs(manager.find_books("каренина")[0], fetched)
+        self.assertTrue(manager.remove_book(self.books[0].id))
+        self.assertEqual(manager.find_books("толстой"), [fetched])
+        self.assertEqual(manager.count_books("186"), 1)
+        self.assertFalse(manager.is_loaded)
+
+        self.assertEqual(
+            [book.title for book in manager.books],
+            ["Анна Каренина", "Преступление и наказание"],
+        )
+        self.assertIs(manager.find_books("толстой")[0], fetched)
+        manager.close()
+
+    def test_manager_lazy_find_after_removing_loaded_book(self) -> None:
+        """Тест поиска после удаления уже загруженной книги до записи на диск."""
+        write_snapshot(self.books, self.path)
+        manager = LibraryManager(self.path, lazy=True, write_behind=True)
+        (first,) = manager.iter_books(limit=1)
+        self.assertTrue(manager.remove_book(first.id))
+        self.assertEqual(
+            [book.title for book in manager.find_books("толстой")], ["Анна Каренина"]
+        )
+        self.assertEqual(manager.count_books("толстой"), 1)
+        self.assertFalse(manager.is_loaded)
+        self.assertEqual(len(manager.books), 2)
+        manager.close()
+
+    def test_manager_lazy_remove_before_load(self) -> None:
+        """Тест удаления книги, прочитанной по ID до окончания загрузки."""
+        write_snapshot(self.books, self.path)
+        manager = LibraryManager(self.path, lazy=True)
+        self.assertTrue(manager.remove_book(self.books[1].id))
+        self.assertIsNone(manager.get_book(self.books[1].id))
+        self.assertEqual(len(manager.books), 2)
+        manager.close()
+        reloaded = LibraryManager(self.path)
+        self.assertEqual(len(reloaded.books), 2)
+        reloaded.close()
+
+    def tearDown(self) -> None:
+        """Удаляет временный каталог.
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
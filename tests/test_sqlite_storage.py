@@ -0,0 +1,230 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.sqlite_storage import SQLiteStorage
+from library_manager.storage import (
+    JsonStorage,
+    migrate_storage,
+    open_storage,
+    save_books,
+)
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """Тесты для хранилища в SQLite."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем временный каталог и книги.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.temp_dir.name, "books.db")
+        self.books = [
+            Book("Война и мир", "Лев Толстой", 1869),
+            Book("Анна Каренина", "Лев Толстой", 1877),
+            Book("Преступление и наказание", "Фёдор Достоевский", 1866),
+        ]
+
+    def test_open_storage_by_extension_and_uri(self) -> None:
+        """Тест на выбор хранилища по расширению файла и адресу.
+
+        :return: None
+        """
+        for address in (self.database, f"sqlite:///{self.database}"):
+            with self.subTest(address=address):
+                storage = open_storage(address)
+                self.assertIsInstance(storage, SQLiteStorage)
+                storage.close()
+        self.assertIsInstance(open_storage("books.json"), JsonStorage)
+
+    def test_indexes(self) -> None:
+        """Тест на наличие индексов по ID, названию с автором и году.
+
+        :return: None
+        """
+        storage = SQLiteStorage(self.database)
+        indexes = storage._connection.execute("PRAGMA index_list(books)").fetchall()
+        storage.close()
+        names = {index[1] for index in indexes}
+        self.assertIn("idx_books_title_author", names)
+        self.assertIn("idx_books_year", names)
+        self.assertTrue(any(name.startswith("sqlite_autoindex") for name in names))
+
+    def test_manager_persists_changes(self) -> None:
+        """Тест на сохранение изменений менеджера в SQLite.
+
+        :return: None
+        """
+        manager = LibraryManager(self.database)
+        manager.add_book("Война и мир", "Лев Толстой", 1869)
+        manager.add_book("Анна Каренина", "Лев Толстой", 1877)
+        first, second = manager.books
+        manager.update_book_status(second.id, "выдана")
+        manager.remove_book(first.id)
+        manager.close()
+
+        reloaded = LibraryManager(self.database)
+        self.assertEqual([book.title for book in reloaded.books], ["Анна Каренина"])
+        self.assertEqual(reloaded.books[0].status, "выдана")
+        reloaded.close()
+
+    def test_write_while_lazy_manager_is_open(self) -> None:
+        """Тест на запись другим соединением во время ленивой загрузки.
+
+        :return: None
+        """
+        storage = SQLiteStorage(self.database)
+        storage.save_all(self.books)
+        storage.close()
+
+        with patch("library_manager.sqlite_storage.SQLITE_READ_BATCH", 2):
+            lazy = LibraryManager(self.database, lazy=True)
+            first = next(lazy.iter_books())
+            writer = LibraryManager(self.database)
+            writer.storage._connection.execute("PRAGMA busy_timeout = 0")
+            self.assertIsNotNone(writer.add_book("Мы", "Евгений Замятин", 1920))
+            self.assertTrue(writer.update_book_status(first.id, "выдана"))
+            self.assertEqual(
+                [book.title for book in lazy.books],
+                [book.title for book in self.books] + ["Мы"],
+            )
+        lazy.close()
+        self.assertTrue(writer.remove_book(first.id))
+        writer.close()
+
+    def test_close_releases_lazy_reader(self) -> None:
+        """Тест на то, что закрытый ленивый менеджер не мешает записи.
+
+        :return: None
+        """
+        storage = SQLiteStorage(self.database)
+        storage.save_all(self.books)
+        storage.close()
+
+        lazy = LibraryManager(self.database, lazy=True)
+        next(lazy.iter_books())
+        lazy.close()
+        self.assertTrue(lazy.is_loaded)
+        writer = LibraryManager(self.database)
+        writer.storage._connection.execute("PRAGMA busy_timeout = 0")
+        self.assertIsNotNone(writer.add_book("Мы", "Евгений Замятин", 1920))
+        writer.close()
+
+    def test_indexed_queries(self) -> None:
+        """Тест на запросы по ID, названию с автором и диапазону лет.
+
+        :return: None
+        """
+        storage = SQLiteStorage(self.database)
+        storage.save_all(self.books)
+        self.assertEqual(storage.get_book(self.books[1].id).title, "Анна Каренина")
+        self.assertIsNone(storage.get_book("missing-id"))
+        self.assertEqual(
+            storage.find_by_title_author("Война и мир", "Лев Толстой").id,
+            self.books[0].id,
+        )
+        self.assertEqual(
+            storage.find_by_title_author(" ВОЙНА  и мир", "лев толстой").id,
+            self.books[0].id,
+        )
+        self.assertEqual(
+            [book.year for book in storage.find_by_year_range(1860, 1870)],
+            [1866, 1869],
+        )
+        storage.close()
+
+    def test_lazy_manager_uses_indexed_queries(self) -> None:
+        """Тест: ленивый менеджер ищет дубликаты и годы по индексам базы.
+
+        :return: None
+        """
+        storage = SQLiteStorage(self.database)
+        storage.save_all(self.books)
+        storage.close()
+        manager = LibraryManager(self.database, lazy=True)
+        self.assertTrue(manager.has_book("анна  каренина", "ЛЕВ ТОЛСТОЙ"))
+        self.assertFalse(manager.has_book("Мы", "Евгений Замятин"))
+        found = manager.find_by_year_range(1860, 1870)
+        self.assertEqual([book.year for book in found], [1866, 1869])
+        manager.update_book_status(found[0].id, "выдана")
+        manager.remove_book(found[1].id)
+        self.assertFalse(manager.has_book("Война и мир", "Лев Толстой"))
+        self.assertEqual(manager.find_by_year_range(1860, 1870), [found[0]])
+        self.assertEqual(found[0].status, "выдана")
+        self.assertFalse(manager.is_loaded)
+        self.assertEqual(
+            [book.title for book in manager.books],
+            ["Анна Каренина", "Преступление и наказание"],
+        )
+        self.assertEqual(manager.find_by_year_range(1860, 1870), [found[0]])
+        manager.close()
+
+    def test_old_database_gets_normalized_columns(self) -> None:
+        """Тест на дополнение базы старого формата ключом названия и автора.
+
+        :return: None
+        """
+        connection = sqlite3.connect(self.database)
+        connection.executescript(
+            """
+            CREATE TABLE books (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                author TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                status TEXT NOT NULL
+            );
+            CREATE INDEX idx_books_title_author ON books (title, author);
+            """
+        )
+        connection.execute(
+            "INSERT INTO books VALUES (?, ?, ?, ?, ?)",
+            (self.books[0].id, "Война и мир", "Лев Толстой", 1869, "в наличии"),
+        )
+        connection.commit()
+        connection.close()
+        storage = SQLiteStorage(self.database)
+        self.assertEqual(
+            storage.find_by_title_author("война и мир", "лев толстой").id,
+            self.books[0].id,
+        )
+        plan = storage._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM books "
+            "WHERE title_norm = ? AND author_norm = ?",
+            ("a", "b"),
+        ).fetchall()
+        storage.close()
+        self.assertIn("idx_books_title_author", str(plan))
+
+    def test_migrate_from_json(self) -> None:
+        """Тест на перенос JSON-каталога в SQLite.
+
+        :return: None
+        """
+        json_file = os.path.join(self.temp_dir.name, "books.json")
+        save_books(self.books, json_file)
+        self.assertEqual(migrate_storage(json_file, self.database), 3)
+
+        storage = SQLiteStorage(self.database)
+        self.assertEqual(
+            [book.to_dict() for book in storage.load()],
+            [book.to_dict() for book in self.books],
+        )
+        storage.close()
+
+    def tearDown(self) -> None:
+        """Очистка после тестов (удаление временного каталога).
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
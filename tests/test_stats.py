@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from library_manager.book import Book
+from library_manager.manager import LibraryManager
+from library_manager.sqlite_storage import SQLiteStorage
+from library_manager.stats import CatalogStats
+
+
+class TestCatalogStats(unittest.TestCase):
+    """Тесты для сводных показателей каталога."""
+
+    def setUp(self) -> None:
+        """Настройка тестов, создаем менеджер с книгами.
+
+        :return: None
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_file = os.path.join(self.temp_dir.name, "books.json")
+        self.books = [
+            Book("Война и мир", "Лев Толстой", 1869),
+            Book("Анна Каренина", "Лев Толстой", 1877, "выдана"),
+            Book("Преступление и наказание", "Фёдор Достоевский", 1866),
+            Book("Мы", "Евгений Замятин", 1920),
+        ]
+        self.manager = LibraryManager(self.storage_file)
+        self.manager.books = self.books
+
+    def recount(self) -> CatalogStats:
+        """Считает показатели заново по текущему каталогу.
+
+        :return: Показатели каталога.
+        """
+        return CatalogStats(self.manager.books)
+
+    def test_report(self) -> None:
+        """Тест на отчёт по статусам, годам, десятилетиям и авторам."""
+        stats = self.manager.stats()
+        self.assertEqual(stats["total"], 4)
+        self.assertEqual(stats["statuses"], {"в наличии": 3, "выдана": 1})
+        self.assertEqual(stats["decades"], {1860: 2, 1870: 1, 1920: 1})
+        self.assertEqual(stats["years"][1869], 1)
+        self.assertEqual(stats["authors"][0], ("Лев Толстой", 2))
+        self.assertEqual(len(self.manager.stats(top_authors=1)["authors"]), 1)
+
+    def test_incremental_updates(self) -> None:
+        """Тест на обновление показателей при изменениях каталога."""
+        self.manager.add_book("Бесы", "Фёдор Достоевский", 1872)
+        self.manager.update_book_status(self.books[0].id, "выдана")
+        self.manager.update_book_status(self.books[0].id, "выдана")
+        self.manager.remove_book(self.books[3].id)
+        with self.assertRaises(KeyError):
+            self.manager.update_statuses(
+                {self.books[2].id: "выдана", "missing": "выдана"}
+            )
+
+        stats = self.manager.stats(top_authors=None)
+        self.assertEqual(stats, self.recount().report(top_authors=None))
+        self.assertEqual(stats["statuses"], {"в наличии": 2, "выдана": 2})
+        self.assertNotIn(1920, stats["years"])
+        self.assertEqual(
+            Counter(dict(stats["authors"])),
+            Counter({"Лев Толстой": 2, "Фёдор Достоевский": 2}),
+        )
+
+    def test_rebuilt_on_load(self) -> None:
+        """Тест на подсчёт показателей при загрузке каталога."""
+        self.manager.compact()
+        reloaded = LibraryManager(self.storage_file, lazy=True)
+        self.assertEqual(reloaded.stats(), self.manager.stats())
+
+    def test_status_change_before_lazy_load(self) -> None:
+        """Тест на смену статуса книги, прочитанной по ID до её загрузки."""
+        database = os.path.join(self.temp_dir.name, "books.db")
+        storage = SQLiteStorage(database)
+        storage.save_all(self.books + [Book("Бесы", "Фёдор Достоевский", 1872)])
+        storage.close()
+
+        lazy = LibraryManager(database, lazy=True)
+        self.assertTrue(lazy.update_book_status(self.books[2].id, "выдана"))
+        self.assertFalse(lazy.is_loaded)
+        self.assertEqual(lazy.stats()["statuses"], {"в наличии": 3, "выдана": 2})
+        self.assertEqual(lazy.stats(), CatalogStats(lazy.books).report())
+        lazy.close()
+
+    def tearDown(self) -> None:
+        """Удаляет временный каталог.
+
+        :return: None
+        """
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
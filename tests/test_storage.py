@@ -1,11 +1,20 @@
 import json
 import os
+import tempfile
 from typing import List 
 import unittest
 from unittest.mock import mock_open, patch
 
 from library_manager.book import Book
-from library_manager.storage import load_books, save_books
+from library_manager.storage import (
+    append_journal,
+    JsonStorage,
+    compact_journal,
+    get_journal_file,
+    iter_books,
+    load_books,
+    save_books,
+)
 
 
 class TestStorage(unittest.TestCase):
@@ -66,14 +75,61 @@ class TestStorage(unittest.TestCase):
             self.assertEqual(books[0].title, "Book One")
             self.assertEqual(books[1].title, "Book Two")
 
+    def test_load_books_legacy_statuses(self) -> None:
+        """Тест на загрузку файла со статусами в другом регистре и неизвестными.
+
+        :return: None
+        """
+        records = [
+            {"id": str(n), "title": f"Book {n}", "author": "A", "year": 2000, "status": s}
+            for n, s in enumerate(["Выдана", " в наличии ", "потеряна"])
+        ]
+        book_data = json.dumps(records, ensure_ascii=False)
+        with patch("builtins.open", mock_open(read_data=book_data)), patch(
+            "builtins.print"
+        ) as mocked_print:
+            books = load_books(self.storage_file)
+        self.assertEqual(
+            [book.status for book in books], ["выдана", "в наличии", "в наличии"]
+        )
+        mocked_print.assert_called_once()
+
+    def test_iter_books_small_chunks(self) -> None:
+        """Тест на потоковое чтение, когда записи разрезаны между блоками.
+
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "books.json")
+            save_books(self.books, storage_file)
+            for chunk_size in (1, 7, 1024):
+                with self.subTest(chunk_size=chunk_size):
+                    books = list(iter_books(storage_file, chunk_size=chunk_size))
+                    self.assertEqual(
+                        [book.id for book in books], [book.id for book in self.books]
+                    )
+
+    def test_iter_books_truncated_file(self) -> None:
+        """Тест на ошибку потокового чтения оборванного файла.
+
+        :return: None
+        """
+        with patch("builtins.open", mock_open(read_data='[{"title": "Book')):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_books(self.storage_file))
+
     def test_save_books(self) -> None:
         """Тест на успешное сохранение книг в файл.
 
         :return: None
         """
-        with patch("builtins.open", mock_open()) as mock_file:
+        with patch("builtins.open", mock_open()) as mock_file, patch(
+            "os.fsync"
+        ), patch("os.replace") as mock_replace:
             save_books(self.books, self.storage_file)
-            mock_file.assert_called_once_with(self.storage_file, "w", encoding="utf-8")
+            temp_file = f"{self.storage_file}.tmp"
+            mock_file.assert_called_once_with(temp_file, "w", encoding="utf-8")
+            mock_replace.assert_called_once_with(temp_file, self.storage_file)
             write_calls = mock_file().write.call_count
             self.assertGreater(
                 write_calls, 0, "Функция write не была вызвана или вызвана 0 раз."
@@ -90,6 +146,71 @@ class TestStorage(unittest.TestCase):
 
             self.assertTrue("File write error" in str(context.exception))
 
+    def test_journal_replay(self) -> None:
+        """Тест на восстановление каталога из снимка и журнала изменений.
+
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "books.json")
+            save_books(self.books, storage_file)
+            new_book = Book("Book Three", "Author Three", 2020)
+            self.books[1].update_status("выдана")
+            append_journal(
+                [
+                    ("add", new_book),
+                    ("remove", self.books[0]),
+                    ("update", self.books[1]),
+                ],
+                storage_file,
+            )
+
+            books = load_books(storage_file)
+            self.assertEqual([book.title for book in books], ["Book Two", "Book Three"])
+            self.assertEqual(books[0].status, "выдана")
+
+    def test_journal_torn_tail_is_ignored(self) -> None:
+        """Тест на пропуск оборванной последней записи журнала.
+
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "books.json")
+            append_journal([("add", self.books[0])], storage_file)
+            with open(get_journal_file(storage_file), "a", encoding="utf-8") as file:
+                file.write('{"op": "add", "bo')
+
+            books = load_books(storage_file)
+            self.assertEqual(len(books), 1)
+            self.assertEqual(books[0].id, self.books[0].id)
+
+    def test_missing_directory(self) -> None:
+        """Тест на файл данных в каталоге, которого ещё нет.
+
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "missing", "books.json")
+            storage = JsonStorage(storage_file)
+            with patch("builtins.print"):
+                self.assertEqual(storage.load(), [])
+            storage.save_all(self.books)
+            self.assertEqual(len(load_books(storage_file)), 2)
+
+    def test_compact_journal(self) -> None:
+        """Тест на сворачивание журнала в снимок.
+
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_file = os.path.join(temp_dir, "books.json")
+            append_journal([("add", book) for book in self.books], storage_file)
+            compact_journal(storage_file)
+
+            self.assertFalse(os.path.exists(get_journal_file(storage_file)))
+            with open(storage_file, encoding="utf-8") as file:
+                self.assertEqual(len(json.load(file)), 2)
+
     def tearDown(self) -> None:
         """Очистка после тестов (удаление тестового файла).
 